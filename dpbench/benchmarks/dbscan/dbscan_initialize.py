@@ -49,6 +49,7 @@ def initialize(n_samples, n_features, centers, seed, types_dict):
         DataSize(n_samples=2**16, n_features=2): Params(eps=0.0695, minpts=4),
         DataSize(n_samples=2**16, n_features=3): Params(eps=0.108, minpts=6),
         DataSize(n_samples=2**16, n_features=10): Params(eps=0.6, minpts=20),
+        DataSize(n_samples=2**20, n_features=3): Params(eps=0.043, minpts=6),
     }
 
     X, *_ = make_blobs(
@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+NOISE = -1
+UNDEFINED = -2
+# Number of leading dimensions used to build the grid. Each point is compared
+# only with points of 3**GRID_DIMS adjacent cells.
+GRID_DIMS = 3
+
+
+@nb.njit()
+def _cell(x, lower, eps, size):
+    # Strict math, so both passes place every point into the same cell.
+    return min(int((x - lower) / eps), size - 1)
+
+
+@nb.njit(parallel=True, fastmath=True)
+def _cell_keys(n, dim, data, eps, grid_dim, lower, shape):
+    keys = np.empty(n, dtype=np.int64)
+    for i in nb.prange(n):
+        key = 0
+        for m in range(grid_dim):
+            cell = _cell(data[i * dim + m], lower[m], eps, shape[m])
+            key = key * shape[m] + cell
+        keys[i] = key
+    return keys
+
+
+@nb.njit(fastmath=True)
+def _cell_range(cell_keys, cell_starts, key):
+    pos = np.searchsorted(cell_keys, key)
+    if pos < cell_keys.shape[0] and cell_keys[pos] == key:
+        return cell_starts[pos], cell_starts[pos + 1]
+    return 0, 0
+
+
+@nb.njit(parallel=True, fastmath=True)
+def _neighborhood(  # noqa: C901: grid traversal needs nested loops
+    n,
+    dim,
+    data,
+    eps,
+    grid_dim,
+    lower,
+    shape,
+    order,
+    cell_keys,
+    cell_starts,
+    offsets,
+    indices,
+    fill,
+):
+    """Counts neighbors of each point or fills CSR indices if fill is set."""
+    eps2 = eps * eps
+    ncells = 3**grid_dim
+    for i in nb.prange(n):
+        count = 0
+        for c in range(ncells):
+            key = 0
+            rest = c
+            inside = True
+            for m in range(grid_dim):
+                cell = _cell(data[i * dim + m], lower[m], eps, shape[m])
+                cell += rest % 3 - 1
+                rest //= 3
+                if cell < 0 or cell >= shape[m]:
+                    inside = False
+                    break
+                key = key * shape[m] + cell
+
+            if not inside:
+                continue
+
+            start, stop = _cell_range(cell_keys, cell_starts, key)
+            for p in range(start, stop):
+                k = order[p]
+                dist = 0.0
+                for m in range(dim):
+                    diff = data[k * dim + m] - data[i * dim + m]
+                    dist += diff * diff
+                if dist <= eps2:
+                    if fill:
+                        indices[offsets[i] + count] = k
+                    count += 1
+
+        if not fill:
+            offsets[i + 1] = count
+
+
+@nb.njit(fastmath=True)
+def _compute_clusters(n, min_pts, assignments, offsets, indices):
+    nclusters = 0
+    # every point is pushed at most once
+    qu = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        if assignments[i] != UNDEFINED:
+            continue
+        if offsets[i + 1] - offsets[i] < min_pts:
+            assignments[i] = NOISE
+            continue
+        nclusters += 1
+        assignments[i] = nclusters - 1
+
+        head = 0
+        tail = 0
+        qu[tail] = i
+        tail += 1
+        while head < tail:
+            cur_point = qu[head]
+            head += 1
+            if offsets[cur_point + 1] - offsets[cur_point] < min_pts:
+                continue
+
+            for j in range(offsets[cur_point], offsets[cur_point + 1]):
+                next_point = indices[j]
+                if assignments[next_point] == NOISE:
+                    assignments[next_point] = nclusters - 1
+                elif assignments[next_point] == UNDEFINED:
+                    assignments[next_point] = nclusters - 1
+                    qu[tail] = next_point
+                    tail += 1
+
+    return nclusters
+
+
+def dbscan(n_samples, n_features, data, eps, min_pts):
+    points = data.reshape(n_samples, n_features)
+    grid_dim = min(n_features, GRID_DIMS)
+
+    lower = points[:, :grid_dim].min(axis=0)
+    upper = points[:, :grid_dim].max(axis=0)
+    shape = ((upper - lower) / eps).astype(np.int64) + 1
+
+    keys = _cell_keys(n_samples, n_features, data, eps, grid_dim, lower, shape)
+    order = np.argsort(keys, kind="stable")
+    cell_keys, cell_starts = np.unique(keys[order], return_index=True)
+    cell_starts = np.append(cell_starts, n_samples)
+
+    # Neighbor lists in CSR form: neighbors of point i are
+    # indices[offsets[i]:offsets[i + 1]].
+    offsets = np.zeros(n_samples + 1, dtype=np.int64)
+    indices = np.empty(0, dtype=np.int64)
+    args = (n_samples, n_features, data, eps, grid_dim, lower, shape, order)
+
+    _neighborhood(*args, cell_keys, cell_starts, offsets, indices, False)
+    np.cumsum(offsets, out=offsets)
+    indices = np.empty(offsets[-1], dtype=np.int64)
+    _neighborhood(*args, cell_keys, cell_starts, offsets, indices, True)
+
+    assignments = np.full(n_samples, UNDEFINED, dtype=np.int64)
+
+    return _compute_clusters(n_samples, min_pts, assignments, offsets, indices)
@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+# This implementation counts pairs of whole KD-tree nodes at once if all of
+# their pairs fall into the same radial bin.
+
+LEAF_SIZE = 32
+# Depth of the median split tree never exceeds 64, so the pair stack of the
+# depth first traversal never exceeds 2 * 64 + 1 entries.
+STACK_SIZE = 256
+
+
+@nb.njit(fastmath=True)
+def _build_tree(points, weights, leaf_size):
+    n, dim = points.shape
+    max_nodes = 4 * (n // leaf_size + 1)
+
+    index = np.arange(n)
+    start = np.empty(max_nodes, dtype=np.int64)
+    stop = np.empty(max_nodes, dtype=np.int64)
+    left = np.full(max_nodes, -1, dtype=np.int64)
+    right = np.full(max_nodes, -1, dtype=np.int64)
+    lower = np.empty((max_nodes, dim), dtype=points.dtype)
+    upper = np.empty((max_nodes, dim), dtype=points.dtype)
+    weight = np.zeros(max_nodes, dtype=np.float64)
+
+    stack = np.empty(max_nodes, dtype=np.int64)
+    stack[0] = 0
+    top = 1
+    start[0] = 0
+    stop[0] = n
+    nnodes = 1
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        s = start[node]
+        e = stop[node]
+
+        for d in range(dim):
+            lower[node, d] = points[index[s], d]
+            upper[node, d] = points[index[s], d]
+        for p in range(s, e):
+            weight[node] += weights[index[p]]
+            for d in range(dim):
+                value = points[index[p], d]
+                lower[node, d] = min(lower[node, d], value)
+                upper[node, d] = max(upper[node, d], value)
+
+        if e - s <= leaf_size:
+            continue
+
+        split_dim = np.argmax(upper[node] - lower[node])
+        values = np.empty(e - s, dtype=points.dtype)
+        for p in range(s, e):
+            values[p - s] = points[index[p], split_dim]
+        index[s:e] = index[s:e][np.argsort(values)]
+        mid = (s + e) // 2
+
+        left[node] = nnodes
+        start[nnodes] = s
+        stop[nnodes] = mid
+        right[node] = nnodes + 1
+        start[nnodes + 1] = mid
+        stop[nnodes + 1] = e
+
+        stack[top] = nnodes
+        stack[top + 1] = nnodes + 1
+        top += 2
+        nnodes += 2
+
+    # store points in tree order, so leaves are contiguous
+    return (
+        points[index],
+        weights[index],
+        start[:nnodes],
+        stop[:nnodes],
+        left[:nnodes],
+        right[:nnodes],
+        lower[:nnodes],
+        upper[:nnodes],
+        weight[:nnodes],
+    )
+
+
+@nb.njit(fastmath=True)
+def _box_distances(lower1, upper1, lower2, upper2):
+    dmin = 0.0
+    dmax = 0.0
+    for d in range(lower1.shape[0]):
+        gap = max(lower2[d] - upper1[d], lower1[d] - upper2[d], 0.0)
+        span = max(upper2[d] - lower1[d], upper1[d] - lower2[d])
+        dmin += gap * gap
+        dmax += span * span
+    return dmin, dmax
+
+
+@nb.njit(fastmath=True)
+def _count_node_pairs(node1, tree1, tree2, rbins, hist):
+    points1, weights1, start1, stop1, left1, right1, lower1, upper1, w1 = tree1
+    points2, weights2, start2, stop2, left2, right2, lower2, upper2, w2 = tree2
+    nbins = rbins.shape[0]
+
+    stack1 = np.empty(STACK_SIZE, dtype=np.int64)
+    stack2 = np.empty(STACK_SIZE, dtype=np.int64)
+    stack1[0] = node1
+    stack2[0] = 0
+    top = 1
+
+    while top > 0:
+        top -= 1
+        a = stack1[top]
+        b = stack2[top]
+
+        dmin, dmax = _box_distances(lower1[a], upper1[a], lower2[b], upper2[b])
+        kmin = np.searchsorted(rbins, dmin)
+        if kmin == nbins:
+            continue
+
+        # every pair of the nodes falls into the same bin
+        if kmin == np.searchsorted(rbins, dmax):
+            hist[kmin] += w1[a] * w2[b]
+            continue
+
+        a_leaf = left1[a] == -1
+        b_leaf = left2[b] == -1
+
+        if a_leaf and b_leaf:
+            for i in range(start1[a], stop1[a]):
+                for j in range(start2[b], stop2[b]):
+                    dx = points1[i, 0] - points2[j, 0]
+                    dy = points1[i, 1] - points2[j, 1]
+                    dz = points1[i, 2] - points2[j, 2]
+                    dsq = dx * dx + dy * dy + dz * dz
+                    if dsq <= rbins[nbins - 1]:
+                        k = np.searchsorted(rbins, dsq)
+                        hist[k] += weights1[i] * weights2[j]
+            continue
+
+        # split the larger node
+        if b_leaf or (
+            not a_leaf and stop1[a] - start1[a] >= stop2[b] - start2[b]
+        ):
+            stack1[top] = left1[a]
+            stack2[top] = b
+            stack1[top + 1] = right1[a]
+            stack2[top + 1] = b
+        else:
+            stack1[top] = a
+            stack2[top] = left2[b]
+            stack1[top + 1] = a
+            stack2[top + 1] = right2[b]
+        top += 2
+
+
+@nb.njit(parallel=True, fastmath=True)
+def _count_pairs(tree1, tree2, rbins, tasks):
+    nbins = rbins.shape[0]
+    hists = np.zeros((tasks.shape[0], nbins + 1), dtype=np.float64)
+
+    for t in nb.prange(tasks.shape[0]):
+        _count_node_pairs(tasks[t], tree1, tree2, rbins, hists[t])
+
+    return hists.sum(axis=0)
+
+
+def _leaves(left):
+    return np.flatnonzero(left == -1)
+
+
+def gpairs(nopt, nbins, x1, y1, z1, w1, x2, y2, z2, w2, rbins, results):
+    tree1 = _build_tree(np.stack((x1, y1, z1), axis=1), w1, LEAF_SIZE)
+    tree2 = _build_tree(np.stack((x2, y2, z2), axis=1), w2, LEAF_SIZE)
+
+    # every leaf of the first tree is traversed against the second tree
+    hist = _count_pairs(tree1, tree2, rbins, _leaves(tree1[4]))
+
+    results[:] = np.cumsum(hist[:nbins])
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+
+# Distance tile of BLOCK_SIZE x BLOCK_SIZE doubles fits into L2/L3 cache.
+BLOCK_SIZE = 512
+
+
+def gpairs(nopt, nbins, x1, y1, z1, w1, x2, y2, z2, w2, rbins, results):
+    # weights of pairs that fall into each bin, last bin is beyond rmax
+    hist = np.zeros(nbins + 1, dtype=np.float64)
+
+    for i in range(0, nopt, BLOCK_SIZE):
+        bx1 = x1[i : i + BLOCK_SIZE, None]
+        by1 = y1[i : i + BLOCK_SIZE, None]
+        bz1 = z1[i : i + BLOCK_SIZE, None]
+        bw1 = w1[i : i + BLOCK_SIZE, None]
+
+        for j in range(0, nopt, BLOCK_SIZE):
+            dsq = (
+                np.square(x2[j : j + BLOCK_SIZE] - bx1)
+                + np.square(y2[j : j + BLOCK_SIZE] - by1)
+                + np.square(z2[j : j + BLOCK_SIZE] - bz1)
+            )
+
+            # first bin k with dsq <= rbins[k]
+            bins = np.searchsorted(rbins, dsq.ravel(), side="left")
+            hist += np.bincount(
+                bins,
+                weights=(bw1 * w2[j : j + BLOCK_SIZE]).ravel(),
+                minlength=nbins + 1,
+            )
+
+    # pairs within rbins[k] are the ones of bins 0..k
+    results[:] = np.cumsum(hist[:nbins])
@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+LEAF_SIZE = 16
+# Depth of the median split tree never exceeds 64, so does the query stack.
+STACK_SIZE = 128
+
+
+@nb.njit(fastmath=True)
+def _build_tree(x_train, leaf_size):
+    n, dim = x_train.shape
+    max_nodes = 4 * (n // leaf_size + 1)
+
+    index = np.arange(n)
+    start = np.empty(max_nodes, dtype=np.int64)
+    stop = np.empty(max_nodes, dtype=np.int64)
+    left = np.full(max_nodes, -1, dtype=np.int64)
+    right = np.full(max_nodes, -1, dtype=np.int64)
+    lower = np.empty((max_nodes, dim), dtype=x_train.dtype)
+    upper = np.empty((max_nodes, dim), dtype=x_train.dtype)
+
+    stack = np.empty(max_nodes, dtype=np.int64)
+    stack[0] = 0
+    top = 1
+    start[0] = 0
+    stop[0] = n
+    nnodes = 1
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        s = start[node]
+        e = stop[node]
+
+        for d in range(dim):
+            lower[node, d] = x_train[index[s], d]
+            upper[node, d] = x_train[index[s], d]
+        for p in range(s + 1, e):
+            for d in range(dim):
+                value = x_train[index[p], d]
+                lower[node, d] = min(lower[node, d], value)
+                upper[node, d] = max(upper[node, d], value)
+
+        if e - s <= leaf_size:
+            continue
+
+        # split by median of the dimension with the largest spread
+        split_dim = np.argmax(upper[node] - lower[node])
+        values = np.empty(e - s, dtype=x_train.dtype)
+        for p in range(s, e):
+            values[p - s] = x_train[index[p], split_dim]
+        index[s:e] = index[s:e][np.argsort(values)]
+        mid = (s + e) // 2
+
+        left[node] = nnodes
+        start[nnodes] = s
+        stop[nnodes] = mid
+        right[node] = nnodes + 1
+        start[nnodes + 1] = mid
+        stop[nnodes + 1] = e
+
+        stack[top] = nnodes
+        stack[top + 1] = nnodes + 1
+        top += 2
+        nnodes += 2
+
+    return index, start, stop, left, right, lower, upper
+
+
+@nb.njit(fastmath=True)
+def _box_distance(x, lower, upper):
+    dist = 0.0
+    for d in range(x.shape[0]):
+        diff = max(lower[d] - x[d], 0.0, x[d] - upper[d])
+        dist += diff * diff
+    return dist
+
+
+@nb.njit(parallel=True, fastmath=True)
+def _query(  # noqa: C901: tree traversal needs nested loops
+    x_train,
+    y_train,
+    x_test,
+    k,
+    classes_num,
+    test_size,
+    predictions,
+    votes_to_classes,
+    data_dim,
+    tree,
+):
+    index, start, stop, left, right, lower, upper = tree
+
+    for i in nb.prange(test_size):
+        x = x_test[i]
+        best_dist = np.full(k, np.inf)
+        best_label = np.zeros(k, dtype=np.int64)
+
+        stack = np.empty(STACK_SIZE, dtype=np.int64)
+        stack_dist = np.empty(STACK_SIZE)
+        stack[0] = 0
+        stack_dist[0] = 0.0
+        top = 1
+
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            if stack_dist[top] >= best_dist[k - 1]:
+                continue
+
+            if left[node] == -1:
+                for p in range(start[node], stop[node]):
+                    j = index[p]
+                    dist = 0.0
+                    for jj in range(data_dim):
+                        diff = x_train[j, jj] - x[jj]
+                        dist += diff * diff
+
+                    if dist < best_dist[k - 1]:
+                        pos = k - 1
+                        while pos > 0 and dist < best_dist[pos - 1]:
+                            best_dist[pos] = best_dist[pos - 1]
+                            best_label[pos] = best_label[pos - 1]
+                            pos -= 1
+                        best_dist[pos] = dist
+                        best_label[pos] = y_train[j]
+                continue
+
+            near = left[node]
+            far = right[node]
+            near_dist = _box_distance(x, lower[near], upper[near])
+            far_dist = _box_distance(x, lower[far], upper[far])
+            if far_dist < near_dist:
+                near, far = far, near
+                near_dist, far_dist = far_dist, near_dist
+
+            # visit nearer child first
+            stack[top] = far
+            stack_dist[top] = far_dist
+            stack[top + 1] = near
+            stack_dist[top + 1] = near_dist
+            top += 2
+
+        v_to_c_i = votes_to_classes[i]
+
+        for j in range(k):
+            v_to_c_i[best_label[j]] += 1
+
+        max_ind = 0
+        max_value = 0
+
+        for j in range(classes_num):
+            if v_to_c_i[j] > max_value:
+                max_value = v_to_c_i[j]
+                max_ind = j
+
+        predictions[i] = max_ind
+
+
+def knn(
+    x_train,
+    y_train,
+    x_test,
+    k,
+    classes_num,
+    train_size,
+    test_size,
+    predictions,
+    votes_to_classes,
+    data_dim,
+):
+    tree = _build_tree(x_train, LEAF_SIZE)
+
+    _query(
+        x_train,
+        y_train,
+        x_test,
+        k,
+        classes_num,
+        test_size,
+        predictions,
+        votes_to_classes,
+        data_dim,
+        tree,
+    )
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+
+# Distance tiles are TEST_TILE x TRAIN_TILE, so they stay in memory even for
+# large train sets.
+TEST_TILE = 1024
+TRAIN_TILE = 8192
+
+
+def _nearest(x, x_train, train_norms, k):
+    """Returns k nearest train indices of every row in x (unordered)."""
+    best_dist = None
+    best_index = None
+
+    for start in range(0, x_train.shape[0], TRAIN_TILE):
+        stop = min(start + TRAIN_TILE, x_train.shape[0])
+
+        # ||a||^2 - 2ab + ||b||^2 without ||a||^2, that does not change the
+        # order of neighbors of a test point.
+        dist = train_norms[start:stop] - 2 * (x @ x_train[start:stop].T)
+        index = np.broadcast_to(np.arange(start, stop), dist.shape)
+
+        if best_dist is not None:
+            dist = np.concatenate((best_dist, dist), axis=1)
+            index = np.concatenate((best_index, index), axis=1)
+
+        if dist.shape[1] > k:
+            part = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            dist = np.take_along_axis(dist, part, axis=1)
+            index = np.take_along_axis(index, part, axis=1)
+
+        best_dist, best_index = dist, index
+
+    return best_index
+
+
+def knn(
+    x_train,
+    y_train,
+    x_test,
+    k,
+    classes_num,
+    train_size,
+    test_size,
+    predictions,
+    votes_to_classes,
+    data_dim,
+):
+    train_norms = np.einsum("ij,ij->i", x_train, x_train)
+
+    for start in range(0, test_size, TEST_TILE):
+        stop = min(start + TEST_TILE, test_size)
+
+        labels = y_train[_nearest(x_test[start:stop], x_train, train_norms, k)]
+
+        votes = votes_to_classes[start:stop]
+        for c in range(classes_num):
+            votes[:, c] += np.count_nonzero(labels == c, axis=1)
+
+        predictions[start:stop] = np.argmax(votes, axis=1)
@@ -4,10 +4,30 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+# Frames stored in files are generated in chunks of this size
+CHUNK_SIZE = 1 << 24
 
-def initialize(N):
+
+def initialize(N, memmap_inputs=False):
     from numpy.random import default_rng
 
     rng = default_rng(42)
-    data, radius = rng.random((N,)), rng.random((N,))
+
+    if not memmap_inputs:
+        data, radius = rng.random((N,)), rng.random((N,))
+        return data, radius
+
+    import tempfile
+
+    import numpy as np
+
+    # Frames larger than memory are backed by temporary files, set TMPDIR to
+    # a disk backed directory.
+    data = np.memmap(tempfile.TemporaryFile(), np.float64, "w+", shape=(N,))
+    radius = np.memmap(tempfile.TemporaryFile(), np.float64, "w+", shape=(N,))
+    for start in range(0, N, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, N)
+        data[start:stop] = rng.random((stop - start,))
+        radius[start:stop] = rng.random((stop - start,))
+
     return data, radius
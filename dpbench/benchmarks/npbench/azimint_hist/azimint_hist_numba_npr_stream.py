@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+
+@nb.jit(nopython=True)
+def _bin_index(r, edges):
+    # Strict math and the same corrections as in np.histogram, so pixels
+    # close to edges get into the same bins as in NumPy.
+    npt = edges.shape[0] - 1
+    first = edges[0]
+    last = edges[npt]
+
+    index = int((r - first) / (last - first) * npt)
+    if index == npt:
+        index -= 1
+    if r < edges[index]:
+        index -= 1
+    elif r >= edges[index + 1] and index != npt - 1:
+        index += 1
+    return index
+
+
+@nb.jit(nopython=True, parallel=True)
+def _histograms(data, radius, edges, nparts):
+    npt = edges.shape[0] - 1
+    n = radius.shape[0]
+    part_size = (n + nparts - 1) // nparts
+    # every thread accumulates its own histograms, they are merged at the end
+    histu = np.zeros((nparts, npt), dtype=np.int64)
+    histw = np.zeros((nparts, npt), dtype=np.float64)
+
+    for p in nb.prange(nparts):
+        for i in range(p * part_size, min((p + 1) * part_size, n)):
+            r = radius[i]
+            if r < edges[0] or r > edges[npt]:
+                continue
+            b = _bin_index(r, edges)
+            histu[p, b] += 1
+            histw[p, b] += data[i]
+
+    return histu.sum(axis=0), histw.sum(axis=0)
+
+
+def azimint_hist(data, radius, npt):
+    r_min = radius.min()
+    r_max = radius.max()
+    if r_min == r_max:
+        r_min, r_max = r_min - 0.5, r_max + 0.5
+    edges = np.linspace(r_min, r_max, npt + 1)
+
+    histu, histw = _histograms(data, radius, edges, nb.get_num_threads())
+    return histw / histu
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+
+# Number of pixels binned at once. Memory footprint does not depend on the
+# size of the frame, so frames may be memory mapped files or streams.
+CHUNK_SIZE = 1 << 20
+
+
+def bin_edges(npt, r_min, r_max):
+    """Returns edges of uniform bins the same way np.histogram does."""
+    if r_min == r_max:
+        r_min, r_max = r_min - 0.5, r_max + 0.5
+    return np.linspace(r_min, r_max, npt + 1)
+
+
+def bin_indices(radius, edges):
+    """Returns bins of the radiuses, values outside of edges are dropped.
+
+    Indices are computed and corrected exactly like in np.histogram, so
+    histograms match the reference bit for bit.
+    """
+    npt = edges.shape[0] - 1
+    first, last = edges[0], edges[-1]
+
+    keep = (radius >= first) & (radius <= last)
+    if not keep.all():
+        radius = radius[keep]
+
+    indices = ((radius - first) / (last - first) * npt).astype(np.intp)
+    indices[indices == npt] -= 1
+    indices[radius < edges[indices]] -= 1
+    indices[(radius >= edges[indices + 1]) & (indices != npt - 1)] += 1
+
+    return indices, keep
+
+
+def histogram_stream(chunks, edges):
+    """Returns pixel counts and intensity sums of every bin.
+
+    Args:
+        chunks: iterable of (data, radius) pairs, e.g. generator of frames.
+        edges: bin edges of the radius.
+    """
+    npt = edges.shape[0] - 1
+    histu = np.zeros(npt, dtype=np.intp)
+    histw = np.zeros(npt, dtype=np.float64)
+
+    for data, radius in chunks:
+        # bins are computed once for both histograms
+        indices, keep = bin_indices(radius, edges)
+        if indices.shape[0] != data.shape[0]:
+            data = data[keep]
+        histu += np.bincount(indices, minlength=npt)
+        histw += np.bincount(indices, weights=data, minlength=npt)
+
+    return histu, histw
+
+
+def _chunks(data, radius):
+    for start in range(0, radius.shape[0], CHUNK_SIZE):
+        stop = start + CHUNK_SIZE
+        yield data[start:stop], radius[start:stop]
+
+
+def _radius_range(radius):
+    # both bounds are found in a single pass over the frame
+    r_min, r_max = np.inf, -np.inf
+    for start in range(0, radius.shape[0], CHUNK_SIZE):
+        chunk = radius[start : start + CHUNK_SIZE]
+        r_min = min(r_min, chunk.min())
+        r_max = max(r_max, chunk.max())
+    return r_min, r_max
+
+
+def azimint_hist(data, radius, npt):
+    edges = bin_edges(npt, *_radius_range(radius))
+    histu, histw = histogram_stream(_chunks(data, radius), edges)
+    return histw / histu
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+POLY = 0x8408
+
+
+def _make_tables(poly, slices=8):
+    """Returns slicing tables for the reflected polynomial.
+
+    tables[k][b] is CRC of byte b followed by k zero bytes, so 8 bytes are
+    processed with 8 independent lookups.
+    """
+    table = np.arange(256, dtype=np.int64)
+    for _ in range(8):
+        table = np.where(table & 1, (table >> 1) ^ poly, table >> 1)
+
+    tables = [table]
+    for _ in range(1, slices):
+        tables.append((tables[-1] >> 8) ^ table[tables[-1] & 0xFF])
+
+    return np.stack(tables).astype(np.int32)
+
+
+TABLES = _make_tables(POLY)
+
+
+# CRC-16-CCITT Algorithm processing 8 bytes per iteration (slicing-by-8)
+@nb.jit(nopython=True, parallel=False, fastmath=True)
+def crc16(data):
+    crc = 0xFFFF
+    n = data.shape[0]
+    tail = n - n % 8
+
+    for i in range(0, tail, 8):
+        x = crc ^ (data[i] | (np.int64(data[i + 1]) << 8))
+        crc = (
+            TABLES[7, x & 0xFF]
+            ^ TABLES[6, x >> 8]
+            ^ TABLES[5, data[i + 2]]
+            ^ TABLES[4, data[i + 3]]
+            ^ TABLES[3, data[i + 4]]
+            ^ TABLES[2, data[i + 5]]
+            ^ TABLES[1, data[i + 6]]
+            ^ TABLES[0, data[i + 7]]
+        )
+
+    for i in range(tail, n):
+        crc = (crc >> 8) ^ TABLES[0, (crc ^ data[i]) & 0xFF]
+
+    crc = ~crc & 0xFFFF
+    crc = (crc << 8) | ((crc >> 8) & 0xFF)
+
+    return crc & 0xFFFF
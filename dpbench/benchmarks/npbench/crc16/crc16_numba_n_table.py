@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+POLY = 0x8408
+
+
+def _make_table(poly):
+    """Returns CRC of every byte value for the reflected polynomial."""
+    table = np.arange(256, dtype=np.int64)
+    for _ in range(8):
+        table = np.where(table & 1, (table >> 1) ^ poly, table >> 1)
+    return table.astype(np.int32)
+
+
+TABLE = _make_table(POLY)
+
+
+# CRC-16-CCITT Algorithm processing one byte per table lookup
+@nb.jit(nopython=True, parallel=False, fastmath=True)
+def crc16(data):
+    crc = 0xFFFF
+    for i in range(data.shape[0]):
+        crc = (crc >> 8) ^ TABLE[(crc ^ data[i]) & 0xFF]
+    crc = ~crc & 0xFFFF
+    crc = (crc << 8) | ((crc >> 8) & 0xFF)
+
+    return crc & 0xFFFF
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+POLY = 0x8408
+# Bytes processed by a single task
+CHUNK_SIZE = 1 << 20
+
+
+def _make_tables(poly, slices=8):
+    """Returns slicing tables for the reflected polynomial.
+
+    tables[k][b] is CRC of byte b followed by k zero bytes.
+    """
+    table = np.arange(256, dtype=np.int64)
+    for _ in range(8):
+        table = np.where(table & 1, (table >> 1) ^ poly, table >> 1)
+
+    tables = [table]
+    for _ in range(1, slices):
+        tables.append((tables[-1] >> 8) ^ table[tables[-1] & 0xFF])
+
+    return np.stack(tables).astype(np.int32)
+
+
+TABLES = _make_tables(POLY)
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _crc_update(crc, data, start, stop):
+    tail = stop - (stop - start) % 8
+
+    for i in range(start, tail, 8):
+        x = crc ^ (data[i] | (np.int64(data[i + 1]) << 8))
+        crc = (
+            TABLES[7, x & 0xFF]
+            ^ TABLES[6, x >> 8]
+            ^ TABLES[5, data[i + 2]]
+            ^ TABLES[4, data[i + 3]]
+            ^ TABLES[3, data[i + 4]]
+            ^ TABLES[2, data[i + 5]]
+            ^ TABLES[1, data[i + 6]]
+            ^ TABLES[0, data[i + 7]]
+        )
+
+    for i in range(tail, stop):
+        crc = (crc >> 8) ^ TABLES[0, (crc ^ data[i]) & 0xFF]
+
+    return crc
+
+
+# CRC register is a linear function over GF(2) of its initial value and the
+# data, so CRC of concatenated chunks is combined from CRCs of the chunks:
+#   crc(a + b, init) = zeros(len(b)) * crc(a, init) ^ crc(b, 0)
+# where zeros(n) is a 16x16 bit matrix advancing register over n zero bytes.
+# Matrices are stored as 16 columns.
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _gf2_times(mat, vec):
+    result = 0
+    i = 0
+    while vec:
+        if vec & 1:
+            result ^= mat[i]
+        vec >>= 1
+        i += 1
+    return result
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _gf2_compose(a, b):
+    result = np.empty(16, dtype=np.int64)
+    for i in range(16):
+        result[i] = _gf2_times(a, b[i])
+    return result
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _zeros_operator(n):
+    # advance over a single zero byte
+    op = np.empty(16, dtype=np.int64)
+    for i in range(16):
+        op[i] = _crc_update(np.int64(1) << i, np.zeros(1, np.uint8), 0, 1)
+
+    result = np.empty(16, dtype=np.int64)
+    for i in range(16):
+        result[i] = np.int64(1) << i
+
+    while n:
+        if n & 1:
+            result = _gf2_compose(op, result)
+        op = _gf2_compose(op, op)
+        n >>= 1
+
+    return result
+
+
+# CRC-16-CCITT Algorithm computing chunks in parallel
+@nb.jit(nopython=True, parallel=True, fastmath=True)
+def crc16(data):
+    n = data.shape[0]
+    nchunks = (n + CHUNK_SIZE - 1) // CHUNK_SIZE
+    crcs = np.empty(nchunks, dtype=np.int64)
+
+    for c in nb.prange(nchunks):
+        start = c * CHUNK_SIZE
+        crcs[c] = _crc_update(0, data, start, min(start + CHUNK_SIZE, n))
+
+    crc = 0xFFFF
+    if nchunks > 0:
+        full = _zeros_operator(CHUNK_SIZE)
+        last = _zeros_operator(n - (nchunks - 1) * CHUNK_SIZE)
+        for c in range(nchunks - 1):
+            crc = _gf2_times(full, crc) ^ crcs[c]
+        crc = _gf2_times(last, crc) ^ crcs[nchunks - 1]
+
+    crc = ~crc & 0xFFFF
+    crc = (crc << 8) | ((crc >> 8) & 0xFF)
+
+    return crc & 0xFFFF
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+# Node is approximated by its center of mass if size / distance < THETA.
+THETA = 0.5
+LEAF_SIZE = 16
+# Cells are not split below this depth, e.g. for coincident particles.
+MAX_DEPTH = 32
+# Every level of the traversal pushes at most 8 children.
+STACK_SIZE = 8 * MAX_DEPTH + 1
+
+# Columns of the node arrays
+START, STOP, CHILD, NCHILD, DEPTH = range(5)
+CX, CY, CZ, HALF, MASS, COMX, COMY, COMZ = range(8)
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _grow(nodes, size):
+    grown = np.empty((size, nodes.shape[1]), dtype=nodes.dtype)
+    grown[: nodes.shape[0]] = nodes
+    return grown
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _build_octree(pos, mass, leaf_size):  # noqa: C901: octree construction
+    """Builds octree over particles.
+
+    Returns particle order, such that particles of every node are contiguous,
+    integer node data (range of particles, children) and float node data
+    (cell geometry, mass and center of mass).
+    """
+    n = pos.shape[0]
+    index = np.arange(n)
+    octant = np.empty(n, dtype=np.int64)
+    buffer = np.empty(n, dtype=np.int64)
+
+    capacity = 64 + 2 * (n // leaf_size)
+    inodes = np.empty((capacity, 5), dtype=np.int64)
+    fnodes = np.empty((capacity, 8), dtype=np.float64)
+
+    lower = np.array([pos[:, d].min() for d in range(3)])
+    upper = np.array([pos[:, d].max() for d in range(3)])
+    inodes[0, START] = 0
+    inodes[0, STOP] = n
+    inodes[0, DEPTH] = 0
+    for d in range(3):
+        fnodes[0, CX + d] = 0.5 * (lower[d] + upper[d])
+    fnodes[0, HALF] = 0.5 * (upper - lower).max()
+    nnodes = 1
+
+    stack = np.empty(STACK_SIZE * 8, dtype=np.int64)
+    stack[0] = 0
+    top = 1
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        s = inodes[node, START]
+        e = inodes[node, STOP]
+
+        m = 0.0
+        com = np.zeros(3)
+        for p in range(s, e):
+            k = index[p]
+            m += mass[k]
+            for d in range(3):
+                com[d] += mass[k] * pos[k, d]
+        fnodes[node, MASS] = m
+        for d in range(3):
+            fnodes[node, COMX + d] = com[d] / m if m > 0 else 0.0
+
+        inodes[node, CHILD] = -1
+        inodes[node, NCHILD] = 0
+        if e - s <= leaf_size or inodes[node, DEPTH] >= MAX_DEPTH:
+            continue
+
+        # counting sort of the particles by octant
+        counts = np.zeros(8, dtype=np.int64)
+        for p in range(s, e):
+            k = index[p]
+            o = 0
+            for d in range(3):
+                if pos[k, d] > fnodes[node, CX + d]:
+                    o |= 1 << d
+            octant[p] = o
+            counts[o] += 1
+
+        offsets = np.zeros(9, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        fill = offsets[:8].copy()
+        for p in range(s, e):
+            buffer[s + fill[octant[p]]] = index[p]
+            fill[octant[p]] += 1
+        index[s:e] = buffer[s:e]
+
+        if nnodes + 8 > capacity:
+            capacity *= 2
+            inodes = _grow(inodes, capacity)
+            fnodes = _grow(fnodes, capacity)
+
+        inodes[node, CHILD] = nnodes
+        half = 0.5 * fnodes[node, HALF]
+        for o in range(8):
+            if counts[o] == 0:
+                continue
+            child = nnodes
+            inodes[child, START] = s + offsets[o]
+            inodes[child, STOP] = s + offsets[o + 1]
+            inodes[child, DEPTH] = inodes[node, DEPTH] + 1
+            for d in range(3):
+                sign = 1.0 if o & (1 << d) else -1.0
+                fnodes[child, CX + d] = fnodes[node, CX + d] + sign * half
+            fnodes[child, HALF] = half
+            nnodes += 1
+            inodes[node, NCHILD] += 1
+            stack[top] = child
+            top += 1
+
+    return index, inodes[:nnodes], fnodes[:nnodes]
+
+
+@nb.jit(nopython=True, parallel=True, fastmath=True)
+def _interactions(pos, mass, G, softening):  # noqa: C901: tree traversal
+    """Returns approximate accelerations and potentials of all particles.
+
+    Potential is computed without softening, like in the reference energy.
+    """
+    n = pos.shape[0]
+    m = mass[:, 0]
+    index, inodes, fnodes = _build_octree(pos, m, LEAF_SIZE)
+
+    # particles in tree order
+    tpos = pos[index]
+    tm = m[index]
+    soft2 = softening**2
+    theta2 = THETA**2
+
+    acc = np.empty((n, 3))
+    phi = np.empty(n)
+
+    # neighbouring particles of the tree order share most of the traversal
+    for b in nb.prange(n):
+        stack = np.empty(STACK_SIZE, dtype=np.int64)
+        stack[0] = 0
+        top = 1
+        ax = 0.0
+        ay = 0.0
+        az = 0.0
+        p = 0.0
+
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            dx = fnodes[node, COMX] - tpos[b, 0]
+            dy = fnodes[node, COMY] - tpos[b, 1]
+            dz = fnodes[node, COMZ] - tpos[b, 2]
+            r2 = dx * dx + dy * dy + dz * dz
+            size = 2.0 * fnodes[node, HALF]
+
+            if inodes[node, NCHILD] == 0:
+                for j in range(inodes[node, START], inodes[node, STOP]):
+                    dx = tpos[j, 0] - tpos[b, 0]
+                    dy = tpos[j, 1] - tpos[b, 1]
+                    dz = tpos[j, 2] - tpos[b, 2]
+                    r2 = dx * dx + dy * dy + dz * dz
+                    s2 = r2 + soft2
+                    inv_r3 = tm[j] / (s2 * np.sqrt(s2))
+                    ax += dx * inv_r3
+                    ay += dy * inv_r3
+                    az += dz * inv_r3
+                    p += tm[j] / np.sqrt(r2) if r2 > 0 else 0.0
+            elif size * size < theta2 * r2:
+                s2 = r2 + soft2
+                inv_r3 = fnodes[node, MASS] / (s2 * np.sqrt(s2))
+                ax += dx * inv_r3
+                ay += dy * inv_r3
+                az += dz * inv_r3
+                p += fnodes[node, MASS] / np.sqrt(r2)
+            else:
+                child = inodes[node, CHILD]
+                for c in range(inodes[node, NCHILD]):
+                    stack[top] = child + c
+                    top += 1
+
+        k = index[b]
+        acc[k, 0] = G * ax
+        acc[k, 1] = G * ay
+        acc[k, 2] = G * az
+        phi[k] = -G * p
+
+    return acc, phi
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _energy(vel, mass, phi):
+    KE = 0.5 * np.sum(mass * vel**2)
+    # every pair is included into potentials of both particles
+    PE = 0.5 * np.sum(mass[:, 0] * phi)
+    return KE, PE
+
+
+def nbody(mass, pos, vel, N, Nt, dt, G, softening):
+    # Convert to Center-of-Mass frame
+    vel -= np.mean(mass * vel, axis=0) / np.mean(mass)
+
+    # calculate initial gravitational accelerations and energy
+    acc, phi = _interactions(pos, mass, G, softening)
+
+    KE = np.empty(Nt + 1, dtype=np.float64)
+    PE = np.empty(Nt + 1, dtype=np.float64)
+    KE[0], PE[0] = _energy(vel, mass, phi)
+
+    # Simulation Main Loop
+    for i in range(Nt):
+        # (1/2) kick
+        vel += acc * dt / 2.0
+
+        # drift
+        pos += vel * dt
+
+        # octree is rebuilt for the new positions
+        acc, phi = _interactions(pos, mass, G, softening)
+
+        # (1/2) kick
+        vel += acc * dt / 2.0
+
+        KE[i + 1], PE[i + 1] = _energy(vel, mass, phi)
+
+    return KE, PE
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+# Particles of a block are kept in L1 cache, while they interact with all
+# particles of the target block.
+BLOCK_SIZE = 512
+
+
+@nb.jit(nopython=True, parallel=True, fastmath=True)
+def _interactions(pos, mass, G, softening):
+    """Returns accelerations and potentials of all particles.
+
+    Potential is computed without softening, like in the reference energy.
+    """
+    n = pos.shape[0]
+    # coordinates are split, so the inner loop reads contiguous arrays
+    x = np.ascontiguousarray(pos[:, 0])
+    y = np.ascontiguousarray(pos[:, 1])
+    z = np.ascontiguousarray(pos[:, 2])
+    m = np.ascontiguousarray(mass[:, 0])
+    soft2 = softening**2
+
+    acc = np.zeros((n, 3))
+    phi = np.zeros(n)
+
+    for ib in nb.prange((n + BLOCK_SIZE - 1) // BLOCK_SIZE):
+        i0 = ib * BLOCK_SIZE
+        i1 = min(i0 + BLOCK_SIZE, n)
+        for j0 in range(0, n, BLOCK_SIZE):
+            j1 = min(j0 + BLOCK_SIZE, n)
+            for i in range(i0, i1):
+                ax = 0.0
+                ay = 0.0
+                az = 0.0
+                p = 0.0
+                for j in range(j0, j1):
+                    dx = x[j] - x[i]
+                    dy = y[j] - y[i]
+                    dz = z[j] - z[i]
+                    r2 = dx * dx + dy * dy + dz * dz
+                    s2 = r2 + soft2
+                    inv_r3 = m[j] / (s2 * np.sqrt(s2))
+                    ax += dx * inv_r3
+                    ay += dy * inv_r3
+                    az += dz * inv_r3
+                    p += m[j] / np.sqrt(r2) if r2 > 0 else 0.0
+                acc[i, 0] += G * ax
+                acc[i, 1] += G * ay
+                acc[i, 2] += G * az
+                phi[i] -= G * p
+
+    return acc, phi
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _energy(vel, mass, phi):
+    KE = 0.5 * np.sum(mass * vel**2)
+    # every pair is included into potentials of both particles
+    PE = 0.5 * np.sum(mass[:, 0] * phi)
+    return KE, PE
+
+
+def nbody(mass, pos, vel, N, Nt, dt, G, softening):
+    # Convert to Center-of-Mass frame
+    vel -= np.mean(mass * vel, axis=0) / np.mean(mass)
+
+    # calculate initial gravitational accelerations and energy
+    acc, phi = _interactions(pos, mass, G, softening)
+
+    KE = np.empty(Nt + 1, dtype=np.float64)
+    PE = np.empty(Nt + 1, dtype=np.float64)
+    KE[0], PE[0] = _energy(vel, mass, phi)
+
+    # Simulation Main Loop
+    for i in range(Nt):
+        # (1/2) kick
+        vel += acc * dt / 2.0
+
+        # drift
+        pos += vel * dt
+
+        # update accelerations, potential energy uses the same pairs
+        acc, phi = _interactions(pos, mass, G, softening)
+
+        # (1/2) kick
+        vel += acc * dt / 2.0
+
+        KE[i + 1], PE[i + 1] = _energy(vel, mass, phi)
+
+    return KE, PE
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2020 Philip Mocz
+# SPDX-FileCopyrightText: 2021 ETH Zurich and the NPBench authors
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Adapted from https://github.com/pmocz/nbody-python/blob/master/nbody.py
+
+import numpy as np
+
+# Pairwise temporaries are BLOCK_SIZE x BLOCK_SIZE matrices, so memory does
+# not grow with the number of particles.
+BLOCK_SIZE = 1024
+
+
+def _separations(pos, i0, i1, j0, j1):
+    """Returns separations r_j - r_i of two blocks of particles."""
+    dx = pos[j0:j1, 0] - pos[i0:i1, 0:1]
+    dy = pos[j0:j1, 1] - pos[i0:i1, 1:2]
+    dz = pos[j0:j1, 2] - pos[i0:i1, 2:3]
+    return dx, dy, dz
+
+
+def getAcc(pos, mass, G, softening):
+    """
+    Calculate the acceleration on each particle due to Newton's Law
+    accumulating pairwise forces block by block
+    """
+    n = pos.shape[0]
+    a = np.zeros((n, 3))
+
+    for i0 in range(0, n, BLOCK_SIZE):
+        i1 = min(i0 + BLOCK_SIZE, n)
+        for j0 in range(0, n, BLOCK_SIZE):
+            j1 = min(j0 + BLOCK_SIZE, n)
+            dx, dy, dz = _separations(pos, i0, i1, j0, j1)
+
+            inv_r3 = dx**2 + dy**2 + dz**2 + softening**2
+            inv_r3[inv_r3 > 0] = inv_r3[inv_r3 > 0] ** (-1.5)
+            inv_r3 *= mass[j0:j1, 0]
+
+            a[i0:i1, 0] += G * np.sum(dx * inv_r3, axis=1)
+            a[i0:i1, 1] += G * np.sum(dy * inv_r3, axis=1)
+            a[i0:i1, 2] += G * np.sum(dz * inv_r3, axis=1)
+
+    return a
+
+
+def getEnergy(pos, vel, mass, G):
+    """
+    Get kinetic energy (KE) and potential energy (PE) of simulation
+    summing potential over the blocks of the upper triangle
+    """
+    KE = 0.5 * np.sum(mass * vel**2)
+
+    n = pos.shape[0]
+    PE = 0.0
+
+    for i0 in range(0, n, BLOCK_SIZE):
+        i1 = min(i0 + BLOCK_SIZE, n)
+        for j0 in range(i0, n, BLOCK_SIZE):
+            j1 = min(j0 + BLOCK_SIZE, n)
+            dx, dy, dz = _separations(pos, i0, i1, j0, j1)
+
+            inv_r = np.sqrt(dx**2 + dy**2 + dz**2)
+            inv_r[inv_r > 0] = 1.0 / inv_r[inv_r > 0]
+
+            pe = -(mass[i0:i1] * mass[j0:j1, 0]) * inv_r
+            # count each interaction of the diagonal block only once
+            if i0 == j0:
+                pe = np.triu(pe, 1)
+            PE += G * np.sum(pe)
+
+    return KE, PE
+
+
+def nbody(mass, pos, vel, N, Nt, dt, G, softening):
+    # Convert to Center-of-Mass frame
+    vel -= np.mean(mass * vel, axis=0) / np.mean(mass)
+
+    # calculate initial gravitational accelerations
+    acc = getAcc(pos, mass, G, softening)
+
+    # calculate initial energy of system
+    KE = np.ndarray(Nt + 1, dtype=np.float64)
+    PE = np.ndarray(Nt + 1, dtype=np.float64)
+    KE[0], PE[0] = getEnergy(pos, vel, mass, G)
+
+    t = 0.0
+
+    # Simulation Main Loop
+    for i in range(Nt):
+        # (1/2) kick
+        vel += acc * dt / 2.0
+
+        # drift
+        pos += vel * dt
+
+        # update accelerations
+        acc = getAcc(pos, mass, G, softening)
+
+        # (1/2) kick
+        vel += acc * dt / 2.0
+
+        # update time
+        t += dt
+
+        # get energy of system
+        KE[i + 1], PE[i + 1] = getEnergy(pos, vel, mass, G)
+
+    return KE, PE
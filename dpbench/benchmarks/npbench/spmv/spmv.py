@@ -5,6 +5,60 @@
 
 import numpy as np
 
+# SELL-C-sigma parameters: rows are grouped in slices of C rows, and rows are
+# sorted by length inside windows of SIGMA rows to reduce padding.
+SELL_C = 8
+SELL_SIGMA = 256
+
+
+def _to_ell(M, rows, cols, vals):
+    """Converts CSR matrix to ELL format stored column-major (width, M)."""
+    lengths = np.diff(rows).astype(np.int64)
+    width = int(lengths.max()) if M > 0 else 0
+
+    row_of = np.repeat(np.arange(M), lengths)
+    pos = np.arange(cols.size) - np.repeat(rows[:-1].astype(np.int64), lengths)
+
+    ell_cols = np.zeros((width, M), dtype=np.uint32)
+    ell_vals = np.zeros((width, M), dtype=vals.dtype)
+    ell_cols[pos, row_of] = cols
+    ell_vals[pos, row_of] = vals
+
+    return ell_cols, ell_vals
+
+
+def _to_sell(M, rows, cols, vals):
+    """Converts CSR matrix to SELL-C-sigma format.
+
+    Slice s holds rows perm[s * C:(s + 1) * C] stored column-major starting at
+    ptr[s]. Padding rows of the last slice have perm equal to M.
+    """
+    lengths = np.diff(rows).astype(np.int64)
+    nslices = (M + SELL_C - 1) // SELL_C
+
+    perm = np.lexsort((-lengths, np.arange(M) // SELL_SIGMA))
+    perm = np.append(perm, np.full(nslices * SELL_C - M, M)).astype(np.uint32)
+    sorted_lengths = np.append(lengths, 0)[perm].reshape(nslices, SELL_C)
+
+    widths = sorted_lengths.max(axis=1)
+    ptr = np.zeros(nslices + 1, dtype=np.int64)
+    np.cumsum(widths * SELL_C, out=ptr[1:])
+
+    # position of every row inside the permutation
+    slot = np.empty(M, dtype=np.int64)
+    slot[perm[:M]] = np.arange(M)
+
+    row_of = np.repeat(np.arange(M), lengths)
+    pos = np.arange(cols.size) - np.repeat(rows[:-1].astype(np.int64), lengths)
+    dst = ptr[slot[row_of] // SELL_C] + pos * SELL_C + slot[row_of] % SELL_C
+
+    sell_cols = np.zeros(ptr[-1], dtype=np.uint32)
+    sell_vals = np.zeros(ptr[-1], dtype=vals.dtype)
+    sell_cols[dst] = cols
+    sell_vals[dst] = vals
+
+    return ptr, sell_cols, sell_vals, perm
+
 
 def initialize(M, N, nnz):
     from numpy.random import default_rng
@@ -27,4 +81,18 @@ def initialize(M, N, nnz):
     cols = np.uint32(matrix.indices)
     vals = matrix.data
 
-    return rows, cols, vals, x
+    ell_cols, ell_vals = _to_ell(M, rows, cols, vals)
+    sell_ptr, sell_cols, sell_vals, sell_perm = _to_sell(M, rows, cols, vals)
+
+    return (
+        rows,
+        cols,
+        vals,
+        x,
+        ell_cols,
+        ell_vals,
+        sell_ptr,
+        sell_cols,
+        sell_vals,
+        sell_perm,
+    )
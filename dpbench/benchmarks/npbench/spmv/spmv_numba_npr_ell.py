@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Sparse Matrix-Vector Multiplication (SpMV)
+import numba as nb
+import numpy as np
+
+# Rows processed by a single task. The inner loop over rows of the block is
+# contiguous in ELL column-major layout, so it is vectorized.
+ROW_BLOCK = 1024
+
+
+# Matrix-Vector Multiplication with the matrix given in ELLPACK (ELL) format
+@nb.jit(nopython=True, parallel=True, fastmath=True)
+def spmv(M, A_ell_col, A_ell_val, x):
+    y = np.zeros(M, A_ell_val.dtype)
+    width = A_ell_col.shape[0]
+
+    for b in nb.prange((M + ROW_BLOCK - 1) // ROW_BLOCK):
+        start = b * ROW_BLOCK
+        stop = min(start + ROW_BLOCK, M)
+        for k in range(width):
+            for i in range(start, stop):
+                y[i] += A_ell_val[k, i] * x[A_ell_col[k, i]]
+
+    return y
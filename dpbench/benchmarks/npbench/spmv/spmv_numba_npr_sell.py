@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Sparse Matrix-Vector Multiplication (SpMV)
+import numba as nb
+import numpy as np
+
+
+# Matrix-Vector Multiplication with the matrix given in SELL-C-sigma format
+@nb.jit(nopython=True, parallel=True, fastmath=True)
+def spmv(M, A_sell_ptr, A_sell_col, A_sell_val, A_sell_perm, x):
+    nslices = A_sell_ptr.shape[0] - 1
+    chunk = A_sell_perm.shape[0] // nslices if nslices > 0 else 0
+    y = np.zeros(M, A_sell_val.dtype)
+
+    for s in nb.prange(nslices):
+        acc = np.zeros(chunk, A_sell_val.dtype)
+        width = (A_sell_ptr[s + 1] - A_sell_ptr[s]) // chunk
+        for k in range(width):
+            base = A_sell_ptr[s] + k * chunk
+            for r in range(chunk):
+                acc[r] += A_sell_val[base + r] * x[A_sell_col[base + r]]
+
+        for r in range(chunk):
+            row = A_sell_perm[s * chunk + r]
+            if row < M:
+                y[row] = acc[r]
+
+    return y
@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Sparse Matrix-Vector Multiplication (SpMV)
+import numpy as np
+
+
+# Matrix-Vector Multiplication with the matrix given in Compressed Sparse Row
+# (CSR) format, all rows are reduced at once.
+def spmv(A_row, A_col, A_val, x):
+    y = np.zeros(A_row.size - 1, A_val.dtype)
+
+    # reduceat returns a single element for empty rows instead of zero, so
+    # only rows with at least one element are reduced.
+    nonempty = A_row[:-1] < A_row[1:]
+    if A_val.size > 0:
+        y[nonempty] = np.add.reduceat(A_val * x[A_col], A_row[:-1][nonempty])
+
+    return y
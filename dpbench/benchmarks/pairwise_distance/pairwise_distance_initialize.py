@@ -3,7 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-def initialize(npoints, dims, seed, types_dict):
+def initialize(
+    npoints,
+    dims,
+    seed,
+    types_dict,
+    same_inputs=False,
+    memmap_output=False,
+):
     import numpy as np
     import numpy.random as default_rng
 
@@ -11,8 +18,21 @@ def initialize(npoints, dims, seed, types_dict):
 
     default_rng.seed(seed)
 
-    return (
-        default_rng.random((npoints, dims)).astype(dtype),
-        default_rng.random((npoints, dims)).astype(dtype),
-        np.empty((npoints, npoints), dtype),
-    )
+    X1 = default_rng.random((npoints, dims)).astype(dtype)
+    if same_inputs:
+        X2 = X1.copy()
+    else:
+        X2 = default_rng.random((npoints, dims)).astype(dtype)
+
+    if memmap_output:
+        import tempfile
+
+        # Output larger than memory is backed by a temporary file, set TMPDIR
+        # to a disk backed directory.
+        D = np.memmap(
+            tempfile.TemporaryFile(), dtype, "w+", shape=(npoints, npoints)
+        )
+    else:
+        D = np.empty((npoints, npoints), dtype)
+
+    return (X1, X2, D)
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Tiles of 1024x1024 doubles fit into L2 cache together with the input rows.
+BLOCK_SIZE = 1024
+
+
+def _num_threads():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _distance_tile(X1, X2, x1, x2, D, i0, i1, j0, j1, mirror):
+    tile = np.dot(X1[i0:i1], X2[j0:j1].T)
+    tile *= -2
+    tile += x1[i0:i1, None]
+    tile += x2[j0:j1]
+    # rounding may produce small negative values for (almost) equal points
+    np.maximum(tile, 0, out=tile)
+    np.sqrt(tile, tile)
+
+    D[i0:i1, j0:j1] = tile
+    if mirror:
+        D[j0:j1, i0:i1] = tile.T
+
+
+# Output is written tile by tile, so D may be a memory mapped file larger than
+# memory. Tiles are computed by a thread pool, NumPy releases the GIL in BLAS
+# and element-wise operations.
+def pairwise_distance(X1, X2, D):
+    x1 = np.sum(np.square(X1), axis=1)
+    x2 = np.sum(np.square(X2), axis=1)
+    # distance matrix of identical inputs is symmetric, so only tiles of the
+    # upper triangle are computed
+    symmetric = X1 is X2 or (X1.shape == X2.shape and np.array_equal(X1, X2))
+
+    tasks = []
+    for i0 in range(0, X1.shape[0], BLOCK_SIZE):
+        i1 = min(i0 + BLOCK_SIZE, X1.shape[0])
+        for j0 in range(i0 if symmetric else 0, X2.shape[0], BLOCK_SIZE):
+            j1 = min(j0 + BLOCK_SIZE, X2.shape[0])
+            tasks.append((i0, i1, j0, j1, symmetric and i0 != j0))
+
+    with ThreadPoolExecutor(max_workers=_num_threads()) as pool:
+        futures = [
+            pool.submit(_distance_tile, X1, X2, x1, x2, D, *task)
+            for task in tasks
+        ]
+        for future in futures:
+            future.result()
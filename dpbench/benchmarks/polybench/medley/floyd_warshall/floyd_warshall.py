@@ -8,9 +8,7 @@ import numpy as np
 
 def initialize(N, datatype=np.int32):
     path = np.fromfunction(lambda i, j: i * j % 7 + 1, (N, N), dtype=datatype)
-    for i in range(N):
-        for j in range(N):
-            if (i + j) % 13 == 0 or (i + j) % 7 == 0 or (i + j) % 11 == 0:
-                path[i, j] = 999
+    ij = np.add.outer(np.arange(N), np.arange(N))
+    path[(ij % 13 == 0) | (ij % 7 == 0) | (ij % 11 == 0)] = 999
 
     return path
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+
+# Tiles of int32 matrix take 64 KiB, so the updated tile together with
+# tiles of the pivot row and the pivot column fit into L2 cache.
+BLOCK_SIZE = 128
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _relax_row(row, pik, row_k):
+    # Loop over contiguous row slices is vectorized. Sum is kept in the matrix
+    # type like in NumPy, otherwise it is widened to int64.
+    dtype = row.dtype.type
+    for j in range(row.shape[0]):
+        row[j] = min(row[j], dtype(pik + row_k[j]))
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _relax_dependent(path, i0, i1, j0, j1, k0, k1):
+    # Pivot tile is updated in place, so pivots have to be the outer loop.
+    for k in range(k0, k1):
+        row_k = path[k, j0:j1]
+        for i in range(i0, i1):
+            _relax_row(path[i, j0:j1], path[i, k], row_k)
+
+
+@nb.jit(nopython=True, fastmath=True)
+def _relax_independent(path, i0, i1, j0, j1, k0, k1):
+    # Pivot row and column are final, so each row stays in cache over pivots.
+    for i in range(i0, i1):
+        row_i = path[i, j0:j1]
+        for k in range(k0, k1):
+            _relax_row(row_i, path[i, k], path[k, j0:j1])
+
+
+@nb.jit(nopython=True, parallel=True, fastmath=True)
+def kernel(path):
+    n = path.shape[0]
+    nblocks = (n + BLOCK_SIZE - 1) // BLOCK_SIZE
+
+    for kb in range(nblocks):
+        k0 = kb * BLOCK_SIZE
+        k1 = min(k0 + BLOCK_SIZE, n)
+
+        # phase 1: pivot block
+        _relax_dependent(path, k0, k1, k0, k1, k0, k1)
+
+        # phase 2: blocks of the pivot row and the pivot column
+        for b in nb.prange(nblocks):
+            if b == kb:
+                continue
+            b0 = b * BLOCK_SIZE
+            b1 = min(b0 + BLOCK_SIZE, n)
+            _relax_dependent(path, k0, k1, b0, b1, k0, k1)
+            _relax_dependent(path, b0, b1, k0, k1, k0, k1)
+
+        # phase 3: remaining blocks are independent from each other
+        for ib in nb.prange(nblocks):
+            if ib == kb:
+                continue
+            i0 = ib * BLOCK_SIZE
+            i1 = min(i0 + BLOCK_SIZE, n)
+            for jb in range(nblocks):
+                if jb == kb:
+                    continue
+                j0 = jb * BLOCK_SIZE
+                j1 = min(j0 + BLOCK_SIZE, n)
+                _relax_independent(path, i0, i1, j0, j1, k0, k1)
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numba as nb
+import numpy as np
+
+
+# Cells of the same anti-diagonal j - i = d depend only on the previous
+# diagonals, so they are computed in parallel.
+@nb.jit(nopython=True, parallel=True, fastmath=True)
+def kernel(N, seq):
+    table = np.zeros((N, N), np.int32)
+    # transposed copy of the table, so both operands of the reduction over k
+    # are contiguous rows
+    table_t = np.zeros((N, N), np.int32)
+
+    for d in range(1, N):
+        for i in nb.prange(N - d):
+            j = i + d
+            best = max(table[i, j - 1], table[i + 1, j])
+            if d >= 2:
+                match = 1 if seq[i] + seq[j] == 3 else 0
+                best = max(best, table[i + 1, j - 1] + match)
+
+            row = table[i, i + 1 : j]
+            col = table_t[j, i + 2 : j + 1]
+            for k in range(d - 1):
+                best = max(best, row[k] + col[k])
+
+            table[i, j] = best
+            table_t[j, i] = best
+
+    return table
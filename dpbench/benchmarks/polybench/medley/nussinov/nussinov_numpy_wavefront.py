@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Cells of the same anti-diagonal j - i = d depend only on the previous
+# diagonals, so each diagonal is computed at once. Diagonal d of the row-major
+# table is the slice flat[d::N + 1].
+def kernel(N, seq):
+    table = np.zeros((N, N), np.int32)
+    # transposed copy of the table, so both operands of the reduction over k
+    # are contiguous rows
+    table_t = np.zeros((N, N), np.int32)
+    flat = table.reshape(-1)
+    flat_t = table_t.reshape(-1)
+    step = N + 1
+
+    for d in range(1, N):
+        n = N - d
+        # table[i, j - 1] and table[i + 1, j]
+        best = np.maximum(flat[d - 1 :: step][:n], flat[d + N :: step][:n])
+
+        if d >= 2:
+            # table[i + 1, j - 1] + match(seq[i], seq[j])
+            pair = flat[d - 1 + N :: step][:n] + (seq[:n] + seq[d:] == 3)
+            np.maximum(best, pair, out=best)
+
+            # table[i, k] + table[k + 1, j] for k in range(i + 1, j)
+            rows = sliding_window_view(flat[1:], d - 1)[::step][:n]
+            cols = sliding_window_view(flat_t[d * N + 2 :], d - 1)[::step][:n]
+            np.maximum(best, (rows + cols).max(axis=1), out=best)
+
+        flat[d::step][:n] = best
+        flat_t[d * N :: step][:n] = best
+
+    return table
@@ -10,7 +10,12 @@ to provide a structured way to define and store benchmark data.
 """
 
 
-from .benchmark import Benchmark, BenchmarkImplementation
+from .benchmark import (
+    Benchmark,
+    BenchmarkImplementation,
+    Metrics,
+    PresetImplementations,
+)
 from .config import Config
 from .framework import Framework
 from .implementation_postfix import Implementation
@@ -26,4 +31,6 @@ __all__ = [
     "Config",
     "Framework",
     "Implementation",
+    "Metrics",
+    "PresetImplementations",
 ]
@@ -49,6 +49,47 @@ class Init:
         self.func_name = self.func_name or "initialize"
 
 
+@dataclass
+class Metrics:
+    """Formulas of the work done by a single benchmark execution.
+
+    Formulas are arithmetic expressions of the preset parameters and
+    ``itemsize`` - size of the floating point type of the selected precision
+    in bytes.
+    """
+
+    flops: str = ""
+    bytes: str = ""
+    items: str = ""
+
+    @staticmethod
+    def from_dict(obj: Any) -> "Metrics":
+        """Convert object into Metrics dataclass."""
+        _flops = str(obj.get("flops") or "")
+        _bytes = str(obj.get("bytes") or "")
+        _items = str(obj.get("items") or "")
+        return Metrics(_flops, _bytes, _items)
+
+
+@dataclass
+class PresetImplementations:
+    """Implementations that can be run with the benchmark preset."""
+
+    implementations: List[str] = field(default_factory=list)
+    reference_implementation_postfix: str = None
+
+    @staticmethod
+    def from_dict(obj: Any) -> "PresetImplementations":
+        """Convert object into PresetImplementations dataclass."""
+        _implementations = obj.get("implementations") or []
+        _reference_implementation_postfix = obj.get(
+            "reference_implementation_postfix"
+        )
+        return PresetImplementations(
+            _implementations, _reference_implementation_postfix
+        )
+
+
 @dataclass
 class BenchmarkImplementation:
     """Configuration for benchmark initialization."""
@@ -87,11 +128,16 @@ class Benchmark:
     parameters: Presets = field(default_factory=Presets)
     init: Init = None
     input_args: List[str] = field(default_factory=list)
+    optional_input_args: List[str] = field(default_factory=list)
     array_args: List[str] = field(default_factory=list)
     output_args: List[str] = field(default_factory=list)
     implementations: List[BenchmarkImplementation] = field(default_factory=list)
     reference_implementation_postfix: str = None
     expected_failure_implementations: List[str] = field(default_factory=list)
+    metrics: Metrics = None
+    preset_implementations: dict[str, PresetImplementations] = field(
+        default_factory=dict
+    )
 
     @staticmethod
     def from_dict(obj: Any) -> "Benchmark":
@@ -110,6 +156,7 @@ class Benchmark:
         _init = obj.get("init")
         _init = Init.from_dict(_init) if _init else None
         _input_args = obj.get("input_args") or []
+        _optional_input_args = obj.get("optional_input_args") or []
         _array_args = obj.get("array_args") or []
         _output_args = obj.get("output_args") or []
         _implementations = obj.get("implementations") or []
@@ -119,6 +166,14 @@ class Benchmark:
         _expected_failure_implementations = (
             obj.get("expected_failure_implementations") or []
         )
+        _metrics = obj.get("metrics")
+        _metrics = Metrics.from_dict(_metrics) if _metrics else None
+        _preset_implementations = {
+            preset: PresetImplementations.from_dict(value)
+            for preset, value in (
+                obj.get("preset_implementations") or {}
+            ).items()
+        }
         return Benchmark(
             _name,
             _short_name,
@@ -133,9 +188,46 @@ class Benchmark:
             _parameters,
             _init,
             _input_args,
+            _optional_input_args,
             _array_args,
             _output_args,
             _implementations,
             _reference_implementation_postfix,
             _expected_failure_implementations,
+            _metrics,
+            _preset_implementations,
         )
+
+    def supports_preset(self, implementation: str, preset: str) -> bool:
+        """Checks if the implementation can be run with the preset."""
+        if preset not in self.parameters:
+            return False
+
+        preset_implementations = self.preset_implementations.get(preset)
+        if preset_implementations and preset_implementations.implementations:
+            return implementation in preset_implementations.implementations
+
+        return True
+
+    def get_reference_implementation_postfix(self, preset: str) -> str:
+        """Returns postfix of the reference implementation for the preset."""
+        preset_implementations = self.preset_implementations.get(preset)
+        if (
+            preset_implementations
+            and preset_implementations.reference_implementation_postfix
+        ):
+            return preset_implementations.reference_implementation_postfix
+
+        return self.reference_implementation_postfix
+
+    def get_reference_implementation_postfixes(self) -> set[str]:
+        """Returns postfixes of the reference implementations of all presets."""
+        postfixes = {
+            preset_implementations.reference_implementation_postfix
+            for preset_implementations in self.preset_implementations.values()
+            if preset_implementations.reference_implementation_postfix
+        }
+        if self.reference_implementation_postfix:
+            postfixes.add(self.reference_implementation_postfix)
+
+        return postfixes
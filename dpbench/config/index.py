@@ -0,0 +1,236 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Index of the top level names defined by benchmark modules.
+
+Discovering implementation functions by importing every module of every
+benchmark drags in all the frameworks (numba, dpnp, cupy, dace, ...) just to
+read configuration. Instead, modules are located on the file system and their
+source is parsed without execution. Parsed names are persisted between runs
+and revalidated by file modification time and size.
+"""
+
+import ast
+import importlib.machinery
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+from typing import Union
+
+DEFAULT_INDEX_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join("~", ".cache")),
+    "dpbench",
+    "index.json",
+)
+
+_VERSION = 1
+
+
+def find_module_location(package_path: str) -> Union[str, None]:
+    """Locates file or directory of the module without importing it.
+
+    Only the top level package gets imported to find its location, so the
+    lookup does not execute any benchmark code.
+
+    Args:
+        package_path: Full name of the module.
+
+    Returns: path to the package directory, python source or extension file.
+        None if module was not found.
+    """
+    root, *names = package_path.split(".")
+
+    spec = importlib.util.find_spec(root)
+    if spec is None:
+        return None
+
+    if not names:
+        return spec.origin
+
+    for location in spec.submodule_search_locations or []:
+        path = os.path.join(location, *names)
+
+        if os.path.isdir(path):
+            return path
+
+        for suffix in [".py"] + importlib.machinery.EXTENSION_SUFFIXES:
+            if os.path.isfile(path + suffix):
+                return path + suffix
+
+    return None
+
+
+def _assigned_names(target: ast.expr) -> list[str]:
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for elt in target.elts for name in _assigned_names(elt)]
+    return []
+
+
+def _imported_names(
+    node: Union[ast.Import, ast.ImportFrom]
+) -> Union[list[str], None]:
+    names = []
+
+    for alias in node.names:
+        if alias.name == "*":
+            return None
+        names.append(alias.asname or alias.name.split(".")[0])
+
+    return names
+
+
+def _nested_names(node: ast.stmt) -> Union[set[str], None]:
+    """Names defined under if/try/with/for at the module level."""
+    names = set()
+
+    for field in ["body", "orelse", "finalbody", "handlers"]:
+        nested = getattr(node, field, None)
+        if not isinstance(nested, list):
+            continue
+        nested_names = _top_level_names(nested)
+        if nested_names is None:
+            return None
+        names |= nested_names
+
+    return names
+
+
+def _node_names(node: ast.stmt) -> Union[list[str], set[str], None]:
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, ast.Assign):
+        return [
+            name for target in node.targets for name in _assigned_names(target)
+        ]
+    if isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+        return _assigned_names(node.target)
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return _imported_names(node)
+    return _nested_names(node)
+
+
+def _top_level_names(body: list[ast.stmt]) -> Union[set[str], None]:
+    names = set()
+
+    for node in body:
+        node_names = _node_names(node)
+        if node_names is None:
+            return None
+        names.update(node_names)
+
+    return names
+
+
+def parse_module_names(path: str) -> Union[set[str], None]:
+    """Parses names defined at the module level without executing it.
+
+    Args:
+        path: Path to the python source file.
+
+    Returns: set of names. None if the names can not be figured out from the
+        source, e.g. it is an extension module or uses star imports.
+    """
+    if not path.endswith(".py"):
+        return None
+
+    with open(path, "rb") as file:
+        source = file.read()
+
+    try:
+        tree = ast.parse(source, filename=path)
+    except SyntaxError:
+        return None
+
+    return _top_level_names(tree.body)
+
+
+class ModuleIndex:
+    """Persistent index of the names defined by python modules."""
+
+    def __init__(self, path: str = None):
+        """Loads index from the file.
+
+        Args:
+            path: Path to the index file. Default is in the user cache
+                directory.
+        """
+        self.path = os.path.abspath(
+            os.path.expanduser(path or DEFAULT_INDEX_PATH)
+        )
+        self.modules: dict[str, dict] = {}
+        self.modified = False
+
+        try:
+            with open(self.path) as file:
+                index = json.load(file)
+            if index.get("version") == _VERSION:
+                self.modules = index.get("modules", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.debug(f"Ignoring broken module index {self.path}: {e}")
+
+    def names(self, path: str) -> Union[set[str], None]:
+        """Returns names defined by the module at the given path.
+
+        Entry gets reparsed if the file changed since it was indexed.
+
+        Args:
+            path: Path to the module file.
+
+        Returns: set of names or None if they are unknown until import.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+
+        entry = self.modules.get(path)
+        if (
+            entry
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            names = entry["names"]
+            return None if names is None else set(names)
+
+        names = parse_module_names(path)
+
+        self.modules[path] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "names": None if names is None else sorted(names),
+        }
+        self.modified = True
+
+        return names
+
+    def save(self) -> None:
+        """Writes index to the file if it was modified.
+
+        Entries of the removed files are dropped. Failure to write the index
+        is not an error, it just gets rebuilt next time.
+        """
+        if not self.modified:
+            return
+
+        modules = {
+            path: entry
+            for path, entry in self.modules.items()
+            if os.path.isfile(path)
+        }
+
+        try:
+            dirname = os.path.dirname(self.path)
+            os.makedirs(dirname, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=dirname, suffix=".tmp", delete=False
+            ) as file:
+                json.dump({"version": _VERSION, "modules": modules}, file)
+            os.replace(file.name, self.path)
+            self.modified = False
+        except OSError as e:
+            logging.debug(f"Could not save module index {self.path}: {e}")
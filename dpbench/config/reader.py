@@ -4,12 +4,12 @@
 
 """Set of functions to read configuration files."""
 
-import importlib
 import logging
 import os
 import pkgutil
 import re
 import sys
+from typing import Union
 
 import tomli
 
@@ -17,9 +17,11 @@ from .benchmark import Benchmark, BenchmarkImplementation, Presets
 from .config import Config
 from .framework import Framework
 from .implementation_postfix import Implementation
+from .index import ModuleIndex, find_module_location
 from .module import Module
 
-_REFERENCE_IMPLEMENTATIONS = {"numpy", "python"}
+# In the order of priority
+_REFERENCE_IMPLEMENTATIONS = ["numpy", "python"]
 
 
 def read_configs(  # noqa: C901: TODO: move modules into config
@@ -107,13 +109,28 @@ def read_configs(  # noqa: C901: TODO: move modules into config
                 parent_package=mod.benchmarks_module,
                 benchmarks=benchmarks,
             )
-        if mod.framework_configs_path != "":
-            read_frameworks(config, mod.framework_configs_path, implementations)
         if mod.precision_dtypes_path != "":
             read_precision_dtypes(config, mod.precision_dtypes_path)
         if mod.path != "":
             sys.path.append(mod.path)
 
+    # Frameworks of the reference implementations set in benchmark configs
+    # are required for validation even if they were not requested.
+    framework_implementations = implementations
+    if implementations:
+        framework_implementations = set(implementations).union(
+            *[
+                benchmark.get_reference_implementation_postfixes()
+                for benchmark in config.benchmarks
+            ]
+        )
+
+    for mod in modules:
+        if mod.framework_configs_path != "":
+            read_frameworks(
+                config, mod.framework_configs_path, framework_implementations
+            )
+
     for framework in config.frameworks:
         config.implementations += framework.postfixes
 
@@ -121,12 +138,17 @@ def read_configs(  # noqa: C901: TODO: move modules into config
         implementations = {impl.postfix for impl in config.implementations}
 
     if load_implementations:
+        index = ModuleIndex()
+
         for benchmark in config.benchmarks:
             read_benchmark_implementations(
                 benchmark,
                 implementations,
+                index,
             )
 
+        index.save()
+
         config.benchmarks = [
             benchmark
             for benchmark in config.benchmarks
@@ -244,13 +266,17 @@ def read_precision_dtypes(config: Config, precision_dtypes_file: str) -> None:
     config.dtypes = tomli.loads(file_contents)
 
 
-def setup_init(config: Benchmark, modules: list[str]) -> None:
+def setup_init(
+    config: Benchmark, modules: list[str], index: ModuleIndex = None
+) -> None:
     """Read and discover initialization module and function.
 
     Args:
         config: Benchmark configuration object where settings should be
             populated.
         modules: List of available modules for the benchmark to find init.
+        index: Index of module names used to check the init function without
+            importing the module.
     """
     if config.init is None:
         return
@@ -271,9 +297,9 @@ def setup_init(config: Benchmark, modules: list[str]) -> None:
         if config.init.func_name == "":
             config.init.func_name = "initialize"
 
-        impl_mod = importlib.import_module(config.init.package_path)
-
-        if not hasattr(impl_mod, config.init.func_name):
+        if not _has_func(
+            config.init.package_path, config.init.func_name, index
+        ):
             logging.warn(
                 f"could not find init function for {config.module_name}"
             )
@@ -307,17 +333,71 @@ def discover_module_name_and_postfix(module: str, config: Config):
     return module_name, postfix
 
 
+def discover_func_name(
+    module: str, postfix: str, config: Benchmark, names: set[str]
+) -> Union[str, None]:
+    """Discover name of the implementation function.
+
+    Args:
+        module: Name of the root python module (either python file or top level
+            folder for sycl).
+        postfix: Implementation postfix.
+        config: Benchmark configuration.
+        names: Names defined by the implementation module.
+
+    Returns: function name or None if module does not define any of the
+        expected names.
+    """
+    for func in [
+        module,
+        f"{module}_{postfix}",
+        config.module_name,
+        f"{config.module_name}_{postfix}",
+        "kernel",
+        re.sub(r"[0-9]", "", config.module_name),
+    ]:
+        if func in names:
+            return func
+
+    return None
+
+
+def _has_func(package_path: str, func_name: str, index: ModuleIndex) -> bool:
+    """Checks that module defines the function without importing it.
+
+    Function is assumed to exist if it can not be figured out from the source.
+    """
+    location = find_module_location(package_path)
+    if location is None:
+        return False
+    if os.path.isdir(location):
+        location = os.path.join(location, "__init__.py")
+        if not os.path.isfile(location):
+            return False
+
+    names = (index or ModuleIndex()).names(location)
+
+    return names is None or func_name in names
+
+
 def read_benchmark_implementations(
     config: Benchmark,
     implementations: set[str] = None,
+    index: ModuleIndex = None,
 ) -> None:
     """Read and discover implementation modules and functions.
 
+    Implementation modules are not imported. Their functions are discovered
+    by parsing the source code, so importing of the frameworks is postponed
+    until the implementation gets executed. Functions of extension modules
+    are discovered on import.
+
     Args:
         config: Benchmark configuration object where settings should be
             populated.
-        implementations: List of postfixes to import. It does not affect
-            initialization import.
+        implementations: List of postfixes to discover. It does not affect
+            initialization discovery.
+        index: Index of module names. Default one is used if not set.
 
     Raises:
         RuntimeError: Implementation file does not match any known postfix.
@@ -325,22 +405,21 @@ def read_benchmark_implementations(
     if config.implementations:
         return
 
-    try:
-        mod = importlib.import_module(config.package_path)
-    except ModuleNotFoundError:
+    if index is None:
+        index = ModuleIndex()
+
+    package_dir = find_module_location(config.package_path)
+    if package_dir is None or not os.path.isdir(package_dir):
         logging.warning(f"Module not found: {config.package_path}")
         return
 
     modules: list[str] = [
-        name
-        for _, name, _ in pkgutil.iter_modules(
-            mod.__spec__.submodule_search_locations
-        )
+        name for _, name, _ in pkgutil.iter_modules([package_dir])
     ]
 
-    setup_init(config, modules)
+    setup_init(config, modules, index)
     set_default_reference_implementation_postfix(config, modules)
-    set_validate_func(config, modules)
+    set_validate_func(config, modules, index)
 
     for module in modules:
         module_name, postfix = discover_module_name_and_postfix(module, config)
@@ -348,35 +427,26 @@ def read_benchmark_implementations(
         if (
             implementations
             and (postfix not in implementations)
-            and (postfix != config.reference_implementation_postfix)
+            and (postfix not in config.get_reference_implementation_postfixes())
             or (config.init and config.init.module_name.endswith(module_name))
         ):
             continue
 
-        func_name: str = None
         package_path: str = f"{config.package_path}.{module_name}"
 
-        try:
-            impl_mod = importlib.import_module(package_path)
-
-            for func in [
-                module,
-                f"{module}_{postfix}",
-                config.module_name,
-                f"{config.module_name}_{postfix}",
-                "kernel",
-                re.sub(r"[0-9]", "", config.module_name),
-            ]:
-                if hasattr(impl_mod, func):
-                    func_name = func
-                    break
-        except Exception as e:
-            logging.warn(f"Could not import module: {e}")
-            import traceback
-
-            traceback.print_exc()
+        location = find_module_location(package_path)
+        if location is None or os.path.isdir(location):
+            logging.warn(f"Could not find module: {package_path}")
             continue
 
+        names = index.names(location)
+        # Empty name means it is unknown until the module gets imported.
+        func_name: str = (
+            discover_func_name(module, postfix, config, names)
+            if names is not None
+            else ""
+        )
+
         config.implementations.append(
             BenchmarkImplementation(
                 postfix=postfix,
@@ -390,6 +460,7 @@ def read_benchmark_implementations(
 def set_validate_func(
     config: Benchmark,
     modules: set[str] = None,
+    index: ModuleIndex = None,
 ):
     """Read, discover and populate config with validation module and function.
 
@@ -402,9 +473,11 @@ def set_validate_func(
         config: Benchmark configuration object where settings should be
             populated.
         modules: List of available modules for the benchmark to find init.
+        index: Index of module names used to check the validation function
+            without importing the module.
     """
     if config.validate_package_path != "":
-        if importlib.util.find_spec(config.validate_package_path) is None:
+        if find_module_location(config.validate_package_path) is None:
             logging.fatal(
                 f"validation package path is specified but not found for {config.module_name}"
             )
@@ -421,12 +494,12 @@ def set_validate_func(
 
         config.validate_package_path = validate_package_path
 
-    val_mod = importlib.import_module(config.validate_package_path)
-
-    if not hasattr(val_mod, config.validate_func_name):
+    if not _has_func(
+        config.validate_package_path, config.validate_func_name, index
+    ):
         logging.fatal(
             f"validation function '{config.validate_func_name}' not found for "
-            + f"{config.module_name} at '{validate_package_path}'"
+            + f"{config.module_name} at '{config.validate_package_path}'"
         )
 
 
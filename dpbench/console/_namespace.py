@@ -26,14 +26,41 @@ class Namespace(argparse.Namespace):
     last_run: bool
     results_db: str
     save: bool
-    repeat: int
+    repeat: Union[int, str]
+    target_ci: float
+    min_repeat: int
+    max_repeat: int
+    time_budget: float
+    profile_memory: bool
+    perf_counters: bool
     timeout: float
+    jobs: int
+    cpus_per_job: Union[int, None]
     precision: Union[str, None]
     program: str
     color: str
     comparisons: list[str]
     log_level: str
     skip_expected_failures: bool
+    cache_dir: Union[str, None]
+    input_cache: bool
+    reference_cache: bool
+    shared_inputs: bool
+    cache_size: Union[int, None]
+    action: str
+    baseline: int
+    candidate: Union[int, None]
+    threshold: float
+    alpha: float
+    stream_size: int
+    matrix_size: int
+    jit_cache: bool
+    workers: Union[str, None]
+    address: str
+    path: str
+    paths: list[str]
+    format: str
+    host: Union[str, None]
 
 
 class CommaSeparateStringAction(argparse.Action):
@@ -56,3 +83,11 @@ class CommaSeparateStringListAction(argparse.Action):
     def __call__(self, _, namespace, values, __):
         """Split values into list of strings."""
         setattr(namespace, self.dest, values.split(","))
+
+
+def percentage(value: str) -> float:
+    """Reads percentage like 2% or fraction like 0.02."""
+    if value.endswith("%"):
+        return float(value[:-1]) / 100
+
+    return float(value)
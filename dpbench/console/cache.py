@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Cache subcommand package."""
+
+import argparse
+
+from ._namespace import Namespace
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the cache subcommand.
+
+    Args:
+        parser: argument parser where arguments will be populated.
+    """
+    parser.add_argument(
+        "action",
+        choices=["ls", "clear"],
+        type=str,
+        help="List cached entries or remove them. Use --benchmarks to"
+        + " restrict the action to specific benchmarks.",
+    )
+
+
+def execute_cache(args: Namespace):
+    """Execute cache sub command.
+
+    Lists or clears entries of the persistent benchmark data cache.
+
+    Args:
+        args: object with all input arguments.
+    """
+    from dpbench.infrastructure.data_cache import DataCache, format_last_used
+
+    cache = DataCache(args.cache_dir)
+
+    if args.action == "clear":
+        removed = cache.clear(benchmarks=args.benchmarks)
+        print(f"Removed {removed} entries from {cache.path}")
+        return
+
+    entries = [
+        entry
+        for entry in cache.entries()
+        if not args.benchmarks or entry.benchmark in args.benchmarks
+    ]
+
+    print(f"Cache {cache.path}")
+    for entry in sorted(entries, key=lambda e: (e.benchmark, e.kind)):
+        print(
+            f"{entry.key[:12]} {entry.kind:<10} {entry.benchmark:<24}"
+            + f" {entry.preset:<6} {entry.precision:<7}"
+            + f" {entry.size / (1024 * 1024):>10.1f}MB"
+            + f" {format_last_used(entry.last_used)}"
+        )
+    print(
+        f"Total: {len(entries)} entries,"
+        + f" {sum(e.size for e in entries) / (1024 * 1024):.1f}MB"
+    )
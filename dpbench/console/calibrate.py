@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Calibrate subcommand package."""
+
+import argparse
+import platform
+
+import sqlalchemy
+
+from ._namespace import Namespace
+
+
+def add_calibrate_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the calibrate subcommand.
+
+    Args:
+        parser: argument parser where arguments will be populated.
+    """
+    parser.add_argument(
+        "--stream-size",
+        type=int,
+        default=1 << 25,
+        help="Number of double precision elements in each array of the"
+        + " STREAM triad. Arrays must be much larger than last level cache.",
+    )
+    parser.add_argument(
+        "--matrix-size",
+        type=int,
+        default=4096,
+        help="Size of square matrices used to measure peak FLOP/s.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Number of repetitions of each measurement. The best one is"
+        + " stored.",
+    )
+
+
+def execute_calibrate(args: Namespace, conn: sqlalchemy.Engine):
+    """Execute calibrate sub command.
+
+    Measures host memory bandwidth and peak floating point rate and stores
+    them into the database, so reports can show percent of peak.
+
+    Args:
+        args: object with all input arguments.
+        conn: database connection.
+    """
+    import dpbench.infrastructure as dpbi
+    from dpbench.infrastructure.calibration import (
+        measure_peak_flops,
+        measure_stream_bandwidth,
+    )
+
+    stream_bandwidth = measure_stream_bandwidth(args.stream_size, args.repeat)
+    print(f"STREAM triad bandwidth: {round(stream_bandwidth / 1e9, 2)} GB/s")
+
+    peak_flops = measure_peak_flops(args.matrix_size, args.repeat)
+    print(f"Peak floating point rate: {round(peak_flops / 1e9, 2)} GFLOP/s")
+
+    dpbi.store_calibration(
+        conn,
+        dpbi.Calibration(
+            hostname=platform.node(),
+            stream_bandwidth=stream_bandwidth,
+            peak_flops=peak_flops,
+        ),
+    )
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare subcommand package."""
+
+import argparse
+
+import sqlalchemy
+
+from ._namespace import Namespace, percentage
+
+
+def add_compare_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the compare subcommand.
+
+    Args:
+        parser: argument parser where arguments will be populated.
+    """
+    parser.add_argument(
+        "--baseline",
+        type=int,
+        required=True,
+        help="run_id of the baseline run.",
+    )
+    parser.add_argument(
+        "--candidate",
+        type=int,
+        nargs="?",
+        default=None,
+        help="run_id of the candidate run. Leave empty to use the latest run.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=percentage,
+        default="5%",
+        help="Minimum slowdown of the median to be reported as regression."
+        + " Either percentage like 5% or fraction like 0.05.",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        nargs="?",
+        default=0.05,
+        help="Significance level of the Mann-Whitney U test.",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        default=False,
+        help="Sets the comparison report to output in CSV format",
+    )
+
+
+def execute_compare(args: Namespace, conn: sqlalchemy.Engine):
+    """Execute compare sub command.
+
+    Compares two runs and fails if candidate run has significant performance
+    regressions, so it can be used for CI gating.
+
+    Args:
+        args: object with all input arguments.
+        conn: database connection.
+    """
+    from dpbench.infrastructure.reporter import (
+        generate_regression_report,
+        update_run_id,
+    )
+
+    candidate = update_run_id(conn, args.candidate)
+
+    regressions = generate_regression_report(
+        conn,
+        baseline_run_id=args.baseline,
+        candidate_run_id=candidate,
+        threshold=args.threshold,
+        alpha=args.alpha,
+        report_csv=args.csv,
+    )
+
+    if len(regressions) > 0:
+        raise ValueError(
+            f"Performance regressions detected: {regressions}.",
+        )
@@ -13,9 +13,16 @@ from ._namespace import (
     CommaSeparateStringListAction,
     Namespace,
 )
+from .cache import add_cache_arguments, execute_cache
+from .calibrate import add_calibrate_arguments, execute_calibrate
+from .compare import add_compare_arguments, execute_compare
 from .config import add_config_arguments, execute_config
+from .export import add_export_arguments, execute_export
+from .import_ import add_import_arguments, execute_import
+from .prime import add_prime_arguments, execute_prime
 from .report import add_report_arguments, execute_report
 from .run import add_run_arguments, execute_run
+from .serve import add_serve_arguments, execute_serve
 
 
 def parse_args() -> Namespace:
@@ -75,6 +82,14 @@ def parse_args() -> Namespace:
         default="results.db",
         help="Path to a database to store results.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Path to a directory with cached benchmark data. Defaults to"
+        + " DPBENCH_CACHE_DIR environment variable or ~/.cache/dpbench.",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -106,9 +121,82 @@ def parse_args() -> Namespace:
 
     add_config_arguments(config_parser)
 
+    compare_parser = subparsers.add_parser(
+        "compare",
+        description="Subcommand to detect performance regressions between"
+        + " two runs.",
+    )
+
+    add_compare_arguments(compare_parser)
+
+    cache_parser = subparsers.add_parser(
+        "cache",
+        description="Subcommand to manage cached benchmark data.",
+    )
+
+    add_cache_arguments(cache_parser)
+
+    calibrate_parser = subparsers.add_parser(
+        "calibrate",
+        description="Subcommand to measure host peak memory bandwidth and"
+        + " floating point rate.",
+    )
+
+    add_calibrate_arguments(calibrate_parser)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        description="Subcommand to run long-lived framework workers, that"
+        + " runs attach to with --workers.",
+    )
+
+    add_serve_arguments(serve_parser)
+
+    prime_parser = subparsers.add_parser(
+        "prime",
+        description="Subcommand to compile JIT implementations into the"
+        + " cache ahead of time.",
+    )
+
+    add_prime_arguments(prime_parser)
+
+    export_parser = subparsers.add_parser(
+        "export",
+        description="Subcommand to export results into partitioned columnar"
+        + " datasets.",
+    )
+
+    add_export_arguments(export_parser)
+
+    import_parser = subparsers.add_parser(
+        "import",
+        description="Subcommand to merge results exported from other hosts"
+        + " into the database.",
+    )
+
+    add_import_arguments(import_parser)
+
     return parser.parse_args(namespace=Namespace())
 
 
+# Subcommands that work with the results database
+_DB_PROGRAMS = {
+    "run": execute_run,
+    "report": execute_report,
+    "compare": execute_compare,
+    "calibrate": execute_calibrate,
+    "export": execute_export,
+    "import": execute_import,
+}
+
+_PROGRAMS = {
+    "config": execute_config,
+    "cache": execute_cache,
+    "serve": execute_serve,
+    "prime": execute_prime,
+}
+
+
 def main():
     """Main function to run on dpbench console tool."""
     args = parse_args()
@@ -116,7 +204,7 @@ def main():
     logging.root.setLevel(args.log_level.upper())
 
     conn = None
-    if args.program == "report" or args.program == "run" and args.save:
+    if args.program in _DB_PROGRAMS and (args.program != "run" or args.save):
         import dpbench.infrastructure as dpbi
         from dpbench.infrastructure.reporter import update_run_id
 
@@ -130,12 +218,10 @@ def main():
 
     if args.all_implementations:
         args.implementations = {}
-    if args.program == "run":
-        execute_run(args, conn)
-    elif args.program == "report":
-        execute_report(args, conn)
-    elif args.program == "config":
-        execute_config(args)
+    if args.program in _DB_PROGRAMS:
+        _DB_PROGRAMS[args.program](args, conn)
+    elif args.program in _PROGRAMS:
+        _PROGRAMS[args.program](args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Export subcommand package."""
+
+import argparse
+import importlib.util
+import logging
+
+import sqlalchemy
+
+from ._namespace import Namespace
+
+
+def add_export_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the export subcommand.
+
+    Args:
+        parser: argument parser where arguments will be populated.
+    """
+    parser.add_argument(
+        "path",
+        type=str,
+        help="Directory of the dataset to export to. Runs that are already"
+        + " in the dataset are skipped, so the same directory can be used"
+        + " for every export.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["parquet", "arrow"],
+        type=str,
+        default="parquet",
+        help="Format of the dataset files.",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=None,
+        help="Host name to export runs that have no host recorded with."
+        + " Defaults to the name of this host.",
+    )
+
+
+def execute_export(args: Namespace, conn: sqlalchemy.Engine):
+    """Execute export sub command.
+
+    Exports runs, postfixes, results and samples into columnar datasets
+    partitioned by date, host and benchmark. Exports only --run-id if it is
+    set.
+
+    Args:
+        args: object with all input arguments.
+        conn: database connection.
+    """
+    if not importlib.util.find_spec("pyarrow"):
+        logging.error(
+            "pyarrow not found. Install it using pip/conda etc to export"
+            + " results."
+        )
+        return
+
+    from dpbench.infrastructure.columnar import export_results
+
+    exported = export_results(
+        conn,
+        args.path,
+        format=args.format,
+        hostname=args.host,
+        run_id=args.run_id,
+    )
+
+    print(f"Exported {exported} runs to {args.path}")
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Import subcommand package."""
+
+import argparse
+import importlib.util
+import logging
+
+import sqlalchemy
+
+from ._namespace import Namespace
+
+
+def add_import_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the import subcommand.
+
+    Args:
+        parser: argument parser where arguments will be populated.
+    """
+    parser.add_argument(
+        "paths",
+        type=str,
+        nargs="+",
+        help="Directories of the datasets created by export to import from.",
+    )
+
+
+def execute_import(args: Namespace, conn: sqlalchemy.Engine):
+    """Execute import sub command.
+
+    Merges runs exported from any number of hosts into the database. Both
+    parquet and arrow files are read. Runs are matched by their host and id
+    on that host, so runs that were imported before are skipped.
+
+    Args:
+        args: object with all input arguments.
+        conn: database connection.
+    """
+    if not importlib.util.find_spec("pyarrow"):
+        logging.error(
+            "pyarrow not found. Install it using pip/conda etc to import"
+            + " results."
+        )
+        return
+
+    from dpbench.infrastructure.columnar import import_results
+
+    for path in args.paths:
+        imported = import_results(conn, path)
+
+        print(f"Imported {imported} runs from {path}")
@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Prime subcommand package."""
+
+import argparse
+
+from ._namespace import Namespace
+
+# Frameworks whose implementations get JIT compiled by numba
+_JIT_FRAMEWORKS = {"NumbaFramework", "NumbaDpexFramework", "NumbaMlirFramework"}
+
+
+def add_prime_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the prime subcommand.
+
+    Args:
+        parser: argument parser where arguments will be populated.
+    """
+    parser.add_argument(
+        "-p",
+        "--preset",
+        type=str,
+        nargs="?",
+        default="S",
+        help="Preset to compile kernels for. Compiled kernels depend only on"
+        + " argument types, so the smallest preset is enough.",
+    )
+    parser.add_argument(
+        "--dpbench",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Set if run dpbench benchmarks.",
+    )
+    parser.add_argument(
+        "--npbench",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if run npbench benchmarks.",
+    )
+    parser.add_argument(
+        "--polybench",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if run polybench benchmarks.",
+    )
+    parser.add_argument(
+        "--rodinia",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if run rodinia benchmarks.",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["single", "double"],
+        type=str,
+        nargs="?",
+        default=None,
+        help="Data precision to compile kernels for.",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        nargs="?",
+        default=600.0,
+        help="Timeout time in seconds for compilation of each benchmark.",
+    )
+    parser.add_argument(
+        "--sycl-device",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Sycl device to overwrite for framework configurations.",
+    )
+
+
+def execute_prime(args: Namespace):
+    """Execute prime sub command.
+
+    Compiles numba, numba_dpex and numba_mlir implementations into the JIT
+    cache at --cache-dir by executing each of them once. Only JIT compiled
+    implementations out of --implementations are primed, if there are none
+    all of them are.
+
+    Args:
+        args: object with all input arguments.
+    """
+    import dpbench.config as cfg
+    from dpbench.infrastructure.benchmark_runner import (
+        BenchmarkRunner,
+        RunConfig,
+    )
+    from dpbench.infrastructure.enums import ErrorCodes
+    from dpbench.infrastructure.jit_cache import enable_jit_cache
+
+    cache_dir = enable_jit_cache(args.cache_dir)
+
+    cfg.GLOBAL = cfg.read_configs(
+        benchmarks=args.benchmarks,
+        no_dpbench=not args.dpbench,
+        with_npbench=args.npbench,
+        with_polybench=args.polybench,
+        with_rodinia=args.rodinia,
+    )
+
+    frameworks = {
+        postfix.postfix: framework
+        for framework in cfg.GLOBAL.frameworks
+        if framework.class_ in _JIT_FRAMEWORKS
+        for postfix in framework.postfixes
+    }
+
+    if args.sycl_device:
+        for framework in frameworks.values():
+            framework.sycl_device = args.sycl_device
+
+    implementations = [
+        impl for impl in args.implementations if impl in frameworks
+    ] or list(frameworks.keys())
+
+    print(f"Priming JIT cache at {cache_dir}")
+
+    runner = BenchmarkRunner()
+    primed, failed = 0, 0
+
+    for benchmark in cfg.GLOBAL.benchmarks:
+        for implementation in implementations:
+            rc = RunConfig(
+                benchmark=benchmark,
+                framework=frameworks[implementation],
+                implementation=implementation,
+                preset=args.preset,
+                repeat=1,
+                validate=False,
+                timeout=args.timeout,
+                precision=args.precision,
+                print_results=False,
+                skip_expected_failures=True,
+            )
+
+            results = runner.run_benchmark_in_sub_process(rc)
+
+            if results.error_state == ErrorCodes.SUCCESS:
+                primed += 1
+            elif results.error_state != ErrorCodes.UNIMPLEMENTED:
+                failed += 1
+
+    runner.close_connections()
+
+    print(f"Primed {primed} implementations, {failed} failed")
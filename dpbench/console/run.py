@@ -6,16 +6,26 @@
 
 import argparse
 import logging
+import signal
+import sys
+from typing import Union
 
 import sqlalchemy
 
 import dpbench.config as cfg
 import dpbench.infrastructure as dpbi
-from dpbench.infrastructure.benchmark_runner import BenchmarkRunner, RunConfig
-from dpbench.infrastructure.datamodel import Postfix, store_postfix
+from dpbench.infrastructure.benchmark_runner import (
+    AdaptiveRepeat,
+    BenchmarkRunner,
+    RunConfig,
+    split_cpus,
+)
+from dpbench.infrastructure.datamodel import Postfix, ResultsWriter
 from dpbench.infrastructure.frameworks.fabric import build_framework
+from dpbench.infrastructure.jit_cache import enable_jit_cache
+from dpbench.infrastructure.worker_pool import DEFAULT_ADDRESS
 
-from ._namespace import Namespace
+from ._namespace import Namespace, percentage
 
 
 def add_run_arguments(parser: argparse.ArgumentParser):
@@ -27,11 +37,12 @@ def add_run_arguments(parser: argparse.ArgumentParser):
     parser.add_argument(
         "-p",
         "--preset",
-        choices=["S", "M16Gb", "M", "L"],
+        choices=["S", "M16Gb", "M", "L", "XL"],
         type=str,
         nargs="?",
         default="S",
-        help="Preset to use for benchmark execution.",
+        help="Preset to use for benchmark execution. XL preset is defined"
+        + " only for benchmarks with scalable implementations.",
     )
     parser.add_argument(
         "-s",
@@ -67,10 +78,43 @@ def add_run_arguments(parser: argparse.ArgumentParser):
     parser.add_argument(
         "-r",
         "--repeat",
-        type=int,
+        type=_repeat,
         nargs="?",
         default=10,
-        help="Number of repeats for each benchmark.",
+        help="Number of repeats for each benchmark. Use 'auto' to repeat"
+        + " until the confidence interval of the median is within"
+        + " --target-ci.",
+    )
+    parser.add_argument(
+        "--target-ci",
+        type=percentage,
+        nargs="?",
+        default="2%",
+        help="Target half-width of the 95% confidence interval of the median"
+        + " execution time relative to the median for --repeat auto. Either"
+        + " percentage like 2% or fraction like 0.02.",
+    )
+    parser.add_argument(
+        "--min-repeat",
+        type=int,
+        nargs="?",
+        default=5,
+        help="Minimum number of repeats for --repeat auto.",
+    )
+    parser.add_argument(
+        "--max-repeat",
+        type=int,
+        nargs="?",
+        default=1000,
+        help="Maximum number of repeats for --repeat auto.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        nargs="?",
+        default=60.0,
+        help="Wall clock time budget in seconds for repeats of each benchmark"
+        + " for --repeat auto. Keep it below --timeout.",
     )
     parser.add_argument(
         "-t",
@@ -80,6 +124,38 @@ def add_run_arguments(parser: argparse.ArgumentParser):
         default=200.0,
         help="Timeout time in seconds for each benchmark execution.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        nargs="?",
+        default=1,
+        help="Number of benchmarks to execute simultaneously. Each job is"
+        + " pinned to its own set of CPUs.",
+    )
+    parser.add_argument(
+        "--cpus-per-job",
+        type=_positive_int,
+        nargs="?",
+        default=None,
+        help="Number of CPUs each job is pinned to. Leave empty to split"
+        + " available CPUs evenly between jobs.",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if peak memory usage of each execution phase is tracked."
+        + " It slows down memory allocations and affects timings.",
+    )
+    parser.add_argument(
+        "--perf-counters",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if hardware performance counters (cycles, instructions,"
+        + " cache and branch misses) are collected during timed repetitions."
+        + " Requires Linux perf_event_open to be permitted.",
+    )
     parser.add_argument(
         "--precision",
         choices=["single", "double"],
@@ -107,6 +183,53 @@ def add_run_arguments(parser: argparse.ArgumentParser):
         default=None,
         help="Sycl device to overwrite for framework configurations.",
     )
+    parser.add_argument(
+        "--input-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if generated input data is stored in and loaded from the"
+        + " persistent cache at --cache-dir.",
+    )
+    parser.add_argument(
+        "--reference-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if reference implementation output is computed once and"
+        + " stored in the persistent cache at --cache-dir for validation.",
+    )
+    parser.add_argument(
+        "--shared-inputs",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if input data is generated once by the main process and"
+        + " shared with framework processes through shared memory.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        nargs="?",
+        default=None,
+        help="Maximum size of the cache in bytes. Least recently used entries"
+        + " get evicted once it is exceeded.",
+    )
+    parser.add_argument(
+        "--jit-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if JIT compiled kernels are stored in and loaded from the"
+        + " cache at --cache-dir. Use prime subcommand to fill it ahead of"
+        + " time.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=str,
+        nargs="?",
+        default=None,
+        const=DEFAULT_ADDRESS,
+        help="Attach to long-lived framework workers started by serve"
+        + " subcommand instead of spawning new processes. Optional value is"
+        + " the socket path of the workers.",
+    )
     parser.add_argument(
         "--skip-expected-failures",
         action=argparse.BooleanOptionalAction,
@@ -115,6 +238,35 @@ def add_run_arguments(parser: argparse.ArgumentParser):
     )
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+
+    return number
+
+
+def _repeat(value: str) -> Union[int, str]:
+    if value == "auto":
+        return value
+
+    return int(value)
+
+
+def _adaptive_repeat(args: Namespace) -> Union[AdaptiveRepeat, None]:
+    if args.repeat != "auto":
+        return None
+
+    adaptive_repeat = AdaptiveRepeat(
+        target_ci=args.target_ci,
+        min_repeat=args.min_repeat,
+        max_repeat=args.max_repeat,
+        time_budget=args.time_budget,
+    )
+
+    return adaptive_repeat
+
+
 def _find_framework_config(implementation: str) -> cfg.Framework:
     framework = None
 
@@ -153,11 +305,43 @@ def execute_run(args: Namespace, conn: sqlalchemy.Engine):
         for framework in cfg.GLOBAL.frameworks:
             framework.sycl_device = args.sycl_device
 
+    # Fails before the run gets created if CPUs can not be split.
+    if args.jobs > 1:
+        split_cpus(args.jobs, args.cpus_per_job)
+
     if args.save and args.run_id is None:
         args.run_id = dpbi.create_run(conn)
 
-    runner = BenchmarkRunner()
+    if args.jit_cache:
+        enable_jit_cache(args.cache_dir)
+
+    # Results are committed in bulk, so pending ones must be flushed if run
+    # gets interrupted.
+    results_writer = ResultsWriter(conn) if conn else None
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(1))
+
+    runner = BenchmarkRunner(
+        jobs=args.jobs,
+        cpus_per_job=args.cpus_per_job,
+        workers_address=args.workers,
+        results_writer=results_writer,
+    )
+
+    try:
+        _run_benchmarks(args, conn, runner, results_writer)
+    finally:
+        runner.close_connections()
 
+        if results_writer:
+            results_writer.close()
+
+
+def _run_benchmarks(
+    args: Namespace,
+    conn: sqlalchemy.Engine,
+    runner: BenchmarkRunner,
+    results_writer: Union[ResultsWriter, None],
+):
     implementation_descriptions = {
         impl.postfix: impl.description for impl in cfg.GLOBAL.implementations
     }
@@ -172,22 +356,28 @@ def execute_run(args: Namespace, conn: sqlalchemy.Engine):
 
         framework = build_framework(framework_config)
 
-        store_postfix(
-            conn=conn,
-            postfix=Postfix(
-                run_id=args.run_id,
-                postfix=implementation,
-                description=implementation_descriptions[implementation],
-                device=framework.device_info,
-            ),
-        )
+        if results_writer:
+            results_writer.store_postfix(
+                Postfix(
+                    run_id=args.run_id,
+                    postfix=implementation,
+                    description=implementation_descriptions[implementation],
+                    device=framework.device_info,
+                ),
+            )
+
+    adaptive_repeat = _adaptive_repeat(args)
+    repeat = adaptive_repeat.max_repeat if adaptive_repeat else args.repeat
+
+    run_configs: list[RunConfig] = []
 
     for benchmark in cfg.GLOBAL.benchmarks:
-        print("")
-        print(
-            f"================ Benchmark {benchmark.name} ({benchmark.module_name}) ========================"
-        )
-        print("")
+        if args.jobs == 1:
+            print("")
+            print(
+                f"================ Benchmark {benchmark.name} ({benchmark.module_name}) ========================"
+            )
+            print("")
 
         for implementation in args.implementations:
             framework = _find_framework_config(implementation)
@@ -195,25 +385,40 @@ def execute_run(args: Namespace, conn: sqlalchemy.Engine):
             if not framework:
                 continue
 
+            rc = RunConfig(
+                conn=conn,
+                benchmark=benchmark,
+                framework=framework,
+                implementation=implementation,
+                preset=args.preset,
+                repeat=repeat,
+                adaptive_repeat=adaptive_repeat,
+                profile_memory=args.profile_memory,
+                perf_counters=args.perf_counters,
+                validate=args.validate,
+                timeout=args.timeout,
+                precision=args.precision,
+                print_results=args.print_results,
+                run_id=args.run_id,
+                skip_expected_failures=args.skip_expected_failures,
+                cache_dir=args.cache_dir,
+                input_cache=args.input_cache,
+                reference_cache=args.reference_cache,
+                cache_size=args.cache_size,
+                shared_inputs=args.shared_inputs,
+            )
+
+            if args.jobs > 1:
+                run_configs.append(rc)
+                continue
+
             logging.info(
                 f"Running {benchmark.module_name} ({implementation}) on {framework.simple_name}"
             )
 
-            runner.run_benchmark_and_save(
-                RunConfig(
-                    conn=conn,
-                    benchmark=benchmark,
-                    framework=framework,
-                    implementation=implementation,
-                    preset=args.preset,
-                    repeat=args.repeat,
-                    validate=args.validate,
-                    timeout=args.timeout,
-                    precision=args.precision,
-                    print_results=args.print_results,
-                    run_id=args.run_id,
-                    skip_expected_failures=args.skip_expected_failures,
-                )
-            )
+            runner.run_benchmark_and_save(rc)
+
+        runner.release_inputs()
 
-    runner.close_connections()
+    if run_configs:
+        runner.run_benchmarks_and_save(run_configs)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Serve subcommand package."""
+
+import argparse
+import signal
+import sys
+
+from ._namespace import Namespace
+
+
+def add_serve_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the serve subcommand.
+
+    Args:
+        parser: argument parser where arguments will be populated.
+    """
+    from dpbench.infrastructure.worker_pool import DEFAULT_ADDRESS
+
+    parser.add_argument(
+        "--address",
+        type=str,
+        default=DEFAULT_ADDRESS,
+        help="Path to the socket to listen on.",
+    )
+    parser.add_argument(
+        "--jit-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Set if workers store JIT compiled kernels in and load them"
+        + " from the cache at --cache-dir.",
+    )
+
+
+def execute_serve(args: Namespace):
+    """Execute serve sub command.
+
+    Runs pool of long-lived framework workers until interrupted. Runs attach
+    to it with ``dpbench run --workers``.
+
+    Args:
+        args: object with all input arguments.
+    """
+    from dpbench.infrastructure.jit_cache import enable_jit_cache
+    from dpbench.infrastructure.worker_pool import WorkerPool
+
+    if args.jit_cache:
+        enable_jit_cache(args.cache_dir)
+
+    # Stop workers and remove the socket on termination as well.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    pool = WorkerPool(args.address)
+    print(f"Serving framework workers at {pool.address}")
+
+    try:
+        pool.serve()
+    except KeyboardInterrupt:
+        pass
@@ -6,11 +6,15 @@ from .benchmark import Benchmark
 from .benchmark_results import BenchmarkResults
 from .datamodel import (
     Base,
+    Calibration,
     Result,
+    ResultSamples,
+    ResultsWriter,
     Run,
     create_connection,
     create_results_table,
     create_run,
+    store_calibration,
     store_results,
 )
 from .frameworks import (
@@ -25,8 +29,14 @@ from .frameworks import (
 )
 from .reporter import (
     generate_comparison_report,
+    generate_compile_time_report,
+    generate_counters_report,
     generate_impl_summary_report,
+    generate_memory_report,
     generate_performance_report,
+    generate_regression_report,
+    generate_statistics_report,
+    generate_throughput_report,
     get_unexpected_failures,
 )
 
@@ -34,6 +44,8 @@ __all__ = [
     "Base",
     "Run",
     "Result",
+    "ResultSamples",
+    "Calibration",
     "Benchmark",
     "BenchmarkResults",
     "Framework",
@@ -48,8 +60,16 @@ __all__ = [
     "create_results_table",
     "create_run",
     "store_results",
+    "ResultsWriter",
+    "store_calibration",
     "generate_impl_summary_report",
     "generate_performance_report",
     "generate_comparison_report",
+    "generate_statistics_report",
+    "generate_regression_report",
+    "generate_memory_report",
+    "generate_counters_report",
+    "generate_throughput_report",
+    "generate_compile_time_report",
     "get_unexpected_failures",
 ]
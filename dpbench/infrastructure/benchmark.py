@@ -11,6 +11,10 @@ from typing import Any, Dict
 import numpy as np
 
 import dpbench.config as cfg
+from dpbench.config.reader import discover_func_name
+
+from .data_cache import DataCache, source_fingerprint
+from .jit_cache import cache_dispatchers
 
 
 class Benchmark(object):
@@ -74,7 +78,14 @@ class Benchmark(object):
 
         try:
             mod = importlib.import_module(implementation.package_path)
-            implementation_function = getattr(mod, implementation.func_name)
+            cache_dispatchers(mod)
+            func_name = implementation.func_name or discover_func_name(
+                implementation.module_name.split(".")[0],
+                implementation.postfix,
+                self.info,
+                set(dir(mod)),
+            )
+            implementation_function = getattr(mod, func_name)
         except Exception:
             logging.error(
                 f"Failed to import benchmark module: {implementation.module_name}"
@@ -158,7 +169,7 @@ class Benchmark(object):
         return self.bdata[preset]
 
     def initialize_input_data(
-        self, preset: str, global_precision: str
+        self, preset: str, global_precision: str, cache: DataCache = None
     ) -> Dict[str, Any]:
         """Initializes the benchmark data.
 
@@ -166,6 +177,8 @@ class Benchmark(object):
            preset: The data-size preset (S, M, L).
            framework: A Framework for which the data is initialized.
            global_precision: The precision to use for benchmark data.
+           cache: Cache to load generated data from. If data is not in the
+               cache yet, it is generated and stored there.
 
         Returns: Dictionary with benchmark inputs as key
                  and initialized data as value.
@@ -190,7 +203,9 @@ class Benchmark(object):
         for k, v in parameters.items():
             data[k] = v
 
-        self._initialize_input_data_from_init(global_precision, data)
+        self._initialize_input_data_from_init(
+            global_precision, data, preset, cache
+        )
 
         # 8. Update the benchmark data (self.bdata) with the generated data
         #    for the provided preset.
@@ -201,6 +216,8 @@ class Benchmark(object):
         self,
         global_precision: str,
         data: str,
+        preset: str = None,
+        cache: DataCache = None,
     ):
         """Population benchmark data with outputs from initialization function.
 
@@ -209,6 +226,7 @@ class Benchmark(object):
            framework: A Framework for which the data is initialized.
            global_precision: The precision to use for benchmark data.
            data: Dictionary to put data into.
+           cache: Cache to load generated data from.
 
         Returns: Dictionary with benchmark inputs as key
                  and initialized data as value.
@@ -222,14 +240,61 @@ class Benchmark(object):
                 global_precision, self.info.init.precision
             )
 
+        if cache:
+            self._initialize_input_data_from_cache(
+                global_precision, data, preset, cache
+            )
+            return
+
+        self._generate_input_data(global_precision, data)
+
+    def _initialize_input_data_from_cache(
+        self,
+        global_precision: str,
+        data: Dict[str, Any],
+        preset: str,
+        cache: DataCache,
+    ):
+        """Population benchmark data from the cache. Data is generated and
+        stored in the cache if it is not there yet.
+
+        Args:
+           global_precision: The precision to use for benchmark data.
+           data: Dictionary to put data into.
+           preset: The data-size preset (S, M, L).
+           cache: Cache to load generated data from.
+        """
+        cache_key = self.input_cache_key(preset, global_precision)
+        cached_output = cache.load("inputs", cache_key)
+
+        if cached_output is not None:
+            data.update(cached_output)
+            return
+
+        self._generate_input_data(global_precision, data)
+
+        cache.store(
+            "inputs",
+            cache_key,
+            {out: data[out] for out in self.info.init.output_args},
+            benchmark=self.bname,
+            preset=preset,
+            precision=global_precision or self.info.init.precision,
+        )
+
+    def _generate_input_data(self, global_precision: str, data: Dict[str, Any]):
+        """Population benchmark data with outputs from initialization function.
+
+        Args:
+           global_precision: The precision to use for benchmark data.
+           data: Dictionary with preset parameters to put data into.
+        """
         # 5. Call the initialize_fn with the input args and store the results
         #    in the "data" dict.
-        init_input_args_list = self.info.init.input_args
-        init_input_args_val_list = []
-        for arg in init_input_args_list:
-            init_input_args_val_list.append(data[arg])
-
-        init_kws = dict(zip(init_input_args_list, init_input_args_val_list))
+        #    Arguments missing in the preset keep defaults of the function.
+        init_kws = {
+            arg: data[arg] for arg in self.info.init.input_args if arg in data
+        }
         initialized_output = self.initialize_fn(**init_kws)
 
         # 6. Store the initialized output in the "data" dict. Note that the
@@ -264,3 +329,54 @@ class Benchmark(object):
                         )
                     }
                 )
+
+    def input_cache_key(self, preset: str, global_precision: str) -> str:
+        """Builds cache key for the generated input data.
+
+        Key depends on everything that affects the generated data: preset
+        parameters (including seeds), precision, data types, initialization
+        source code with the helpers it imports and versions of the packages
+        it uses.
+
+        Args:
+           preset: The data-size preset (S, M, L).
+           global_precision: The precision to use for benchmark data.
+
+        Returns: cache key.
+        """
+        return DataCache.key(
+            benchmark=self.bname,
+            preset=preset,
+            precision=global_precision or self.info.init.precision,
+            parameters=self.info.parameters[preset],
+            dtypes=cfg.GLOBAL.dtypes,
+            init=[self.init_mod_path, self.init_fn_name],
+            init_source=source_fingerprint(self.init_mod_path),
+        )
+
+    def reference_cache_key(
+        self, preset: str, global_precision: str, reference_postfix: str
+    ) -> str:
+        """Builds cache key for the reference implementation output.
+
+        Key depends on the input data key and the fingerprint of the
+        reference implementation, so cached output gets invalidated once the
+        reference implementation or packages it uses change.
+
+        Args:
+           preset: The data-size preset (S, M, L).
+           global_precision: The precision to use for benchmark data.
+           reference_postfix: Postfix of the reference implementation.
+
+        Returns: cache key.
+        """
+        implementation = next(
+            impl
+            for impl in self.info.implementations
+            if impl.postfix == reference_postfix
+        )
+        return DataCache.key(
+            inputs=self.input_cache_key(preset, global_precision),
+            reference=[implementation.package_path, implementation.func_name],
+            reference_source=source_fingerprint(implementation.package_path),
+        )
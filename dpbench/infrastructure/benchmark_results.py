@@ -8,6 +8,10 @@ import numpy as np
 
 from dpbench.infrastructure.datamodel import Result
 from dpbench.infrastructure.enums import ErrorCodes, ValidationStatusCodes
+from dpbench.infrastructure.statistics import (
+    bootstrap_median_ci,
+    relative_ci_halfwidth,
+)
 
 
 @dataclass
@@ -21,20 +25,56 @@ class BenchmarkResults:
     preset: str
     input_size: int = 0
 
+    # Framework that executed the benchmark, set by the framework process.
+    framework_name: str = ""
+    framework_version: str = ""
+
     setup_time: float = 0.0
     warmup_time: float = 0.0
     teardown_time: float = 0.0
 
+    # JIT compilation time and number of compiled specializations, if the
+    # framework compiles implementations.
+    compile_time: float = None
+    specializations: int = None
+
+    # Peak memory growth in bytes for each phase, if memory was profiled.
+    setup_peak_rss: int = None
+    setup_peak_heap: int = None
+    warmup_peak_rss: int = None
+    warmup_peak_heap: int = None
+    exec_peak_rss: int = None
+    exec_peak_heap: int = None
+    teardown_peak_rss: int = None
+    teardown_peak_heap: int = None
+
+    # Average hardware events per execution, if counters were enabled.
+    cycles: float = None
+    instructions: float = None
+    cache_misses: float = None
+    branch_misses: float = None
+
+    # Work done by a single execution, if benchmark declares its formulas.
+    flops: float = None
+    bytes_moved: float = None
+    items: float = None
+
     min_exec_time: float = 0.0
     quartile25_exec_time: float = 0.0
     median_exec_time: float = 0.0
     quartile75_exec_time: float = 0.0
     max_exec_time: float = 0.0
+    median_ci_low_exec_time: float = 0.0
+    median_ci_high_exec_time: float = 0.0
 
     validation_state: ValidationStatusCodes = ValidationStatusCodes.NA
     error_state: ErrorCodes = ErrorCodes.UNIMPLEMENTED
     error_msg: str = "Not implemented"
 
+    _exec_times: np.ndarray = field(
+        default_factory=lambda: np.empty(0), repr=False
+    )
+
     @property
     def exec_times(self):
         """Returns an array of execution timings measured in nanoseconds
@@ -47,6 +87,7 @@ class BenchmarkResults:
 
     @exec_times.setter
     def exec_times(self, exec_times):
+        self._exec_times = np.asarray(exec_times, dtype=np.float64)
         if not exec_times:
             exec_times = [0.0]
         quartiles = np.percentile(exec_times, [25, 50, 75])
@@ -55,6 +96,14 @@ class BenchmarkResults:
         self.median_exec_time = quartiles[1]
         self.quartile75_exec_time = quartiles[2]
         self.max_exec_time = max(exec_times)
+        (
+            self.median_ci_low_exec_time,
+            self.median_ci_high_exec_time,
+        ) = bootstrap_median_ci(exec_times)
+
+    def packed_exec_times(self) -> bytes:
+        """Returns execution times packed as little endian float64."""
+        return self._exec_times.astype("<f8").tobytes()
 
     def Result(self, run_id: int, benchmark_name, framework_version) -> Result:
         if self.error_state == ErrorCodes.UNIMPLEMENTED:
@@ -84,12 +133,31 @@ class BenchmarkResults:
             input_size=self.input_size,
             setup_time=self.setup_time,
             warmup_time=self.warmup_time,
+            compile_time=self.compile_time,
+            specializations=self.specializations,
             repeats=str(self.repeats),
             min_exec_time=self.min_exec_time,
             max_exec_time=self.max_exec_time,
             median_exec_time=self.median_exec_time,
             quartile25_exec_time=self.quartile25_exec_time,
             quartile75_exec_time=self.quartile75_exec_time,
+            median_ci_low_exec_time=self.median_ci_low_exec_time,
+            median_ci_high_exec_time=self.median_ci_high_exec_time,
+            setup_peak_rss=self.setup_peak_rss,
+            setup_peak_heap=self.setup_peak_heap,
+            warmup_peak_rss=self.warmup_peak_rss,
+            warmup_peak_heap=self.warmup_peak_heap,
+            exec_peak_rss=self.exec_peak_rss,
+            exec_peak_heap=self.exec_peak_heap,
+            teardown_peak_rss=self.teardown_peak_rss,
+            teardown_peak_heap=self.teardown_peak_heap,
+            cycles=self.cycles,
+            instructions=self.instructions,
+            cache_misses=self.cache_misses,
+            branch_misses=self.branch_misses,
+            flops=self.flops,
+            bytes_moved=self.bytes_moved,
+            items=self.items,
             teardown_time=self.teardown_time,
             validated="Success"
             if self.validation_state == ValidationStatusCodes.SUCCESS
@@ -110,6 +178,14 @@ class BenchmarkResults:
                 scaled_time = float(time) / scale if scale > 0 else time
                 return f"{scaled_time}{s} ({time} ns)"
 
+    def _format_bytes(self, size: int):
+        if size is None:
+            return "n/a"
+        for s, scale in [("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)]:
+            if size >= scale:
+                return f"{round(size / scale, 2)}{s}"
+        return f"{size}B"
+
     def print(self, framework_name: str = "", framework_version: str = ""):
         print(
             "================ implementation "
@@ -124,6 +200,12 @@ class BenchmarkResults:
             print("framework version:", framework_version)
             print("input size:", self.input_size)
             print("setup time:", self._format_ns(self.setup_time))
+            if self.compile_time is not None:
+                print(
+                    "compile time:",
+                    self._format_ns(self.compile_time),
+                    f"({self.specializations} specializations)",
+                )
             print("warmup time:", self._format_ns(self.warmup_time))
             print("teardown time:", self._format_ns(self.teardown_time))
             print("max execution times:", self._format_ns(self.max_exec_time))
@@ -132,6 +214,44 @@ class BenchmarkResults:
                 "median execution times:",
                 self._format_ns(self.median_exec_time),
             )
+            print(
+                "median 95% CI: \u00B1"
+                + str(
+                    round(
+                        100
+                        * relative_ci_halfwidth(
+                            self.median_exec_time,
+                            self.median_ci_low_exec_time,
+                            self.median_ci_high_exec_time,
+                        ),
+                        2,
+                    )
+                )
+                + "%"
+            )
+            if self.exec_peak_rss is not None:
+                print(
+                    "peak memory (rss/heap):",
+                    f"exec {self._format_bytes(self.exec_peak_rss)}"
+                    + f"/{self._format_bytes(self.exec_peak_heap)},",
+                    f"warmup {self._format_bytes(self.warmup_peak_rss)}"
+                    + f"/{self._format_bytes(self.warmup_peak_heap)}",
+                )
+            if self.cycles:
+                print(
+                    "hardware counters:",
+                    f"IPC {round(self.instructions / self.cycles, 2)},",
+                    f"cache misses {int(self.cache_misses)},",
+                    f"branch misses {int(self.branch_misses)}",
+                )
+            if self.median_exec_time and (self.flops or self.bytes_moved):
+                print(
+                    "throughput:",
+                    f"{round((self.flops or 0) / self.median_exec_time, 2)}"
+                    + " GFLOP/s,",
+                    f"{round((self.bytes_moved or 0) / self.median_exec_time, 2)}"
+                    + " GB/s",
+                )
             print("repeats:", self.repeats)
             print("preset:", self.preset)
             print("validated:", self.validation_state)
@@ -7,32 +7,68 @@ import inspect
 import logging
 import multiprocessing as mp
 import multiprocessing.connection as mpc
+import os
+import sys
+import time
+from collections import Counter, deque
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, Union
 
+import numpy as np
 import sqlalchemy
+from threadpoolctl import threadpool_limits
 
 import dpbench.config as cfg
+from dpbench.infrastructure import shared_inputs, worker_pool
 from dpbench.infrastructure.benchmark import Benchmark
 from dpbench.infrastructure.benchmark_results import BenchmarkResults
-from dpbench.infrastructure.datamodel import store_results
+from dpbench.infrastructure.data_cache import DataCache
+from dpbench.infrastructure.datamodel import ResultsWriter, store_results
 from dpbench.infrastructure.enums import ErrorCodes, ValidationStatusCodes
 from dpbench.infrastructure.frameworks import Framework
 from dpbench.infrastructure.frameworks.fabric import build_framework
+from dpbench.infrastructure.memory import memory_tracker
+from dpbench.infrastructure.metrics import evaluate_metrics
+from dpbench.infrastructure.perf_counters import (
+    open_perf_counters,
+    perf_counters,
+)
+from dpbench.infrastructure.statistics import (
+    bootstrap_median_ci,
+    relative_ci_halfwidth,
+)
 from dpbench.infrastructure.timer import timer
 
 """
 Send on process creation:
     Framework configuration: so the process can set it up.
+    CPU set: so the process can pin itself to it (None means no pinning).
 
 Send on benchmark run request:
-    Benchmark configuration
+    Benchmark configuration (with descriptors of the input data published into
+    shared memory if it was requested)
 
 Send on benchmark finish:
     Benchmark execution results
 """
 
 
+@dataclass
+class AdaptiveRepeat:
+    """Configuration of the adaptive number of repetitions.
+
+    Benchmark is repeated until bootstrap confidence interval of the median
+    execution time gets within target_ci relative to the median, number of
+    repetitions reaches max_repeat or time_budget is exhausted.
+    """
+
+    target_ci: float = 0.02
+    min_repeat: int = 5
+    max_repeat: int = 1000
+    time_budget: float = 60.0
+
+
 @dataclass
 class BaseRunConfig:
     """Run configuration that is required to run benchmark."""
@@ -42,9 +78,17 @@ class BaseRunConfig:
     ref_framework: cfg.Framework = None
     preset: str = "S"
     repeat: int = 10
+    adaptive_repeat: AdaptiveRepeat = None
+    profile_memory: bool = False
+    perf_counters: bool = False
     validate: bool = True
     precision: str = None
     print_results: bool = True
+    cache_dir: str = None
+    cache_size: int = None
+    input_cache: bool = False
+    reference_cache: bool = False
+    input_data: dict[str, Any] = None
 
     @classmethod
     def from_instance(cls, instance):
@@ -67,6 +111,7 @@ class RunConfig(BaseRunConfig):
     timeout: float = 200.0
     run_id: int = None
     skip_expected_failures: bool = False
+    shared_inputs: bool = False
 
 
 class BenchmarkRunner:
@@ -79,6 +124,10 @@ class BenchmarkRunner:
     def __init__(
         self,
         method: str = "spawn",
+        jobs: int = 1,
+        cpus_per_job: int = None,
+        workers_address: str = None,
+        results_writer: ResultsWriter = None,
     ) -> None:
         """Creates BenchmarkRunner. No processes get spawn at this point.
 
@@ -86,14 +135,32 @@ class BenchmarkRunner:
             method: method for sub process creations. Currently only spawn is
                 supported. We need to get rid of GLOBAL config to get support
                 for 'fork' method.
+            jobs: number of benchmarks that are executed simultaneously. Each
+                job gets its own set of framework processes.
+            cpus_per_job: number of CPUs every job is pinned to. None means
+                that available CPUs are split evenly between jobs. Pinning is
+                done only if jobs > 1.
+            workers_address: address of the worker pool to attach to instead
+                of spawning framework processes.
+            results_writer: writer to store results through in bulk. If it is
+                None, every result is committed right away.
         """
         self._ctx = mp.get_context(method)
+        self._workers_address = workers_address
+        self._results_writer = results_writer
+        self._default_timeout = 200.0
+        self._jobs = jobs
+        self._cpu_sets = split_cpus(jobs, cpus_per_job) if jobs > 1 else []
         self._framework_processes: dict[
-            str, tuple[mp.Process, mpc.Connection]
+            tuple[int, str], tuple[mp.Process, mpc.Connection]
+        ] = {}
+        self._published_inputs: dict[
+            tuple[str, str, str],
+            tuple[Union[dict[str, Any], None], Union[str, None]],
         ] = {}
 
     def get_process(
-        self, framework: cfg.Framework
+        self, framework: cfg.Framework, slot: int = 0
     ) -> tuple[mp.Process, mpc.Connection]:
         """Get process with connection to it using caching.
 
@@ -103,49 +170,66 @@ class BenchmarkRunner:
 
         Args:
             framework: framework to which return the process.
+            slot: job slot the process belongs to.
 
         Returns: tuple of process and connection pip to control it.
         """
         p, conn = self._framework_processes.get(
-            framework.simple_name, (None, None)
+            (slot, framework.simple_name), (None, None)
         )
         if not p:
-            return self.create_process(framework)
+            return self.create_process(framework, slot)
         return p, conn
 
-    def kill_process(self, framework: cfg.Framework) -> None:
+    def kill_process(self, framework: cfg.Framework, slot: int = 0) -> None:
         """Kill the process for framework and closes connection.
 
         Args:
             framework: framework to which kill the process.
+            slot: job slot the process belongs to.
         """
-        logging.info(f"Killing process for {framework.simple_name}")
+        logging.info(f"Killing process for {framework.simple_name} ({slot})")
         p, conn = self._framework_processes.get(
-            framework.simple_name, (None, None)
+            (slot, framework.simple_name), (None, None)
         )
         if not p:
             return
         p.kill()
         p.join()
         conn.close()
-        del self._framework_processes[framework.simple_name]
+        del self._framework_processes[(slot, framework.simple_name)]
 
     def create_process(
-        self, framework: cfg.Framework
+        self, framework: cfg.Framework, slot: int = 0
     ) -> tuple[mp.Process, mpc.Connection]:
         """Create a process and updates cache for it.
 
+        If worker pool address is set, the process is a worker of the pool.
+
         Args:
             framework: framework to which create the process.
+            slot: job slot the process belongs to. It defines CPU set the
+                process gets pinned to.
         """
-        logging.info(f"Creating new process for {framework.simple_name}")
-        parent_conn, child_conn = self._ctx.Pipe()
-        p = self._ctx.Process(target=BenchmarkRunner.runner, args=(child_conn,))
-        self._framework_processes[framework.simple_name] = (p, parent_conn)
+        logging.info(
+            f"Creating new process for {framework.simple_name} ({slot})"
+        )
+        if self._workers_address:
+            p, parent_conn = worker_pool.connect(self._workers_address)
+        else:
+            parent_conn, child_conn = self._ctx.Pipe()
+            p = self._ctx.Process(
+                target=BenchmarkRunner.runner, args=(child_conn,)
+            )
+            p.start()
 
-        p.start()
+        self._framework_processes[(slot, framework.simple_name)] = (
+            p,
+            parent_conn,
+        )
 
         parent_conn.send(logging.root.level)
+        parent_conn.send(self._cpu_sets[slot] if self._cpu_sets else None)
         parent_conn.send(framework)
         parent_conn.send(cfg.GLOBAL.dtypes)
 
@@ -153,13 +237,70 @@ class BenchmarkRunner:
 
     def close_connections(self):
         """Closes all opened connections and processes."""
-        for framework_name, proc in self._framework_processes.items():
+        for (slot, framework_name), proc in self._framework_processes.items():
             p, c = proc
 
-            logging.info(f"Closing connection to {framework_name}")
+            logging.info(f"Closing connection to {framework_name} ({slot})")
             c.close()
             p.join()
 
+        self.release_inputs()
+
+    def publish_inputs(self, rc: RunConfig) -> Union[dict[str, Any], None]:
+        """Generates input data once and publishes it into shared memory.
+
+        Args:
+            rc: running configuration.
+
+        Returns: descriptors of the published data or None if data could not
+            be generated in the parent process.
+        """
+        key = _inputs_key(rc)
+
+        if key in self._published_inputs:
+            return self._published_inputs[key][0]
+
+        descriptors, directory = None, None
+        try:
+            bench = Benchmark(rc.benchmark)
+            cache = (
+                DataCache(rc.cache_dir, rc.cache_size)
+                if rc.input_cache
+                else None
+            )
+            data = bench.initialize_input_data(rc.preset, rc.precision, cache)
+            descriptors, directory = shared_inputs.publish(data)
+        except ValueError as e:
+            logging.info(
+                f"Input data for {rc.benchmark.module_name} is not published"
+                + f" ({e}), it will be generated by framework process."
+            )
+        except Exception:
+            logging.exception(
+                f"Failed to publish input data for {rc.benchmark.module_name},"
+                + " it will be generated by framework process."
+            )
+
+        self._published_inputs[key] = (descriptors, directory)
+
+        return descriptors
+
+    def release_inputs(self, rc: RunConfig = None) -> None:
+        """Frees published input data.
+
+        Args:
+            rc: running configuration to release data for. None means all.
+        """
+        keys = [_inputs_key(rc)] if rc else list(self._published_inputs.keys())
+
+        for key in keys:
+            if key not in self._published_inputs:
+                continue
+
+            _, directory = self._published_inputs.pop(key)
+            if directory:
+                shared_inputs.release(directory)
+
     @staticmethod
     def runner(c: mpc.Connection) -> None:
         """Static method that is the root for new process."""
@@ -173,6 +314,10 @@ class BenchmarkRunner:
 
         logging.info("Running new process")
 
+        cpus: Union[list[int], None] = c.recv()
+        if cpus:
+            _pin_process(cpus)
+
         framework_config: cfg.Framework = c.recv()
         cfg.GLOBAL.dtypes = c.recv()
         logging.info(f"Setting up the framework {framework_config.simple_name}")
@@ -194,7 +339,9 @@ class BenchmarkRunner:
                 if impl.postfix
                 in {
                     rc.implementation,
-                    rc.benchmark.reference_implementation_postfix,
+                    rc.benchmark.get_reference_implementation_postfix(
+                        rc.preset
+                    ),
                 }
             ]
 
@@ -212,12 +359,22 @@ class BenchmarkRunner:
             logging.info(
                 f"Running benchmark {rc.benchmark.short_name} for {rc.implementation}, {rc.preset}"
             )
+            if rc.input_data:
+                rc.input_data = shared_inputs.attach(rc.input_data)
+
             benchmark_results, _ = BenchmarkRunner.run_benchmark(
                 rc,
                 framework,
             )
 
-            benchmark_results.print(framework.fname, framework.version())
+            rc.input_data = None
+
+            benchmark_results.framework_name = framework.fname
+            benchmark_results.framework_version = framework.version()
+            benchmark_results.print(
+                benchmark_results.framework_name,
+                benchmark_results.framework_version,
+            )
 
             c.send(benchmark_results)
 
@@ -237,10 +394,27 @@ class BenchmarkRunner:
             f"Running {rc.benchmark.module_name} on {framework.fname} ({type(framework)})"
         )
         bench = Benchmark(rc.benchmark)
-        bench.initialize_input_data(rc.preset, rc.precision)
-
         results = BenchmarkResults(rc.repeat, rc.implementation, rc.preset)
 
+        # Implementation modules are imported only by the framework process,
+        # so missing dependencies show up here rather than in config reading.
+        if framework and bench.get_implementation(rc.implementation) is None:
+            results.error_state = ErrorCodes.UNIMPLEMENTED
+            results.error_msg = "Failed to import implementation"
+            return (results, {})
+
+        cache = (
+            DataCache(rc.cache_dir, rc.cache_size)
+            if rc.input_cache or rc.reference_cache
+            else None
+        )
+        if rc.input_data:
+            bench.bdata[rc.preset] = rc.input_data
+        else:
+            bench.initialize_input_data(
+                rc.preset, rc.precision, cache if rc.input_cache else None
+            )
+
         if not framework:
             results.error_state = ErrorCodes.NO_FRAMEWORK
             results.error_msg = "No framework"
@@ -255,19 +429,27 @@ class BenchmarkRunner:
             results,
             # copy output if we want to validate results
             rc.validate,
+            rc.adaptive_repeat,
+            rc.profile_memory,
+            rc.perf_counters,
         )
 
         if results.error_state != ErrorCodes.SUCCESS:
             return (results, {})
 
+        work = evaluate_metrics(
+            rc.benchmark.metrics,
+            rc.benchmark.parameters.get(rc.preset, {}),
+            rc.precision
+            or (rc.benchmark.init.precision if rc.benchmark.init else None),
+        )
+        results.flops = work["flops"]
+        results.bytes_moved = work["bytes"]
+        results.items = work["items"]
+
         if rc.validate and results.error_state == ErrorCodes.SUCCESS:
-            ref_framework = build_framework(rc.ref_framework)
-            # TODO: don't run it for every framework, but run it only once.
-            ref_output = _exec_simple(
-                bench,
-                ref_framework,
-                rc.benchmark.reference_implementation_postfix,
-                rc.preset,
+            ref_output = _get_reference_output(
+                bench, rc, cache if rc.reference_cache else None
             )
 
             if ref_output:
@@ -286,17 +468,16 @@ class BenchmarkRunner:
 
         return (results, output)
 
-    def run_benchmark_in_sub_process(
+    def _check_run_config(
         self,
         rc: RunConfig,
-    ) -> BenchmarkResults:
-        """Runs benchmark in sub process.
+    ) -> Union[BenchmarkResults, None]:
+        """Returns results for the runs that must not be executed.
 
         Args:
             rc: running configuration.
 
-        The method blocks workflow and waits for the result, but executes it in
-        separate process.
+        Returns: results if benchmark should not be executed, None otherwise.
         """
         if (
             rc.skip_expected_failures
@@ -322,7 +503,27 @@ class BenchmarkRunner:
 
             return results
 
-        _, conn = self.get_process(rc.framework)
+        if not rc.benchmark.supports_preset(rc.implementation, rc.preset):
+            results = BenchmarkResults(0, rc.implementation, rc.preset)
+            results.error_state = ErrorCodes.UNIMPLEMENTED
+            results.error_msg = f"Preset {rc.preset} is not supported"
+
+            results.print()
+
+            return results
+
+        return None
+
+    def _send_run_config(self, rc: RunConfig, slot: int = 0) -> mpc.Connection:
+        """Sends run request to the framework process of the slot.
+
+        Args:
+            rc: running configuration.
+            slot: job slot to run benchmark on.
+
+        Returns: connection to the process that executes the benchmark.
+        """
+        _, conn = self.get_process(rc.framework, slot)
 
         brc = BaseRunConfig.from_instance(rc)
 
@@ -330,29 +531,85 @@ class BenchmarkRunner:
             brc.ref_framework: cfg.Framework = [
                 f
                 for f in cfg.GLOBAL.frameworks
-                if rc.benchmark.reference_implementation_postfix
+                if rc.benchmark.get_reference_implementation_postfix(rc.preset)
                 in {p.postfix for p in f.postfixes}
             ][0]
 
+        if rc.shared_inputs:
+            brc.input_data = self.publish_inputs(rc)
+
         conn.send(brc)
 
-        if conn.poll(rc.timeout if rc.timeout else self._default_timeout):
-            try:
-                results: BenchmarkResults = conn.recv()
-            except EOFError:
-                results = BenchmarkResults(0, rc.implementation, rc.preset)
-                results.error_state = ErrorCodes.FAILED_EXECUTION
-                results.error_msg = "Core dump"
+        return conn
 
-                results.print()
-                self.kill_process(rc.framework)
-        else:
+    def _receive_results(
+        self, rc: RunConfig, conn: mpc.Connection, slot: int = 0
+    ) -> BenchmarkResults:
+        """Receives results from the process that has data to read.
+
+        Kills the process if it has crashed.
+
+        Args:
+            rc: running configuration.
+            conn: connection to the process with available data.
+            slot: job slot the process belongs to.
+        """
+        try:
+            results: BenchmarkResults = conn.recv()
+
+            # Pool workers print results into the output of the pool.
+            if self._workers_address:
+                results.print(results.framework_name, results.framework_version)
+        except EOFError:
             results = BenchmarkResults(0, rc.implementation, rc.preset)
-            results.error_state = ErrorCodes.EXECUTION_TIMEOUT
-            results.error_msg = "Execution timed out"
+            results.error_state = ErrorCodes.FAILED_EXECUTION
+            results.error_msg = "Core dump"
 
             results.print()
-            self.kill_process(rc.framework)
+            self.kill_process(rc.framework, slot)
+
+        return results
+
+    def _timeout_results(
+        self, rc: RunConfig, slot: int = 0
+    ) -> BenchmarkResults:
+        """Creates timeout results and kills hanging process.
+
+        Args:
+            rc: running configuration.
+            slot: job slot the process belongs to.
+        """
+        results = BenchmarkResults(0, rc.implementation, rc.preset)
+        results.error_state = ErrorCodes.EXECUTION_TIMEOUT
+        results.error_msg = "Execution timed out"
+
+        results.print()
+        self.kill_process(rc.framework, slot)
+
+        return results
+
+    def run_benchmark_in_sub_process(
+        self,
+        rc: RunConfig,
+    ) -> BenchmarkResults:
+        """Runs benchmark in sub process.
+
+        Args:
+            rc: running configuration.
+
+        The method blocks workflow and waits for the result, but executes it in
+        separate process.
+        """
+        results = self._check_run_config(rc)
+        if results:
+            return results
+
+        conn = self._send_run_config(rc)
+
+        if conn.poll(rc.timeout if rc.timeout else self._default_timeout):
+            results = self._receive_results(rc, conn)
+        else:
+            results = self._timeout_results(rc)
 
         return results
 
@@ -362,45 +619,240 @@ class BenchmarkRunner:
     ):
         """Runs benchmarks and saves the result into database.
 
-        Saves result if connection to database was provided.
+        Saves result if connection to database was provided. Result is
+        committed later in bulk if runner has results writer.
 
         Args:
             rc: runtime configuration.
         """
         results = self.run_benchmark_in_sub_process(rc)
 
+        self.save_results(rc, results)
+
+    def run_benchmarks_and_save(
+        self,
+        rcs: list[RunConfig],
+    ):
+        """Runs benchmarks on all job slots and saves results into database.
+
+        Keeps up to ``jobs`` framework processes busy at the same time. Each
+        run keeps its own timeout, processes that crashed or timed out get
+        killed and respawned on the next run request for the slot.
+
+        Args:
+            rcs: runtime configurations to execute.
+        """
+        pending: deque[RunConfig] = deque(rcs)
+        free_slots: deque[int] = deque(range(self._jobs))
+        # connection -> (slot, run configuration, deadline)
+        running: dict[mpc.Connection, tuple[int, RunConfig, float]] = {}
+        # number of not finished runs, that use published input data
+        inputs_users = Counter(_inputs_key(rc) for rc in rcs)
+
+        def finish(rc: RunConfig, results: BenchmarkResults):
+            self.save_results(rc, results)
+
+            inputs_users[_inputs_key(rc)] -= 1
+            if inputs_users[_inputs_key(rc)] == 0:
+                self.release_inputs(rc)
+
+        while pending or running:
+            while pending and free_slots:
+                rc = pending.popleft()
+
+                results = self._check_run_config(rc)
+                if results:
+                    finish(rc, results)
+                    continue
+
+                slot = free_slots.popleft()
+                timeout = rc.timeout if rc.timeout else self._default_timeout
+                conn = self._send_run_config(rc, slot)
+                running[conn] = (slot, rc, time.monotonic() + timeout)
+
+            if not running:
+                continue
+
+            next_deadline = min(deadline for _, _, deadline in running.values())
+            ready = mpc.wait(
+                list(running.keys()),
+                timeout=max(next_deadline - time.monotonic(), 0),
+            )
+
+            for conn in ready:
+                slot, rc, _ = running.pop(conn)
+                finish(rc, self._receive_results(rc, conn, slot))
+                free_slots.append(slot)
+
+            now = time.monotonic()
+            for conn, (slot, rc, deadline) in list(running.items()):
+                if deadline > now:
+                    continue
+                del running[conn]
+                finish(rc, self._timeout_results(rc, slot))
+                free_slots.append(slot)
+
+    def save_results(
+        self,
+        rc: RunConfig,
+        results: BenchmarkResults,
+    ):
+        """Saves the result into database.
+
+        Saves result if connection to database was provided. Result is
+        committed later in bulk if runner has results writer.
+
+        Args:
+            rc: runtime configuration.
+            results: results of the run.
+        """
         if rc.conn:
             framework = build_framework(rc.framework)
 
-            store_results(
-                rc.conn,
-                results.Result(
-                    run_id=rc.run_id,
-                    benchmark_name=rc.benchmark.module_name,
-                    framework_version=framework.fname
-                    + " "
-                    + framework.version()
+            result = results.Result(
+                run_id=rc.run_id,
+                benchmark_name=rc.benchmark.module_name,
+                framework_version=(
+                    framework.fname + " " + framework.version()
                     if framework
                     and results.error_state != ErrorCodes.UNIMPLEMENTED
-                    else "n/a",
+                    else "n/a"
                 ),
             )
+            samples = results.packed_exec_times()
+
+            if self._results_writer:
+                self._results_writer.store_results(result, samples=samples)
+            else:
+                store_results(rc.conn, result, samples=samples)
+
+
+def _inputs_key(rc: BaseRunConfig) -> tuple[str, str, str]:
+    return (rc.benchmark.module_name, rc.preset, rc.precision)
+
+
+def split_cpus(jobs: int, cpus_per_job: int = None) -> list[list[int]]:
+    """Splits available CPUs into disjoint sets for each job.
+
+    Args:
+        jobs: number of jobs.
+        cpus_per_job: number of CPUs in each set. None means that CPUs are
+            split evenly.
+
+    Returns: list of CPU sets. Empty list if pinning is not supported.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        logging.warning("CPU pinning is not supported on this platform")
+        return []
+
+    cpus = sorted(os.sched_getaffinity(0))
+
+    if cpus_per_job is None:
+        cpus_per_job = len(cpus) // jobs
+
+    if cpus_per_job < 1 or jobs * cpus_per_job > len(cpus):
+        raise ValueError(
+            f"Can not split {len(cpus)} available CPUs into {jobs} jobs"
+            + f" with {cpus_per_job} CPUs per job"
+        )
+
+    return [
+        cpus[i * cpus_per_job : (i + 1) * cpus_per_job] for i in range(jobs)
+    ]
+
+
+def _pin_process(cpus: list[int]):
+    """Pins current process to the CPU set and sizes thread pools to it.
+
+    NumPy and its BLAS are already loaded by the time process receives its
+    CPU set, so their pools are resized in place. Threading layers loaded
+    afterwards (e.g. by the framework) pick up the number of threads from the
+    environment.
+    """
+    logging.info(f"Pinning process to CPUs {cpus}")
+    os.sched_setaffinity(0, cpus)
+
+    num_threads = len(cpus)
+    for var in ["NUMBA_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS"]:
+        os.environ[var] = str(num_threads)
+
+    threadpool_limits(limits=num_threads)
+
+    # Numba reads the environment once imported, so the number of threads
+    # of the already imported one must be set explicitly.
+    if "numba" in sys.modules:
+        import numba
+
+        numba.set_num_threads(min(num_threads, numba.config.NUMBA_NUM_THREADS))
 
 
 def _set_input_args(
-    bench: Benchmark, framework: Framework, np_input_data: dict
+    bench: Benchmark, framework: Framework, np_input_data: dict, impl_fn
 ):
     inputs = dict()
 
-    for arg in bench.info.input_args:
+    for arg in _implementation_args(
+        impl_fn, bench.info.input_args, bench.info.optional_input_args
+    ):
         if arg in bench.info.array_args:
-            inputs[arg] = framework.copy_to_func()(np_input_data[arg])
+            inputs[arg] = _copy_to_framework(
+                bench, framework, arg, np_input_data[arg]
+            )
         else:
             inputs[arg] = np_input_data[arg]
 
     return inputs
 
 
+def _implementation_args(
+    impl_fn, args: list[str], optional_args: list[str]
+) -> list[str]:
+    """Returns input arguments accepted by the implementation.
+
+    Benchmarks may provide the same data in several layouts (e.g. sparse
+    matrix formats), so implementations get only arguments they declare. If
+    parameters of the implementation are unknown (e.g. native functions or
+    wrappers accepting any keywords), it gets all the arguments except the
+    optional ones.
+    """
+    try:
+        parameters = inspect.signature(impl_fn).parameters
+    except (TypeError, ValueError):
+        parameters = None
+
+    if parameters is None or any(
+        p.kind == p.VAR_KEYWORD for p in parameters.values()
+    ):
+        return [arg for arg in args if arg not in optional_args]
+
+    return [arg for arg in args if arg in parameters]
+
+
+def _copy_to_framework(
+    bench: Benchmark, framework: Framework, arg: str, array: Any
+) -> Any:
+    """Copies input array to the framework.
+
+    Frameworks working with host memory get writeable memory mapped arrays as
+    is, since they may be larger than memory. Read-only ones (shared or cached
+    inputs) are mapped copy-on-write instead of copying, so pages are copied
+    only if the implementation writes into them. Output arguments are copied,
+    since they get reset from the input data between repetitions.
+    """
+    if not framework.uses_host_memory() or not isinstance(array, np.memmap):
+        return framework.copy_to_func()(array)
+
+    if array.flags.writeable:
+        return array
+
+    if array.filename and arg not in bench.info.output_args:
+        private = shared_inputs.private_copy(array)
+        if private is not None:
+            return private
+
+    return framework.copy_to_func()(array)
+
+
 def _reset_output_args(
     bench: Benchmark, framework: Framework, inputs: dict, np_input_data: dict
 ):
@@ -408,7 +860,9 @@ def _reset_output_args(
         overwritten_data = inputs.get(arg, None)
         if overwritten_data is None or arg not in bench.info.array_args:
             continue
-        inputs[arg] = framework.copy_to_func()(np_input_data[arg])
+        inputs[arg] = _copy_to_framework(
+            bench, framework, arg, np_input_data[arg]
+        )
 
 
 def _array_size(array: Any) -> int:
@@ -418,6 +872,49 @@ def _array_size(array: Any) -> int:
         return array.size * array.itemsize
 
 
+def _get_reference_output(
+    bench: Benchmark,
+    rc: BaseRunConfig,
+    cache: DataCache = None,
+) -> Union[dict, None]:
+    """Returns output of the reference implementation.
+
+    Output is computed once per benchmark, preset and precision, if cache was
+    provided, and loaded from the cache afterwards.
+    """
+    ref_postfix = rc.benchmark.get_reference_implementation_postfix(rc.preset)
+
+    if cache:
+        cache_key = bench.reference_cache_key(
+            rc.preset, rc.precision, ref_postfix
+        )
+        ref_output = cache.load("references", cache_key)
+
+        if ref_output is not None:
+            return ref_output
+
+    ref_framework = build_framework(rc.ref_framework)
+    ref_output = _exec_simple(
+        bench,
+        ref_framework,
+        ref_postfix,
+        rc.preset,
+    )
+
+    if cache and ref_output:
+        cache.store(
+            "references",
+            cache_key,
+            ref_output,
+            compressed=True,
+            benchmark=bench.bname,
+            preset=rc.preset,
+            precision=rc.precision or "",
+        )
+
+    return ref_output
+
+
 def _exec_simple(
     bench: Benchmark,
     framework: Framework,
@@ -425,8 +922,8 @@ def _exec_simple(
     preset: str,
 ):
     np_input_data = bench.get_input_data(preset=preset)
-    inputs = _set_input_args(bench, framework, np_input_data)
     impl_fn = bench.get_implementation(impl_postfix)
+    inputs = _set_input_args(bench, framework, np_input_data, impl_fn)
 
     try:
         retval = framework.execute(impl_fn, inputs)
@@ -445,13 +942,17 @@ def _exec(
     repeat: int,
     results: BenchmarkResults,
     copy_output: bool,
+    adaptive_repeat: AdaptiveRepeat = None,
+    profile_memory: bool = False,
+    perf_counters: bool = False,
 ) -> Union[dict, None]:
     """Executes a benchmark for a given implementation.
 
     A helper function to execute a benchmark. The function is called in a
     separate sub-process by a BenchmarkRunner instance. The ``_exec`` function
     first runs the benchmark implementation function once as a warmup and then
-    performs the specified number of repetitions. The output results are reset
+    performs the specified number of repetitions (or repeats until adaptive
+    stopping rule is satisfied). The output results are reset
     before each repetition and the final output is serialized into a npz
     (compressed NumPy data file) file.
 
@@ -469,58 +970,214 @@ def _exec(
         args : Input arguments to benchmark implementation function.
         results : A benchmark results where timing and other results are stored.
         copy_output : A flag that controls copying output.
+        adaptive_repeat : Adaptive repetitions configuration. If set, repeat
+            is ignored.
+        profile_memory : A flag that enables tracking of peak memory usage
+            for each phase. It slows down memory allocations.
+        perf_counters : A flag that enables counting of hardware events
+            during timed repetitions.
     """
     np_input_data = bench.get_input_data(preset=preset)
+    impl_fn = bench.get_implementation(impl_postfix)
 
-    with timer() as t:
-        inputs = _set_input_args(bench, framework, np_input_data)
+    with memory_tracker(profile_memory) as m, timer() as t:
+        inputs = _set_input_args(bench, framework, np_input_data, impl_fn)
     results.setup_time = t.get_elapsed_time()
+    results.setup_peak_rss = m.get_peak_rss()
+    results.setup_peak_heap = m.get_peak_heap()
 
     results.input_size = 0
     for arg in bench.info.array_args:
-        results.input_size += _array_size(bench.bdata[preset][arg])
+        if arg in inputs:
+            results.input_size += _array_size(bench.bdata[preset][arg])
 
-    impl_fn = bench.get_implementation(impl_postfix)
+    # Counters are opened before the warmup, so threads started by the
+    # framework during the first execution inherit them.
+    counters = open_perf_counters() if perf_counters else None
 
-    # Warmup
-    with timer() as t:
-        try:
-            framework.execute(impl_fn, inputs)
-        except Exception:
-            logging.exception("Benchmark execution failed at the warmup step.")
-            results.error_state = ErrorCodes.FAILED_EXECUTION
-            results.error_msg = "Execution failed"
-            return
+    try:
+        return _exec_timed(
+            bench,
+            framework,
+            impl_fn,
+            inputs,
+            np_input_data,
+            repeat,
+            results,
+            copy_output,
+            adaptive_repeat,
+            profile_memory,
+            counters,
+        )
+    finally:
+        if counters:
+            counters.close()
+
+
+def _exec_compile(
+    compilation, impl_fn, inputs: dict, results: BenchmarkResults
+) -> bool:
+    """Compiles implementation for the argument types ahead of warmup.
+
+    Returns: False if compilation failed, results are updated with the error.
+    """
+    try:
+        compilation.compile(impl_fn, inputs)
+    except Exception:
+        logging.exception("Benchmark compilation failed.")
+        results.error_state = ErrorCodes.FAILED_EXECUTION
+        results.error_msg = "Compilation failed"
+        return False
+
+    return True
+
+
+def _exec_warmup(
+    framework: Framework,
+    compilation,
+    impl_fn,
+    inputs: dict,
+    results: BenchmarkResults,
+    profile_memory: bool,
+) -> bool:
+    """Executes warmup step and records its time, memory and compilation.
+
+    Returns: False if execution failed, results are updated with the error.
+    """
+    with memory_tracker(profile_memory) as m, timer() as t:
+        with compilation.record() if compilation else nullcontext() as c:
+            try:
+                framework.execute(impl_fn, inputs)
+            except Exception:
+                logging.exception(
+                    "Benchmark execution failed at the warmup step."
+                )
+                results.error_state = ErrorCodes.FAILED_EXECUTION
+                results.error_msg = "Execution failed"
+                return False
+
+    # Kernels that were not compiled ahead (e.g. called by python code) get
+    # compiled during warmup, warmup time excludes their compilation.
+    results.warmup_time = t.get_elapsed_time() - (c.compile_time if c else 0)
+    results.warmup_peak_rss = m.get_peak_rss()
+    results.warmup_peak_heap = m.get_peak_heap()
 
-    results.warmup_time = t.get_elapsed_time()
+    if compilation:
+        results.compile_time = compilation.compile_time
+        results.specializations = compilation.specializations
+
+    return True
+
+
+def _exec_timed(
+    bench: Benchmark,
+    framework: Framework,
+    impl_fn,
+    inputs: dict,
+    np_input_data: dict,
+    repeat: int,
+    results: BenchmarkResults,
+    copy_output: bool,
+    adaptive_repeat: AdaptiveRepeat,
+    profile_memory: bool,
+    counters: Union[perf_counters, None],
+) -> Union[dict, None]:
+    """Executes warmup, timed repetitions and copies output of a benchmark."""
+    compilation = framework.jit_compilation()
+
+    if compilation and not _exec_compile(compilation, impl_fn, inputs, results):
+        return
+
+    if not _exec_warmup(
+        framework, compilation, impl_fn, inputs, results, profile_memory
+    ):
+        return
 
     _reset_output_args(bench, framework, inputs, np_input_data)
 
-    exec_times = [0] * repeat
+    exec_times = []
+    stopping_rule = _StoppingRule(repeat, adaptive_repeat)
 
     retval = None
-    for i in range(repeat):
-        with timer() as t:
+    # Only executions are tracked, without resets of the output between them.
+    m = memory_tracker(profile_memory)
+    while True:
+        with m, counters or nullcontext(), timer() as t:
             retval = framework.execute(impl_fn, inputs)
-        exec_times[i] = t.get_elapsed_time()
+        exec_times.append(t.get_elapsed_time())
 
         # Do not reset the output from the last repeat
-        if i < repeat - 1:
-            _reset_output_args(bench, framework, inputs, np_input_data)
+        if stopping_rule.done(exec_times):
+            break
+
+        _reset_output_args(bench, framework, inputs, np_input_data)
 
+    results.exec_peak_rss = m.get_peak_rss()
+    results.exec_peak_heap = m.get_peak_heap()
+    results.repeats = len(exec_times)
     results.exec_times = exec_times
 
+    if counters:
+        for event, value in counters.get_averages().items():
+            setattr(results, event, value)
+
     # Get the output data
     results.teardown_time = 0.0
     results.error_state = ErrorCodes.SUCCESS
     results.error_msg = ""
 
     if copy_output:
-        return _exec_copy_output(bench, framework, retval, inputs, results)
+        with memory_tracker(profile_memory) as m:
+            output = _exec_copy_output(
+                bench, framework, retval, inputs, results
+            )
+        results.teardown_peak_rss = m.get_peak_rss()
+        results.teardown_peak_heap = m.get_peak_heap()
+
+        return output
 
     return None
 
 
+class _StoppingRule:
+    """Decides when enough repetitions of the benchmark were done."""
+
+    def __init__(self, repeat: int, adaptive_repeat: AdaptiveRepeat = None):
+        self._repeat = repeat
+        self._adaptive = adaptive_repeat
+
+        if adaptive_repeat:
+            self._deadline = time.perf_counter() + adaptive_repeat.time_budget
+            self._next_check = adaptive_repeat.min_repeat
+
+    def done(self, exec_times: list[int]) -> bool:
+        """Returns True if no more repetitions are needed."""
+        if not self._adaptive:
+            return len(exec_times) >= self._repeat
+
+        n = len(exec_times)
+
+        if n >= self._adaptive.max_repeat:
+            return True
+
+        if time.perf_counter() >= self._deadline:
+            logging.info(f"Time budget exhausted after {n} repetitions")
+            return n >= 1
+
+        if n < self._next_check:
+            return False
+
+        # Bootstrap is expensive for microsecond kernels, so check the
+        # interval at geometrically growing number of samples.
+        self._next_check = max(n + 1, int(n * 1.25))
+
+        low, high = bootstrap_median_ci(exec_times)
+
+        return relative_ci_halfwidth(exec_times, low, high) <= (
+            self._adaptive.target_ci
+        )
+
+
 def _exec_copy_output(
     bench: Benchmark,
     fmwrk: Framework,
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measurement of the host peak memory bandwidth and floating point rate."""
+
+import numpy as np
+
+from dpbench.infrastructure.timer import timer
+
+
+def _stream_triad():
+    import numba as nb
+
+    @nb.njit(parallel=True, fastmath=True)
+    def triad(a, b, c, scalar):
+        for i in nb.prange(a.shape[0]):
+            a[i] = b[i] + scalar * c[i]
+
+    return triad
+
+
+def measure_stream_bandwidth(size: int = 1 << 25, repeat: int = 10) -> float:
+    """Measures memory bandwidth with the STREAM triad kernel.
+
+    Traffic is counted the same way as STREAM does: two arrays are read and
+    one is written, write allocate traffic is ignored.
+
+    Args:
+        size: number of double precision elements in each array. Arrays must
+            be much larger than last level cache.
+        repeat: number of repetitions. The best one is reported.
+
+    Returns: bandwidth in bytes per second.
+    """
+    triad = _stream_triad()
+
+    a = np.zeros(size)
+    b = np.ones(size)
+    c = np.full(size, 2.0)
+
+    # Compile and touch pages
+    triad(a, b, c, 3.0)
+
+    best_time = None
+    for _ in range(repeat):
+        with timer() as t:
+            triad(a, b, c, 3.0)
+        elapsed = t.get_elapsed_time()
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    return 3 * a.nbytes / (best_time / 1e9)
+
+
+def measure_peak_flops(size: int = 4096, repeat: int = 5) -> float:
+    """Measures achievable floating point rate with a BLAS matrix product.
+
+    Args:
+        size: size of double precision square matrices.
+        repeat: number of repetitions. The best one is reported.
+
+    Returns: floating point operations per second.
+    """
+    rng = np.random.default_rng(0)
+    a = rng.random((size, size))
+    b = rng.random((size, size))
+    c = np.empty((size, size))
+
+    # Warmup
+    np.dot(a, b, out=c)
+
+    best_time = None
+    for _ in range(repeat):
+        with timer() as t:
+            np.dot(a, b, out=c)
+        elapsed = t.get_elapsed_time()
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    return 2 * size**3 / (best_time / 1e9)
@@ -0,0 +1,369 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Export of results into columnar datasets and import from them.
+
+Runs, postfixes, results and samples are written into separate datasets of
+parquet or arrow files partitioned into hive-style date/host directories,
+results and samples additionally by benchmark. Runs are identified by host
+name and run id in the database of that host, so exports of many hosts can
+share the same directory and be merged into a single database.
+"""
+
+import os
+import platform
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import sqlalchemy
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from .datamodel import Base, Postfix, Result, ResultSamples, Run
+
+# dataset format and file extension of supported export formats
+FORMATS = {"parquet": ("parquet", "parquet"), "arrow": ("ipc", "arrow")}
+
+# number of runs exported or imported at once
+_CHUNK_SIZE = 256
+
+_ARROW_TYPES = {
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+}
+
+_ORIGIN_FIELDS = [
+    pa.field("date", pa.string()),
+    pa.field("host", pa.string()),
+    pa.field("run_id", pa.int64()),
+]
+
+
+def _schema(model: type[Base], exclude: set[str] = frozenset()) -> pa.Schema:
+    """Builds schema of the table rows. Ids are local to the database, so
+    runs are referenced by the origin fields instead.
+    """
+    fields = list(_ORIGIN_FIELDS)
+
+    for column in model.__table__.columns:
+        if column.computed is not None or column.name in {
+            "id",
+            "run_id",
+            *exclude,
+        }:
+            continue
+
+        fields.append(
+            pa.field(column.name, _ARROW_TYPES[column.type.python_type])
+        )
+
+    return pa.schema(fields)
+
+
+_SAMPLES_SCHEMA = pa.schema(
+    _ORIGIN_FIELDS
+    + [
+        pa.field("benchmark", pa.string()),
+        pa.field("implementation", pa.string()),
+        pa.field("samples", pa.list_(pa.float64())),
+    ]
+)
+
+# schema and partition fields of each dataset
+_DATASETS = {
+    "runs": (_schema(Run, {"hostname", "source_id"}), ["date", "host"]),
+    "postfixes": (_schema(Postfix), ["date", "host"]),
+    "results": (_schema(Result), ["date", "host", "benchmark"]),
+    "samples": (_SAMPLES_SCHEMA, ["date", "host", "benchmark"]),
+}
+
+
+def _partitioning(name: str) -> ds.Partitioning:
+    schema, partitions = _DATASETS[name]
+
+    return ds.partitioning(
+        pa.schema([schema.field(field) for field in partitions]),
+        flavor="hive",
+    )
+
+
+def _write(df: pd.DataFrame, path: str, name: str, format: str, token: str):
+    schema, _ = _DATASETS[name]
+    file_format, extension = FORMATS[format]
+
+    ds.write_dataset(
+        pa.Table.from_pandas(
+            df[schema.names], schema=schema, preserve_index=False
+        ),
+        os.path.join(path, name),
+        format=file_format,
+        partitioning=_partitioning(name),
+        basename_template=f"part-{token}-{{i}}.{extension}",
+        existing_data_behavior="overwrite_or_ignore",
+        max_partitions=1 << 20,
+    )
+
+
+def _read(path: str, name: str, filter: pc.Expression = None) -> pd.DataFrame:
+    """Reads dataset files of all the formats, so exports of different
+    formats may share the directory.
+    """
+    schema, _ = _DATASETS[name]
+    location = os.path.join(path, name)
+
+    files = {extension: [] for _, extension in FORMATS.values()}
+    for root, _, filenames in os.walk(location):
+        for filename in filenames:
+            extension = os.path.splitext(filename)[1][1:]
+            if extension in files:
+                files[extension].append(os.path.join(root, filename))
+
+    # Columns added to the database later are read as nulls from older files.
+    dataset = ds.dataset(
+        [
+            ds.dataset(
+                files[extension],
+                schema=schema,
+                format=file_format,
+                partitioning=_partitioning(name),
+                partition_base_dir=location,
+            )
+            for file_format, extension in FORMATS.values()
+        ],
+        schema=schema,
+    )
+
+    return dataset.to_table(filter=filter).to_pandas()
+
+
+def _runs_filter(runs: pd.DataFrame) -> pc.Expression:
+    """Builds filter that matches rows of the runs."""
+    expression = None
+
+    for host, run_ids in runs.groupby("host")["run_id"]:
+        host_expression = (pc.field("host") == host) & pc.field("run_id").isin(
+            run_ids.tolist()
+        )
+        expression = (
+            host_expression
+            if expression is None
+            else expression | host_expression
+        )
+
+    return expression
+
+
+def _chunks(df: pd.DataFrame):
+    for start in range(0, len(df), _CHUNK_SIZE):
+        yield df.iloc[start : start + _CHUNK_SIZE]
+
+
+def _run_keys(df: pd.DataFrame) -> pd.MultiIndex:
+    return pd.MultiIndex.from_arrays(
+        [df["host"].astype(str), df["run_id"].astype("int64")]
+    )
+
+
+def export_results(
+    conn: sqlalchemy.Engine,
+    path: str,
+    format: str = "parquet",
+    hostname: str = None,
+    run_id: int = None,
+) -> int:
+    """Exports runs that are not in the dataset yet.
+    :param conn: sqlalchemy engine
+    :param path: directory of the dataset
+    :param format: format of the dataset files, parquet or arrow
+    :param hostname: host name of the runs that were executed on this host,
+        defaults to the name of this host
+    :param run_id: id of the run to export, all runs are exported if None
+    :return: number of exported runs
+    """
+    query = select(Run.id, Run.created_at, Run.hostname, Run.source_id)
+    if run_id is not None:
+        query = query.where(Run.id == run_id)
+
+    with conn.connect() as connection:
+        runs = pd.read_sql_query(sql=query.order_by(Run.id), con=connection)
+
+    # Imported runs keep their origin, so they can be exported again.
+    runs["host"] = runs["hostname"].fillna(hostname or platform.node())
+    runs["run_id"] = runs["source_id"].fillna(runs["id"]).astype("int64")
+    runs["date"] = pd.to_datetime(runs["created_at"], unit="s").dt.strftime(
+        "%Y-%m-%d"
+    )
+
+    exported = _read(path, "runs")
+    runs = runs[~_run_keys(runs).isin(_run_keys(exported))]
+
+    token = uuid.uuid4().hex
+
+    for chunk in _chunks(runs):
+        origin = chunk[["id", "date", "host", "run_id"]]
+        run_ids = chunk["id"].tolist()
+
+        with conn.connect() as connection:
+            postfixes = pd.read_sql_query(
+                sql=select(Postfix).where(Postfix.run_id.in_(run_ids)),
+                con=connection,
+            )
+            results = pd.read_sql_query(
+                sql=select(
+                    *[
+                        column
+                        for column in Result.__table__.columns
+                        if column.computed is None
+                    ]
+                ).where(Result.run_id.in_(run_ids)),
+                con=connection,
+            )
+            samples = pd.read_sql_query(
+                sql=select(
+                    Result.run_id,
+                    Result.benchmark,
+                    Result.implementation,
+                    ResultSamples.samples,
+                )
+                .join(ResultSamples, ResultSamples.result_id == Result.id)
+                .where(Result.run_id.in_(run_ids)),
+                con=connection,
+            )
+
+        # Object column even if there are no samples, so arrow converts it
+        # into list column.
+        samples["samples"] = pd.Series(
+            [
+                np.frombuffer(packed, dtype="<f8")
+                for packed in samples["samples"]
+            ],
+            index=samples.index,
+            dtype=object,
+        )
+
+        for name, df in [
+            ("postfixes", postfixes),
+            ("results", results),
+            ("samples", samples),
+        ]:
+            df = df.drop(columns=["id", "run_id"], errors="ignore").merge(
+                origin, left_on=df["run_id"], right_on="id"
+            )
+            _write(df, path, name, format, token)
+
+        # Runs are written last, so runs interrupted by a failure get
+        # exported again next time.
+        _write(chunk, path, "runs", format, token)
+
+    return len(runs)
+
+
+def _records(df: pd.DataFrame, model: type[Base]) -> list[dict]:
+    """Converts rows into values of the table columns, nulls into None."""
+    columns = [
+        column.name
+        for column in model.__table__.columns
+        if column.name in df.columns
+    ]
+    df = df[columns].astype(object)
+
+    return df.where(df.notna(), None).to_dict("records")
+
+
+def import_results(conn: sqlalchemy.Engine, path: str) -> int:
+    """Imports runs from the dataset that are not in the database yet.
+    :param conn: sqlalchemy engine
+    :param path: directory of the dataset
+    :return: number of imported runs
+    """
+    with conn.connect() as connection:
+        existing = pd.read_sql_query(
+            sql=select(Run.id, Run.hostname, Run.source_id).where(
+                Run.hostname.is_not(None)
+            ),
+            con=connection,
+        )
+
+    existing["host"] = existing["hostname"]
+    existing["run_id"] = existing["source_id"].fillna(existing["id"])
+
+    runs = _read(path, "runs").drop_duplicates(["host", "run_id"])
+    runs = runs[~_run_keys(runs).isin(_run_keys(existing))]
+
+    for chunk in _chunks(runs):
+        where = _runs_filter(chunk)
+        keys = ["host", "run_id", "benchmark", "implementation"]
+
+        postfixes = _read(path, "postfixes", where).drop_duplicates(
+            ["host", "run_id", "postfix"]
+        )
+        results = _read(path, "results", where).drop_duplicates(keys)
+        samples = _read(path, "samples", where).drop_duplicates(keys)
+
+        with Session(conn) as session:
+            imported = {}
+            for run in chunk.itertuples():
+                imported[(run.host, run.run_id)] = Run(
+                    created_at=run.created_at,
+                    hostname=run.host,
+                    source_id=run.run_id,
+                )
+                session.add(imported[(run.host, run.run_id)])
+
+            # Assigns ids to runs
+            session.flush()
+
+            for df in [postfixes, results]:
+                df["run_id"] = [
+                    imported[key].id for key in zip(df["host"], df["run_id"])
+                ]
+
+            if len(postfixes):
+                session.execute(insert(Postfix), _records(postfixes, Postfix))
+
+            if len(results):
+                session.execute(insert(Result), _records(results, Result))
+
+            result_ids = {
+                (run_id, benchmark, implementation): id
+                for id, run_id, benchmark, implementation in session.execute(
+                    select(
+                        Result.id,
+                        Result.run_id,
+                        Result.benchmark,
+                        Result.implementation,
+                    ).where(
+                        Result.run_id.in_([run.id for run in imported.values()])
+                    )
+                )
+            }
+
+            session.add_all(
+                ResultSamples(
+                    result_id=result_ids[
+                        (
+                            imported[(host, run_id)].id,
+                            benchmark,
+                            implementation,
+                        )
+                    ],
+                    samples=np.asarray(values, dtype="<f8").tobytes(),
+                )
+                for host, run_id, benchmark, implementation, values in zip(
+                    samples["host"],
+                    samples["run_id"],
+                    samples["benchmark"],
+                    samples["implementation"],
+                    samples["samples"],
+                )
+            )
+
+            session.commit()
+
+    return len(runs)
@@ -0,0 +1,406 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent on-disk cache of generated benchmark data.
+
+Every entry is a directory named after the content hash of everything that
+affects the generated data. Arrays are stored as separate ``.npy`` files, so
+they can be memory-mapped read-only on load and shared between all the
+framework processes. Data that is only read once (e.g. reference outputs) may
+be stored as a single compressed ``.npz`` archive instead.
+"""
+
+import ast
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Union
+
+import numpy as np
+
+_MANIFEST = "manifest.json"
+_ARCHIVE = "data.npz"
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join("~", ".cache")), "dpbench"
+)
+DEFAULT_CACHE_SIZE = 16 * 1024 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    """Description of the cached entry."""
+
+    kind: str
+    key: str
+    benchmark: str
+    preset: str
+    precision: str
+    size: int
+    last_used: float
+
+
+def file_hash(path: str) -> str:
+    """Returns sha256 hash of the file content."""
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+# Modules of this package are traced into, the others contribute versions.
+_SOURCE_PACKAGE = "dpbench.benchmarks"
+
+
+def _imported_modules(module_name: str, path: str) -> set[str]:
+    """Names of the modules imported anywhere in the source, including
+    imports inside of functions.
+    """
+    with open(path, "rb") as file:
+        tree = ast.parse(file.read(), filename=path)
+
+    package = module_name.rpartition(".")[0]
+    names = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = importlib.util.resolve_name(
+                "." * node.level + (node.module or ""), package
+            )
+            names.add(base)
+            # Imported names may be submodules as well
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+
+    return names
+
+
+def _package_version(package: str) -> Union[str, None]:
+    try:
+        return getattr(importlib.import_module(package), "__version__", None)
+    except ImportError:
+        return None
+
+
+def source_fingerprint(module_name: str) -> dict[str, dict[str, str]]:
+    """Fingerprint of the code behind the module.
+
+    It covers the source of the module, sources of the benchmark modules it
+    imports (e.g. shared helpers) and versions of the other packages it
+    imports, since their generators and datasets may change between releases.
+
+    Args:
+        module_name: full name of the module.
+
+    Returns: dictionary with source hashes by module name and versions by
+        package name.
+    """
+    sources = dict()
+    versions = dict()
+    pending = [module_name]
+
+    while pending:
+        name = pending.pop()
+
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+
+        if spec is None or not (spec.origin or "").endswith(".py"):
+            continue
+
+        sources[name] = file_hash(spec.origin)
+
+        for imported in _imported_modules(name, spec.origin):
+            if imported.startswith(_SOURCE_PACKAGE + "."):
+                if imported not in sources:
+                    pending.append(imported)
+                continue
+
+            package = imported.split(".")[0]
+            if package == "dpbench" or package in versions:
+                continue
+
+            version = _package_version(package)
+            if version is not None:
+                versions[package] = str(version)
+
+    return {"sources": sources, "versions": versions}
+
+
+class DataCache:
+    """Content-addressed cache of benchmark data with LRU eviction."""
+
+    def __init__(
+        self,
+        path: str = None,
+        max_size: int = None,
+    ) -> None:
+        """Creates cache. No files get created at this point.
+
+        Args:
+            path: root directory of the cache. Defaults to
+                ``DPBENCH_CACHE_DIR`` environment variable or
+                ``~/.cache/dpbench``.
+            max_size: maximum total size of the cache in bytes. Least recently
+                used entries get evicted once it is exceeded.
+        """
+        path = path or os.environ.get("DPBENCH_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_size = max_size or DEFAULT_CACHE_SIZE
+
+    @staticmethod
+    def key(**kwargs) -> str:
+        """Builds a cache key from all the data generation parameters."""
+        payload = json.dumps(kwargs, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_path(self, kind: str, key: str) -> str:
+        return os.path.join(self.path, kind, key)
+
+    def load(self, kind: str, key: str) -> Union[dict[str, Any], None]:
+        """Loads cached data.
+
+        Arrays of uncompressed entries are returned as read-only
+        memory-mapped views.
+
+        Args:
+            kind: kind of the data (e.g. inputs).
+            key: cache key of the entry.
+
+        Returns: dictionary with cached data or None if there is no entry.
+        """
+        entry_path = self._entry_path(kind, key)
+
+        try:
+            with open(os.path.join(entry_path, _MANIFEST)) as file:
+                manifest = json.load(file)
+
+            if manifest.get("compressed", False):
+                data = _load_archive(entry_path, manifest["values"])
+            else:
+                data = _load_files(entry_path, manifest["values"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Update access time for LRU eviction.
+        os.utime(entry_path)
+        logging.info(f"Loaded {kind} from cache {entry_path}")
+
+        return data
+
+    def store(
+        self,
+        kind: str,
+        key: str,
+        data: dict[str, Any],
+        compressed: bool = False,
+        **meta,
+    ) -> bool:
+        """Stores data into the cache.
+
+        Entry is written into temporary directory first and then moved into
+        its place, so concurrent writers never expose partial entries.
+
+        Args:
+            kind: kind of the data (e.g. inputs).
+            key: cache key of the entry.
+            data: values to store. Only numpy arrays and scalars are supported.
+                Compressed entries also support tuples of arrays.
+            compressed: store values as a single compressed archive.
+            meta: additional information to keep in the manifest.
+
+        Returns: True if the data was stored.
+        """
+        values = dict()
+        for name, value in data.items():
+            if compressed and isinstance(value, tuple):
+                values[name] = len(value)
+                continue
+
+            value_kind = _value_kind(value)
+            if value_kind is None:
+                logging.info(f"Can not cache {name} of type {type(value)}")
+                return False
+            values[name] = value_kind
+
+        kind_path = os.path.join(self.path, kind)
+        os.makedirs(kind_path, exist_ok=True)
+
+        tmp_path = tempfile.mkdtemp(prefix=".tmp-", dir=kind_path)
+        try:
+            if compressed:
+                _save_archive(tmp_path, data)
+            else:
+                for name, value in data.items():
+                    np.save(os.path.join(tmp_path, name + ".npy"), value)
+
+            with open(os.path.join(tmp_path, _MANIFEST), "w") as file:
+                json.dump(
+                    {"values": values, "compressed": compressed, "meta": meta},
+                    file,
+                )
+
+            os.rename(tmp_path, self._entry_path(kind, key))
+        except OSError:
+            # Entry was created by concurrent process.
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return False
+
+        self.evict()
+
+        return True
+
+    def entries(self) -> list[CacheEntry]:
+        """Returns list of all cache entries."""
+        entries = []
+
+        if not os.path.isdir(self.path):
+            return entries
+
+        for kind in sorted(os.listdir(self.path)):
+            kind_path = os.path.join(self.path, kind)
+            if not os.path.isdir(kind_path):
+                continue
+
+            for key in os.listdir(kind_path):
+                entry_path = os.path.join(kind_path, key)
+                if key.startswith(".tmp-"):
+                    continue
+
+                try:
+                    with open(os.path.join(entry_path, _MANIFEST)) as file:
+                        meta = json.load(file).get("meta", {})
+                    size = _dir_size(entry_path)
+                    last_used = os.stat(entry_path).st_mtime
+                except (OSError, ValueError):
+                    continue
+
+                entries.append(
+                    CacheEntry(
+                        kind=kind,
+                        key=key,
+                        benchmark=meta.get("benchmark", ""),
+                        preset=meta.get("preset", ""),
+                        precision=str(meta.get("precision", "")),
+                        size=size,
+                        last_used=last_used,
+                    )
+                )
+
+        return entries
+
+    def remove(self, entry: CacheEntry) -> None:
+        """Removes entry from the cache."""
+        shutil.rmtree(
+            self._entry_path(entry.kind, entry.key), ignore_errors=True
+        )
+
+    def clear(self, benchmarks: set[str] = None) -> int:
+        """Removes entries from the cache.
+
+        Args:
+            benchmarks: benchmarks to remove entries for. None means all.
+
+        Returns: number of removed entries.
+        """
+        entries = [
+            entry
+            for entry in self.entries()
+            if not benchmarks or entry.benchmark in benchmarks
+        ]
+
+        for entry in entries:
+            self.remove(entry)
+
+        return len(entries)
+
+    def evict(self) -> None:
+        """Removes least recently used entries until cache fits max_size."""
+        entries = sorted(self.entries(), key=lambda e: e.last_used)
+        total_size = sum(entry.size for entry in entries)
+
+        for entry in entries:
+            if total_size <= self.max_size:
+                break
+
+            logging.info(f"Evicting {entry.kind}/{entry.key} from cache")
+            self.remove(entry)
+            total_size -= entry.size
+
+
+def _value_kind(value: Any) -> Union[str, None]:
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return "array"
+    elif isinstance(value, np.generic):
+        return "scalar"
+    elif isinstance(value, (bool, int, float, complex)):
+        return "python"
+
+    return None
+
+
+def _restore_value(array: np.ndarray, value_kind: str) -> Any:
+    if value_kind == "scalar":
+        return array[()]
+    elif value_kind == "python":
+        return array.item()
+
+    return array
+
+
+def _load_files(entry_path: str, values: dict[str, str]) -> dict[str, Any]:
+    data = dict()
+    for name, value_kind in values.items():
+        file_path = os.path.join(entry_path, name + ".npy")
+        if value_kind == "array":
+            data[name] = np.load(file_path, mmap_mode="r")
+        else:
+            data[name] = _restore_value(np.load(file_path), value_kind)
+
+    return data
+
+
+def _save_archive(entry_path: str, data: dict[str, Any]) -> None:
+    arrays = dict()
+    for name, value in data.items():
+        if isinstance(value, tuple):
+            for i, item in enumerate(value):
+                arrays[f"{name}.{i}"] = item
+        else:
+            arrays[name] = value
+
+    np.savez_compressed(os.path.join(entry_path, _ARCHIVE), **arrays)
+
+
+def _load_archive(entry_path: str, values: dict[str, Any]) -> dict[str, Any]:
+    data = dict()
+    with np.load(os.path.join(entry_path, _ARCHIVE)) as archive:
+        for name, value_kind in values.items():
+            if isinstance(value_kind, int):
+                data[name] = tuple(
+                    archive[f"{name}.{i}"] for i in range(value_kind)
+                )
+            else:
+                data[name] = _restore_value(archive[name], value_kind)
+
+    return data
+
+
+def _dir_size(path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(path, file)) for file in os.listdir(path)
+    )
+
+
+def format_last_used(timestamp: float) -> str:
+    """Formats access time of the cache entry."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
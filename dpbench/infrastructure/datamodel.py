@@ -2,9 +2,15 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
 import logging
 import os
+import platform
+import queue
 import sqlite3
+import threading
+import time
+from typing import Union
 
 from alembic import command
 from alembic.config import Config
@@ -17,6 +23,7 @@ from sqlalchemy import (
     and_,
     case,
     create_engine,
+    event,
     func,
     text,
 )
@@ -40,6 +47,11 @@ class Base(DeclarativeBase):
 class Run(Base):
     __tablename__ = "runs"
 
+    # host the run was executed on
+    hostname: Mapped[Union[str, None]]
+    # id of the run in the database it was imported from
+    source_id: Mapped[Union[int, None]]
+
     # results: Mapped[list["Result"]] = relationship(back_populates="run")
 
 
@@ -106,12 +118,51 @@ class Result(Base):
     quartile75_exec_time: Mapped[float]
     teardown_time: Mapped[float]
     validated: Mapped[str]
+    median_ci_low_exec_time: Mapped[Union[float, None]]
+    median_ci_high_exec_time: Mapped[Union[float, None]]
+    setup_peak_rss: Mapped[Union[int, None]]
+    setup_peak_heap: Mapped[Union[int, None]]
+    warmup_peak_rss: Mapped[Union[int, None]]
+    warmup_peak_heap: Mapped[Union[int, None]]
+    exec_peak_rss: Mapped[Union[int, None]]
+    exec_peak_heap: Mapped[Union[int, None]]
+    teardown_peak_rss: Mapped[Union[int, None]]
+    teardown_peak_heap: Mapped[Union[int, None]]
+    cycles: Mapped[Union[float, None]]
+    instructions: Mapped[Union[float, None]]
+    cache_misses: Mapped[Union[float, None]]
+    branch_misses: Mapped[Union[float, None]]
+    flops: Mapped[Union[float, None]]
+    bytes_moved: Mapped[Union[float, None]]
+    items: Mapped[Union[float, None]]
+    compile_time: Mapped[Union[float, None]]
+    specializations: Mapped[Union[int, None]]
 
     __table_args__ = (
         UniqueConstraint("run_id", "benchmark", "implementation"),
     )
 
 
+class ResultSamples(Base):
+    __tablename__ = "result_samples"
+
+    result_id: Mapped[int] = mapped_column(ForeignKey("results.id"))
+    # execution time of each repetition packed as little endian float64
+    samples: Mapped[bytes]
+
+    __table_args__ = (UniqueConstraint("result_id"),)
+
+
+class Calibration(Base):
+    __tablename__ = "calibrations"
+
+    hostname: Mapped[str]
+    # bytes per second measured with STREAM triad
+    stream_bandwidth: Mapped[float]
+    # floating point operations per second measured with matrix product
+    peak_flops: Mapped[float]
+
+
 class Postfix(Base):
     __tablename__ = "postfixes"
 
@@ -131,7 +182,11 @@ def create_connection(db_file) -> Engine:
     """
     conn = None
     try:
-        engine = create_engine(f"sqlite:///{db_file}")
+        # Wait for locks held by concurrent writers instead of failing.
+        engine = create_engine(
+            f"sqlite:///{db_file}", connect_args={"timeout": 60}
+        )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
 
         return engine
     except sqlite3.Error:
@@ -142,12 +197,29 @@ def create_connection(db_file) -> Engine:
     return conn
 
 
+def _set_sqlite_pragmas(dbapi_connection, _):
+    """enables write-ahead log, so readers do not block the writer and
+    commits need fewer fsyncs. WAL requires shared memory, so it can not be
+    enabled on some network file systems, default journal is used there.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    journal_mode = cursor.fetchone()[0]
+    if journal_mode.lower() == "wal":
+        # Database stays consistent on crash in WAL mode, only the last
+        # transactions may be rolled back on power loss.
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    else:
+        logging.info(f"Could not enable WAL, journal mode is {journal_mode}")
+    cursor.close()
+
+
 def create_run(conn: Engine) -> int:
     """creates run record of the benchmarks and returns it's id
     :param conn: sqlalchemy engine
     :return: id of the run
     """
-    run = Run()
+    run = Run(hostname=platform.node())
 
     with Session(conn) as session:
         session.add(run)
@@ -172,14 +244,31 @@ def create_results_table(db_file: str):
     command.upgrade(alembic_cfg, "head")
 
 
-def store_results(conn: Engine, result: Result):
+def store_results(conn: Engine, result: Result, samples: bytes = None):
     """creates result record in database.
     :param conn: sqlalchemy engine
     :param result: result record to be inserted into db
+    :param samples: packed execution times of each repetition
     :return:
     """
     with Session(conn) as session:
         session.add(result)
+
+        if samples:
+            session.flush()
+            session.add(ResultSamples(result_id=result.id, samples=samples))
+
+        session.commit()
+
+
+def store_calibration(conn: Engine, calibration: Calibration):
+    """creates calibration record in database.
+    :param conn: sqlalchemy engine
+    :param calibration: calibration record to be inserted into db
+    :return:
+    """
+    with Session(conn) as session:
+        session.add(calibration)
         session.commit()
 
 
@@ -198,3 +287,129 @@ def store_postfix(conn: Engine, postfix: Postfix):
         if existing_postfix is None:
             session.add(postfix)
             session.commit()
+
+
+class ResultsWriter:
+    """Stores records in bulk from a single writer thread.
+
+    Records are queued by the caller and committed in one transaction per
+    benchmark: pending records get committed once a result of another
+    benchmark arrives or the oldest of them waits for longer than max_delay
+    seconds. Pending records are also committed on close, that is called on
+    interpreter exit, so results of the interrupted run are not lost.
+    """
+
+    def __init__(self, conn: Engine, max_delay: float = 10.0):
+        """Starts the writer thread.
+
+        :param conn: sqlalchemy engine
+        :param max_delay: maximum time in seconds a record may stay pending
+        """
+        self._conn = conn
+        self._max_delay = max_delay
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+        atexit.register(self.close)
+
+    def store_results(self, result: Result, samples: bytes = None):
+        """queues result record.
+        :param result: result record to be inserted into db
+        :param samples: packed execution times of each repetition
+        """
+        self._queue.put((result, samples))
+
+    def store_postfix(self, postfix: Postfix):
+        """queues postfix record, it is skipped if it already exists.
+        :param postfix: postfix record to be inserted into db
+        """
+        self._queue.put((postfix, None))
+
+    def flush(self):
+        """commits all the queued records and waits for it."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        """commits all the queued records and stops the writer thread."""
+        atexit.unregister(self.close)
+
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _write_loop(self):
+        batch: list[tuple[Base, Union[bytes, None]]] = []
+        benchmark = None
+        deadline = 0.0
+
+        while True:
+            try:
+                timeout = max(deadline - time.monotonic(), 0) if batch else None
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = threading.Event()
+
+            if isinstance(item, tuple):
+                record = item[0]
+                if isinstance(record, Result):
+                    if benchmark is not None and benchmark != record.benchmark:
+                        self._commit(batch)
+                    benchmark = record.benchmark
+
+                if not batch:
+                    deadline = time.monotonic() + self._max_delay
+                batch.append(item)
+                continue
+
+            self._commit(batch)
+            benchmark = None
+
+            if item is None:
+                break
+
+            item.set()
+
+    def _commit(self, batch: list[tuple[Base, Union[bytes, None]]]):
+        """commits batch in one transaction. If it fails, records are
+        committed one by one, so a single bad record does not lose others.
+        """
+        if not batch:
+            return
+
+        try:
+            _store_batch(self._conn, batch)
+        except Exception:
+            for item in batch:
+                try:
+                    _store_batch(self._conn, [item])
+                except Exception:
+                    logging.exception(f"Failed to store {item[0]}")
+
+        batch.clear()
+
+
+def _store_batch(conn: Engine, batch: list[tuple[Base, Union[bytes, None]]]):
+    with Session(conn) as session:
+        for record, _ in batch:
+            if isinstance(record, Postfix):
+                existing_postfix = (
+                    session.query(Postfix)
+                    .filter_by(run_id=record.run_id, postfix=record.postfix)
+                    .first()
+                )
+                if existing_postfix is not None:
+                    continue
+
+            session.add(record)
+
+        # Assigns ids to results
+        session.flush()
+
+        for record, samples in batch:
+            if samples:
+                session.add(ResultSamples(result_id=record.id, samples=samples))
+
+        session.commit()
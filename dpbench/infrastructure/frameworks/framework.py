@@ -86,6 +86,19 @@ class Framework(object):
 
         return numpy.copy
 
+    def uses_host_memory(self) -> bool:
+        """Returns True if the framework works with NumPy arrays in host
+        memory, so mapped input arrays can be passed without a copy."""
+        import numpy
+
+        return self.copy_to_func() is numpy.copy
+
+    def jit_compilation(self):
+        """Returns a new measurement of JIT compilation or None if the
+        framework does not compile implementations."""
+
+        return None
+
     def execute(self, impl_fn: Callable, input_args: Dict):
         """A wrapper for a framework to customize how a benchmark
         implementation should be executed.
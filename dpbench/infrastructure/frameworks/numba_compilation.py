@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measurement of numba JIT compilation.
+
+Compilation is observed through numba event API: every specialization
+compiled by any dispatcher triggers ``numba:compile`` event. Callees get
+compiled while the caller is typed, so only the outermost events are timed.
+Specializations loaded from the on-disk cache do not trigger events.
+"""
+
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from numba.core import event
+from numba.core.dispatcher import Dispatcher
+
+
+class _CompileListener(event.Listener):
+    def __init__(self):
+        self.depth = 0
+        self.start = 0
+        self.compile_time = 0
+        self.specializations = 0
+
+    def on_start(self, ev: event.Event):
+        if self.depth == 0:
+            self.start = time.perf_counter_ns()
+        self.depth += 1
+        self.specializations += 1
+
+    def on_end(self, ev: event.Event):
+        self.depth -= 1
+        if self.depth == 0:
+            self.compile_time += time.perf_counter_ns() - self.start
+
+
+class NumbaCompilation:
+    """Compilation time and number of specializations compiled by numba."""
+
+    def __init__(self):
+        """Creates empty measurement."""
+        self.compile_time = 0
+        self.specializations = 0
+
+    @contextmanager
+    def record(self):
+        """Records compilations triggered inside the context.
+
+        Yields: listener, its compile_time is the time spent in compilation
+            inside the context so far.
+        """
+        listener = _CompileListener()
+
+        try:
+            with event.install_listener("numba:compile", listener):
+                yield listener
+        finally:
+            self.compile_time += listener.compile_time
+            self.specializations += listener.specializations
+
+    def compile(self, impl_fn: Callable, input_args: dict) -> bool:
+        """Compiles implementation for the types of the arguments.
+
+        Compilation happens only if the implementation is a dispatcher itself
+        and all its arguments are provided, otherwise kernels get compiled on
+        the first execution. Whole compilation time is recorded, including
+        loading of the cached specializations.
+
+        Args:
+            impl_fn: implementation function.
+            input_args: arguments the implementation is going to be executed
+                with.
+
+        Returns: True if implementation was compiled.
+        """
+        if not isinstance(impl_fn, Dispatcher):
+            return False
+
+        parameters = inspect.signature(impl_fn.py_func).parameters
+        if set(parameters) != set(input_args):
+            return False
+
+        signature = tuple(
+            impl_fn.typeof_pyval(input_args[name]) for name in parameters
+        )
+
+        with self.record() as listener:
+            start = time.perf_counter_ns()
+            impl_fn.compile(signature)
+            elapsed = time.perf_counter_ns() - start
+
+        # Time outside of compile events is spent on typing of the arguments
+        # and loading of the cached specializations.
+        self.compile_time += elapsed - listener.compile_time
+
+        return True
@@ -36,3 +36,9 @@ class NumbaCudaFramework(Framework):
         import cupy
 
         return cupy.asnumpy
+
+    def jit_compilation(self):
+        """Returns a new measurement of numba JIT compilation."""
+        from .numba_compilation import NumbaCompilation
+
+        return NumbaCompilation()
@@ -74,3 +74,9 @@ class NumbaDpexFramework(Framework):
         import dpnp
 
         return dpnp.asnumpy
+
+    def jit_compilation(self):
+        """Returns a new measurement of numba JIT compilation."""
+        from .numba_compilation import NumbaCompilation
+
+        return NumbaCompilation()
@@ -27,3 +27,9 @@ class NumbaFramework(Framework):
         """
 
         super().__init__(fname, config)
+
+    def jit_compilation(self):
+        """Returns a new measurement of numba JIT compilation."""
+        from .numba_compilation import NumbaCompilation
+
+        return NumbaCompilation()
@@ -68,3 +68,9 @@ class NumbaMlirFramework(Framework):
             return dpt.asnumpy
         else:
             return np.copy
+
+    def jit_compilation(self):
+        """Returns a new measurement of numba JIT compilation."""
+        from .numba_compilation import NumbaCompilation
+
+        return NumbaCompilation()
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent on-disk cache of JIT compiled kernels.
+
+Implementations are decorated without ``cache=True``, so every new framework
+process compiles them from scratch. Once the cache is enabled, caching gets
+turned on for every JIT dispatcher defined at the top level of the
+implementation module right after it is imported. Compiled kernels are then
+stored in the cache directory and loaded by the following processes instead
+of being compiled again.
+"""
+
+import logging
+import os
+from types import ModuleType
+
+from .data_cache import DEFAULT_CACHE_DIR
+
+_JIT_CACHE_DIR_ENV = "DPBENCH_JIT_CACHE_DIR"
+
+
+def jit_cache_dir(cache_dir: str = None) -> str:
+    """Returns directory of the JIT cache.
+
+    Args:
+        cache_dir: root directory of the dpbench cache. Defaults to
+            ``DPBENCH_CACHE_DIR`` environment variable or ``~/.cache/dpbench``.
+    """
+    path = cache_dir or os.environ.get("DPBENCH_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+    return os.path.join(os.path.abspath(os.path.expanduser(path)), "jit")
+
+
+def enable_jit_cache(cache_dir: str = None) -> str:
+    """Enables JIT cache for framework processes started after the call.
+
+    Settings are passed to the processes through environment variables, so
+    it must be called before numba gets imported by the process.
+
+    Args:
+        cache_dir: root directory of the dpbench cache.
+
+    Returns: directory of the JIT cache.
+    """
+    path = jit_cache_dir(cache_dir)
+    os.makedirs(path, exist_ok=True)
+
+    os.environ[_JIT_CACHE_DIR_ENV] = path
+    os.environ["NUMBA_CACHE_DIR"] = path
+
+    return path
+
+
+def cache_dispatchers(module: ModuleType) -> int:
+    """Turns on caching for JIT dispatchers defined by the module.
+
+    Does nothing unless the JIT cache was enabled. Dispatchers that can not
+    be cached (e.g. they reference unpicklable globals) are compiled as usual.
+
+    Args:
+        module: imported implementation module.
+
+    Returns: number of dispatchers caching was turned on for.
+    """
+    if not os.environ.get(_JIT_CACHE_DIR_ENV):
+        return 0
+
+    count = 0
+    for name, value in vars(module).items():
+        enable_caching = getattr(value, "enable_caching", None)
+        if not callable(enable_caching):
+            continue
+        if type(getattr(value, "_cache", None)).__name__ != "NullCache":
+            continue
+
+        try:
+            enable_caching()
+            count += 1
+        except Exception as e:
+            logging.warning(f"Could not enable cache for {name}: {e}")
+
+    return count
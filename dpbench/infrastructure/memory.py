@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import tracemalloc
+from typing import Union
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def _read_proc_status(field: str) -> int:
+    """Reads memory field of /proc/self/status in bytes."""
+    with open(_PROC_STATUS) as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+
+    raise ValueError(f"{field} not found in {_PROC_STATUS}")
+
+
+def _reset_peak_rss() -> bool:
+    """Resets peak resident set size of the process (Linux only)."""
+    try:
+        with open(_PROC_CLEAR_REFS, "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _max_rss() -> int:
+    """Returns peak resident set size of the process in bytes."""
+    try:
+        return _read_proc_status("VmHWM")
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _rss() -> int:
+    """Returns current resident set size of the process in bytes."""
+    try:
+        return _read_proc_status("VmRSS")
+    except (OSError, ValueError):
+        return _max_rss()
+
+
+class memory_tracker:
+    """A contextmanager class to capture peak memory usage of a code section.
+
+    Peak resident set size is captured from the operating system, so it
+    includes allocations made by native code and device runtimes. Peak of the
+    Python heap is captured with tracemalloc, that also tracks NumPy array
+    allocations. Tracking slows down memory allocations, so timings measured
+    together with it are affected. Tracker can be entered several times, then
+    it reports the maximum peak out of all the entries. Disabled tracker
+    reports None.
+
+    :Example:
+        .. code-block:: python
+            from dpbench.infrastructure.memory import memory_tracker
+
+            with memory_tracker() as m:
+                s = [x for x in range(10000)]
+
+            print(m.get_peak_rss(), m.get_peak_heap())
+
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._peak_rss = 0 if enabled else None
+        self._peak_heap = 0 if enabled else None
+
+    def __enter__(self):
+        if not self.enabled:
+            return self
+
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._heap = tracemalloc.get_traced_memory()[0]
+
+        self._rss = _rss()
+        if not _reset_peak_rss():
+            # Peak can not be reset, so only growth above the previous peak
+            # of the process is visible.
+            self._rss = max(self._rss, _max_rss())
+
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if not self.enabled:
+            return
+
+        self._peak_heap = max(
+            tracemalloc.get_traced_memory()[1] - self._heap, self._peak_heap
+        )
+        if self._started_tracing:
+            tracemalloc.stop()
+
+        self._peak_rss = max(_max_rss() - self._rss, self._peak_rss)
+
+    def get_peak_rss(self) -> Union[int, None]:
+        """Returns peak growth of the resident set size in bytes."""
+        return self._peak_rss
+
+    def get_peak_heap(self) -> Union[int, None]:
+        """Returns peak growth of the Python heap in bytes."""
+        return self._peak_heap
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Evaluation of the work formulas declared in benchmark configurations."""
+
+import ast
+import logging
+import math
+import operator
+from typing import Any, Union
+
+import numpy as np
+
+import dpbench.config as cfg
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+_FUNCTIONS = {
+    "log2": math.log2,
+    "sqrt": math.sqrt,
+    "ceil": math.ceil,
+    "floor": math.floor,
+    "min": min,
+    "max": max,
+}
+
+
+def _evaluate(node: ast.AST, variables: dict[str, Any]) -> float:
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body, variables)
+    elif isinstance(node, ast.Constant) and isinstance(
+        node.value, (int, float)
+    ):
+        return node.value
+    elif isinstance(node, ast.Name):
+        if node.id not in variables:
+            raise ValueError(f"Unknown parameter {node.id}")
+        return variables[node.id]
+    elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return _BINARY_OPERATORS[type(node.op)](
+            _evaluate(node.left, variables), _evaluate(node.right, variables)
+        )
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](
+            _evaluate(node.operand, variables)
+        )
+    elif (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and not node.keywords
+    ):
+        return _FUNCTIONS[node.func.id](
+            *[_evaluate(arg, variables) for arg in node.args]
+        )
+
+    raise ValueError(f"Unsupported expression {ast.dump(node)}")
+
+
+def evaluate_formula(formula: str, variables: dict[str, Any]) -> float:
+    """Evaluates arithmetic formula.
+
+    Only numbers, variables, arithmetic operators and a few math functions
+    (log2, sqrt, ceil, floor, min, max) are allowed.
+
+    Args:
+        formula: formula to evaluate, e.g. "26 * nopt".
+        variables: values of the variables used in the formula.
+
+    Returns: value of the formula.
+    """
+    return float(_evaluate(ast.parse(formula, mode="eval"), variables))
+
+
+def evaluate_metrics(
+    metrics: cfg.Metrics,
+    parameters: dict[str, Any],
+    precision: str = None,
+) -> dict[str, Union[float, None]]:
+    """Evaluates work done by a single benchmark execution.
+
+    Args:
+        metrics: formulas declared by the benchmark.
+        parameters: parameters of the preset.
+        precision: precision of the benchmark data. Defaults to double.
+
+    Returns: dictionary with flops, bytes and items. Values are None if the
+        formula is not declared or can not be evaluated.
+    """
+    work = {"flops": None, "bytes": None, "items": None}
+
+    if metrics is None:
+        return work
+
+    float_dtypes = cfg.GLOBAL.dtypes.get("float", {})
+    itemsize = np.dtype(float_dtypes.get(precision or "double", "f8")).itemsize
+
+    variables = dict(parameters)
+    variables["itemsize"] = itemsize
+
+    for name in work:
+        formula = getattr(metrics, name)
+        if not formula:
+            continue
+
+        try:
+            work[name] = evaluate_formula(formula, variables)
+        except (ValueError, SyntaxError, ArithmeticError, TypeError) as e:
+            logging.warning(f"Failed to evaluate {name} formula {formula}: {e}")
+
+    return work
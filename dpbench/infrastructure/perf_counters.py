@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Hardware performance counters based on Linux perf_event_open."""
+
+import ctypes
+import logging
+import os
+import platform
+import struct
+
+# perf_event_open syscall numbers
+_SYSCALLS = {
+    "x86_64": 298,
+    "AMD64": 298,
+    "aarch64": 241,
+    "ppc64le": 319,
+    "s390x": 331,
+    "i386": 336,
+    "i686": 336,
+}
+
+_PERF_TYPE_HARDWARE = 0
+
+# perf_hw_id
+EVENTS = {
+    "cycles": 0,
+    "instructions": 1,
+    "cache_misses": 3,
+    "branch_misses": 5,
+}
+
+# perf_event_attr flags bits
+_FLAG_INHERIT = 1 << 1
+_FLAG_EXCLUDE_KERNEL = 1 << 5
+_FLAG_EXCLUDE_HV = 1 << 6
+
+_PERF_FORMAT_TOTAL_TIME_ENABLED = 1 << 0
+_PERF_FORMAT_TOTAL_TIME_RUNNING = 1 << 1
+
+_READ_FORMAT = struct.Struct("QQQ")
+
+
+class _PerfEventAttr(ctypes.Structure):
+    """struct perf_event_attr up to PERF_ATTR_SIZE_VER5."""
+
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("size", ctypes.c_uint32),
+        ("config", ctypes.c_uint64),
+        ("sample_period", ctypes.c_uint64),
+        ("sample_type", ctypes.c_uint64),
+        ("read_format", ctypes.c_uint64),
+        ("flags", ctypes.c_uint64),
+        ("wakeup_events", ctypes.c_uint32),
+        ("bp_type", ctypes.c_uint32),
+        ("config1", ctypes.c_uint64),
+        ("config2", ctypes.c_uint64),
+        ("branch_sample_type", ctypes.c_uint64),
+        ("sample_regs_user", ctypes.c_uint64),
+        ("sample_stack_user", ctypes.c_uint32),
+        ("clockid", ctypes.c_int32),
+        ("sample_regs_intr", ctypes.c_uint64),
+        ("aux_watermark", ctypes.c_uint32),
+        ("sample_max_stack", ctypes.c_uint16),
+        ("reserved_2", ctypes.c_uint16),
+    ]
+
+
+def _perf_event_open(config: int, tid: int) -> int:
+    syscall_number = _SYSCALLS.get(platform.machine())
+    if syscall_number is None:
+        raise OSError(f"perf_event_open is unknown for {platform.machine()}")
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.syscall.restype = ctypes.c_long
+
+    attr = _PerfEventAttr()
+    attr.type = _PERF_TYPE_HARDWARE
+    attr.size = ctypes.sizeof(_PerfEventAttr)
+    attr.config = config
+    attr.read_format = (
+        _PERF_FORMAT_TOTAL_TIME_ENABLED | _PERF_FORMAT_TOTAL_TIME_RUNNING
+    )
+    # Threads created after the counter was opened (e.g. thread pools of
+    # the frameworks) are counted as well.
+    attr.flags = _FLAG_INHERIT | _FLAG_EXCLUDE_KERNEL | _FLAG_EXCLUDE_HV
+
+    fd = libc.syscall(
+        syscall_number,
+        ctypes.byref(attr),
+        ctypes.c_int(tid),
+        ctypes.c_int(-1),
+        ctypes.c_int(-1),
+        ctypes.c_ulong(0),
+    )
+
+    if fd < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"perf_event_open failed: {os.strerror(errno)}")
+
+    return fd
+
+
+def _read_scaled(fd: int) -> float:
+    value, enabled, running = _READ_FORMAT.unpack(
+        os.read(fd, _READ_FORMAT.size)
+    )
+    # Scale value if counter was multiplexed with other events.
+    return value * enabled / running if running else 0.0
+
+
+class perf_counters:
+    """A contextmanager class to count hardware events of a code section.
+
+    Counters are opened for every existing thread of the process and inherited
+    by threads created afterwards. Counts are accumulated over every entry of
+    the context, so the same object may wrap each iteration of a benchmark.
+
+    :Example:
+        .. code-block:: python
+            from dpbench.infrastructure.perf_counters import perf_counters
+
+            counters = perf_counters()
+            for _ in range(10):
+                with counters:
+                    s = [x for x in range(10000)]
+            counters.close()
+
+            print(counters.get_averages())
+
+    Raises:
+        OSError: if performance counters are not available.
+    """
+
+    def __init__(self) -> None:
+        self._fds: dict[str, list[int]] = {event: [] for event in EVENTS}
+        self._totals: dict[str, float] = {event: 0.0 for event in EVENTS}
+        self._count = 0
+
+        try:
+            for tid in os.listdir("/proc/self/task"):
+                for event, config in EVENTS.items():
+                    self._fds[event].append(_perf_event_open(config, int(tid)))
+        except OSError:
+            self.close()
+            raise
+
+    def _read(self) -> dict[str, float]:
+        return {
+            event: sum(_read_scaled(fd) for fd in fds)
+            for event, fds in self._fds.items()
+        }
+
+    def __enter__(self):
+        self._start = self._read()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        end = self._read()
+        for event in EVENTS:
+            self._totals[event] += end[event] - self._start[event]
+        self._count += 1
+
+    def close(self):
+        """Closes all opened counters."""
+        for fds in self._fds.values():
+            for fd in fds:
+                os.close(fd)
+            fds.clear()
+
+    def get_averages(self) -> dict[str, float]:
+        """Returns average number of events per entry of the context."""
+        return {
+            event: total / self._count if self._count else 0.0
+            for event, total in self._totals.items()
+        }
+
+
+def open_perf_counters():
+    """Opens performance counters if they are available.
+
+    Returns: perf_counters object or None if counters are not available.
+    """
+    try:
+        return perf_counters()
+    except OSError as e:
+        logging.warning(f"Hardware performance counters unavailable: {e}")
+        return None
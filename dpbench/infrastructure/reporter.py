@@ -9,6 +9,7 @@ from a specific benchmark run.
 
 import dataclasses
 import logging
+import platform
 from typing import Final, Union
 
 import pandas as pd
@@ -19,13 +20,23 @@ from sqlalchemy.orm import Session
 import dpbench.config as cfg
 
 from . import datamodel as dm
+from .statistics import describe, mann_whitney_greater, unpack_samples
 
 __all__ = [
     "generate_impl_summary_report",
     "generate_performance_report",
     "generate_comparison_report",
+    "generate_statistics_report",
+    "generate_regression_report",
+    "generate_memory_report",
+    "generate_counters_report",
+    "generate_throughput_report",
+    "generate_compile_time_report",
 ]
 
+# Size of the cache line, used to estimate memory traffic from cache misses.
+CACHE_LINE_SIZE: Final[int] = 64
+
 
 def update_run_id(conn: sqlalchemy.Engine, run_id: Union[int, None]) -> int:
     """checks if run_id was provided. Otherwise returns the latest available one"""
@@ -294,6 +305,448 @@ def generate_comparison_report(
     generate_summary(df, report_csv)
 
 
+def generate_statistics_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate report with statistics of raw execution times"""
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.ResultSamples.samples,
+        )
+        .join(dm.ResultSamples, dm.ResultSamples.result_id == dm.Result.id)
+        .where(dm.Result.run_id == run_id)
+        .order_by(dm.Result.benchmark, dm.Result.implementation)
+    )
+
+    with conn.connect() as connection:
+        rows = connection.execute(sql).all()
+
+    if len(rows) == 0:
+        return
+
+    NANOSECONDS_IN_MILISECONDS: Final[float] = 1000 * 1000.0
+
+    records = []
+    for benchmark, implementation, preset, samples in rows:
+        samples = unpack_samples(samples)
+        stats = describe(samples)
+
+        record = {
+            "benchmark": benchmark,
+            "implementation": implementation,
+            "problem_preset": preset,
+            "samples": samples.size,
+        }
+        for name, value in stats.items():
+            record[name] = str(round(value / NANOSECONDS_IN_MILISECONDS, 3))
+            record[name] += "ms"
+
+        records.append(record)
+
+    print("Statistics of execution times")
+    print("=============================")
+
+    df = pd.DataFrame.from_records(records)
+
+    if report_csv:
+        print(df.to_csv(index=False))
+    else:
+        print(df.to_string())
+
+
+def generate_memory_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate report with peak memory usage of each phase"""
+    phases = ["setup", "warmup", "exec", "teardown"]
+
+    columns = [
+        dm.Result.benchmark,
+        dm.Result.implementation,
+        dm.Result.problem_preset,
+    ]
+    for phase in phases:
+        for kind in ["rss", "heap"]:
+            columns.append(getattr(dm.Result, f"{phase}_peak_{kind}"))
+
+    sql = (
+        sqlalchemy.select(*columns)
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.exec_peak_rss.is_not(None),
+        )
+        .order_by(dm.Result.benchmark, dm.Result.implementation)
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if len(df) == 0:
+        return
+
+    BYTES_IN_MEGABYTE: Final[float] = 1024 * 1024.0
+
+    for phase in phases:
+        for kind in ["rss", "heap"]:
+            column = f"{phase}_peak_{kind}"
+            df[column] = (
+                (df[column] / BYTES_IN_MEGABYTE)
+                .round(2)
+                .astype("string")
+                .fillna("n/a")
+                + "MB"
+            ).replace("n/aMB", "n/a")
+
+    print("Peak memory usage")
+    print("=================")
+
+    if report_csv:
+        print(df.to_csv(index=False))
+    else:
+        print(df.to_string())
+
+
+def generate_counters_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate report with metrics derived from hardware counters"""
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.median_exec_time,
+            dm.Result.cycles,
+            dm.Result.instructions,
+            dm.Result.cache_misses,
+            dm.Result.branch_misses,
+        )
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.cycles > 0,
+        )
+        .order_by(dm.Result.benchmark, dm.Result.implementation)
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if len(df) == 0:
+        return
+
+    df["ipc"] = (df["instructions"] / df["cycles"]).round(2)
+    df["cache_misses_per_kinst"] = (
+        1000 * df["cache_misses"] / df["instructions"]
+    ).round(2)
+    df["branch_misses_per_kinst"] = (
+        1000 * df["branch_misses"] / df["instructions"]
+    ).round(2)
+    # Every last level cache miss transfers at least one cache line from the
+    # memory, so it is a lower estimate of the achieved bandwidth.
+    df["bandwidth_gbs"] = (
+        df["cache_misses"] * CACHE_LINE_SIZE / df["median_exec_time"]
+    ).round(2)
+
+    for column in ["cycles", "instructions", "cache_misses", "branch_misses"]:
+        df[column] = df[column].round().astype("int64")
+
+    df = df.drop(columns=["median_exec_time"])
+
+    print("Hardware performance counters")
+    print("=============================")
+
+    if report_csv:
+        print(df.to_csv(index=False))
+    else:
+        print(df.to_string())
+
+
+def generate_compile_time_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate report with JIT compilation time for each framework"""
+    sql = (
+        sqlalchemy.select(
+            dm.Result.framework_version,
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.compile_time,
+            dm.Result.specializations,
+            dm.Result.warmup_time,
+        )
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.compile_time.is_not(None),
+        )
+        .order_by(
+            dm.Result.framework_version,
+            dm.Result.benchmark,
+            dm.Result.implementation,
+        )
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if len(df) == 0:
+        return
+
+    NANOSECONDS_IN_MILISECONDS: Final[float] = 1000 * 1000.0
+
+    for column in ["compile_time", "warmup_time"]:
+        df[column] = (df[column] / NANOSECONDS_IN_MILISECONDS).round(2)
+    df = df.rename(
+        columns={"compile_time": "compile_ms", "warmup_time": "warmup_ms"}
+    )
+
+    print("JIT compilation time")
+    print("====================")
+
+    for framework, framework_df in df.groupby("framework_version", sort=False):
+        print(
+            f"{framework}: {round(framework_df['compile_ms'].sum(), 2)}ms,"
+            + f" {framework_df['specializations'].sum()} specializations"
+        )
+
+        framework_df = framework_df.drop(columns=["framework_version"])
+
+        if report_csv:
+            print(framework_df.to_csv(index=False))
+        else:
+            print(framework_df.to_string(index=False))
+
+
+def _read_calibration(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+) -> Union[dm.Calibration, None]:
+    """reads calibration of the host the run was executed on, that was taken
+    closest in time to the run. Runs without recorded host are considered to
+    be executed on the current host.
+    """
+    with Session(conn) as session:
+        run = session.get(dm.Run, run_id)
+        hostname = run.hostname if run and run.hostname else platform.node()
+
+        query = session.query(dm.Calibration).filter_by(hostname=hostname)
+        if run:
+            query = query.order_by(
+                func.abs(dm.Calibration.created_at - run.created_at)
+            )
+
+        return query.order_by(dm.Calibration.id.desc()).first()
+
+
+def _format_percentage(ratio: pd.Series) -> pd.Series:
+    """formats ratios as percentages, missing values are n/a"""
+    return ((100 * ratio).round(1).astype("string") + "%").fillna("n/a")
+
+
+def generate_throughput_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate report with throughput derived from declared work formulas"""
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.median_exec_time,
+            dm.Result.flops,
+            dm.Result.bytes_moved,
+            dm.Result.items,
+        )
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.error_state == "Success",
+            dm.Result.median_exec_time > 0,
+            sqlalchemy.or_(
+                dm.Result.flops.is_not(None),
+                dm.Result.bytes_moved.is_not(None),
+                dm.Result.items.is_not(None),
+            ),
+        )
+        .order_by(dm.Result.benchmark, dm.Result.implementation)
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if len(df) == 0:
+        return
+
+    # Execution time is in nanoseconds, so flops per nanosecond are GFLOP/s.
+    df["gflops"] = (df["flops"] / df["median_exec_time"]).round(2)
+    df["gbs"] = (df["bytes_moved"] / df["median_exec_time"]).round(2)
+    df["items_per_s"] = (df["items"] / df["median_exec_time"] * 1e9).round()
+
+    calibration = _read_calibration(conn, run_id)
+    if calibration:
+        df["gflops_of_peak"] = _format_percentage(
+            df["gflops"] * 1e9 / calibration.peak_flops
+        )
+        df["gbs_of_peak"] = _format_percentage(
+            df["gbs"] * 1e9 / calibration.stream_bandwidth
+        )
+
+    df = df.drop(columns=["median_exec_time", "flops", "bytes_moved", "items"])
+
+    print("Throughput")
+    print("==========")
+
+    if calibration:
+        print(
+            f"peak: {round(calibration.peak_flops / 1e9, 2)} GFLOP/s,"
+            + f" {round(calibration.stream_bandwidth / 1e9, 2)} GB/s"
+        )
+
+    if report_csv:
+        print(df.to_csv(index=False))
+    else:
+        print(df.to_string())
+
+
+def _read_run_samples(
+    conn: sqlalchemy.Engine, run_id: int
+) -> dict[tuple[str, str, str], tuple[str, float, Union[bytes, None]]]:
+    """reads results of the run with their error states and raw samples"""
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.error_state,
+            dm.Result.median_exec_time,
+            dm.ResultSamples.samples,
+        )
+        .outerjoin(dm.ResultSamples, dm.ResultSamples.result_id == dm.Result.id)
+        .where(
+            dm.Result.run_id == run_id,
+        )
+    )
+
+    with conn.connect() as connection:
+        rows = connection.execute(sql).all()
+
+    return {
+        (benchmark, implementation, preset): (error_state, median, samples)
+        for benchmark, implementation, preset, error_state, median, samples in rows
+    }
+
+
+def _compare_results(
+    baseline: tuple[str, float, Union[bytes, None]],
+    candidate: tuple[str, float, Union[bytes, None]],
+    threshold: float,
+    alpha: float,
+) -> tuple[Union[float, None], Union[float, None], str]:
+    """compares successful baseline result to the candidate result
+
+    Returns: tuple of candidate to baseline ratio of medians, p-value and
+        status of the comparison.
+    """
+    _, baseline_median, baseline_samples = baseline
+    candidate_state, candidate_median, candidate_samples = candidate
+
+    if candidate_state != "Success":
+        return None, None, f"FAILURE ({candidate_state})"
+
+    ratio = candidate_median / baseline_median if baseline_median else None
+
+    p_value = None
+    if baseline_samples and candidate_samples:
+        p_value = mann_whitney_greater(
+            unpack_samples(baseline_samples),
+            unpack_samples(candidate_samples),
+        )
+
+    if ratio is None or p_value is None:
+        status = "insufficient data"
+    elif ratio > 1 + threshold and p_value < alpha:
+        status = "REGRESSION"
+    elif ratio < 1 - threshold:
+        status = "improvement"
+    else:
+        status = ""
+
+    return ratio, p_value, status
+
+
+def generate_regression_report(
+    conn: sqlalchemy.Engine,
+    baseline_run_id: int,
+    candidate_run_id: int,
+    threshold: float = 0.05,
+    alpha: float = 0.05,
+    report_csv: bool = False,
+) -> list[tuple[str, str, str]]:
+    """generate A/B comparison report between two runs
+
+    Results are paired by benchmark, implementation and preset. Pair is
+    considered a regression if candidate median is slower than baseline
+    median by more than threshold and one-sided Mann-Whitney U test on raw
+    samples is significant at alpha level, or if candidate failed where
+    baseline succeeded.
+
+    Returns: list of (benchmark, implementation, preset) that regressed.
+    """
+    baseline = _read_run_samples(conn, baseline_run_id)
+    candidate = _read_run_samples(conn, candidate_run_id)
+
+    regressions = []
+    records = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        if baseline[key][0] != "Success":
+            continue
+
+        ratio, p_value, status = _compare_results(
+            baseline[key], candidate[key], threshold, alpha
+        )
+
+        if status == "REGRESSION" or status.startswith("FAILURE"):
+            regressions.append(key)
+
+        benchmark, implementation, preset = key
+        records.append(
+            {
+                "benchmark": benchmark,
+                "implementation": implementation,
+                "problem_preset": preset,
+                "candidate_to_baseline": "n/a"
+                if ratio is None
+                else str(round(ratio * 100, 2)) + "%",
+                "p_value": "n/a" if p_value is None else f"{p_value:.4f}",
+                "status": status,
+            }
+        )
+
+    print(f"Comparison of run {candidate_run_id} to baseline {baseline_run_id}")
+    print("==================================")
+
+    if len(records) == 0:
+        print("No successful baseline results to compare")
+        return regressions
+
+    df = pd.DataFrame.from_records(records)
+
+    if report_csv:
+        print(df.to_csv(index=False))
+    else:
+        print(df.to_string())
+
+    return regressions
+
+
 def get_failures_from_results(
     results_db: Union[str, sqlalchemy.Engine] = "results.db",
     run_id: int = None,
@@ -368,6 +821,36 @@ def print_report(
         report_csv=csv,
     )
 
+    generate_statistics_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
+    generate_memory_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
+    generate_counters_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
+    generate_throughput_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
+    generate_compile_time_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
     unexpected_failures = get_unexpected_failures(conn, run_id=run_id)
 
     if len(unexpected_failures) > 0:
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Zero-copy handoff of benchmark input data between processes.
+
+Parent process publishes generated input data once into files in shared
+memory (tmpfs) and sends lightweight descriptors to framework processes, that
+map the files as read-only NumPy arrays. Implementations get private
+copy-on-write mappings of the files (see private_copy), so pages are copied
+only if the implementation writes into them.
+"""
+
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Union
+
+import numpy as np
+
+# tmpfs mount, so published files never hit the disk
+_SHM_DIR = "/dev/shm"
+
+
+@dataclass
+class SharedArray:
+    """Descriptor of the array stored in the shared file."""
+
+    path: str
+
+
+def publish(data: dict[str, Any]) -> tuple[dict[str, Any], str]:
+    """Writes arrays of the data into files in shared memory.
+
+    Args:
+        data: benchmark input data.
+
+    Returns: tuple of descriptors, where arrays are replaced with SharedArray,
+        and directory with the files. Directory must be removed with release
+        by the caller once no process needs the data anymore.
+
+    Raises:
+        ValueError: if data contains memory mapped arrays. They are mapped to
+            avoid holding the data in memory, so it is never copied into
+            shared memory.
+    """
+    for key, value in data.items():
+        if isinstance(value, np.memmap):
+            raise ValueError(f"{key} is a memory mapped array")
+
+    directory = tempfile.mkdtemp(
+        prefix="dpbench-inputs-",
+        dir=_SHM_DIR if os.path.isdir(_SHM_DIR) else None,
+    )
+    descriptors = dict()
+
+    try:
+        for key, value in data.items():
+            if not isinstance(value, np.ndarray) or value.dtype == object:
+                descriptors[key] = value
+                continue
+
+            path = os.path.join(directory, f"{len(descriptors)}.npy")
+            np.save(path, value)
+
+            descriptors[key] = SharedArray(path=path)
+    except Exception:
+        release(directory)
+        raise
+
+    return descriptors, directory
+
+
+def attach(descriptors: dict[str, Any]) -> dict[str, Any]:
+    """Maps the published data.
+
+    Args:
+        descriptors: descriptors returned by publish.
+
+    Returns: data, where arrays are read-only memory mapped arrays.
+    """
+    data = dict()
+
+    for key, value in descriptors.items():
+        if isinstance(value, SharedArray):
+            data[key] = np.load(value.path, mmap_mode="r")
+        else:
+            data[key] = value
+
+    return data
+
+
+def private_copy(array: np.memmap) -> Union[np.memmap, None]:
+    """Maps the file of the read-only memory mapped array copy-on-write.
+
+    Writes into the returned array stay private to it, so it can be passed
+    to the implementation that modifies its input without copying the data
+    ahead.
+
+    Args:
+        array: read-only array loaded from the .npy file.
+
+    Returns: writeable array or None if the file is not available anymore.
+    """
+    try:
+        return np.memmap(
+            array.filename,
+            dtype=array.dtype,
+            mode="c",
+            offset=array.offset,
+            shape=array.shape,
+            order="C" if array.flags.c_contiguous else "F",
+        )
+    except OSError:
+        return None
+
+
+def release(directory: str) -> None:
+    """Removes files created by publish.
+
+    Processes that still map the files keep their data until unmapped.
+    """
+    shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Statistical helpers for benchmark timings."""
+
+import numpy as np
+
+
+def bootstrap_median_ci(
+    samples,
+    confidence: float = 0.95,
+    resamples: int = 1000,
+    seed: int = 0,
+) -> tuple[float, float]:
+    """Computes bootstrap confidence interval of the median.
+
+    Args:
+        samples: measured values.
+        confidence: confidence level of the interval.
+        resamples: number of bootstrap resamples.
+        seed: seed of the random generator, so intervals are reproducible.
+
+    Returns: tuple of lower and upper bounds of the interval.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+
+    if samples.size < 2:
+        value = float(samples[0]) if samples.size else 0.0
+        return value, value
+
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, samples.size, size=(resamples, samples.size))
+    medians = np.median(samples[indices], axis=1)
+
+    alpha = (1.0 - confidence) / 2
+    low, high = np.quantile(medians, [alpha, 1.0 - alpha])
+
+    return float(low), float(high)
+
+
+def relative_ci_halfwidth(samples, low: float, high: float) -> float:
+    """Returns half-width of the confidence interval relative to the median.
+
+    Value of 0.02 means that the interval is within median ± 2%.
+    """
+    median = float(np.median(samples))
+
+    if median == 0:
+        return 0.0
+
+    return (high - low) / 2 / median
+
+
+def unpack_samples(samples: bytes) -> np.ndarray:
+    """Unpacks execution times stored as little endian float64."""
+    return np.frombuffer(samples, dtype="<f8")
+
+
+def describe(samples) -> dict[str, float]:
+    """Computes descriptive statistics of the samples.
+
+    Args:
+        samples: measured values.
+
+    Returns: dictionary with mean, standard deviation, median absolute
+        deviation and 95th/99th percentiles.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+
+    if samples.size == 0:
+        return {"mean": 0.0, "std": 0.0, "mad": 0.0, "p95": 0.0, "p99": 0.0}
+
+    median = np.median(samples)
+    p95, p99 = np.percentile(samples, [95, 99])
+
+    return {
+        "mean": float(np.mean(samples)),
+        "std": float(np.std(samples, ddof=1)) if samples.size > 1 else 0.0,
+        "mad": float(np.median(np.abs(samples - median))),
+        "p95": float(p95),
+        "p99": float(p99),
+    }
+
+
+def mann_whitney_greater(baseline, candidate) -> float:
+    """One-sided Mann-Whitney U test that candidate is greater.
+
+    Args:
+        baseline: baseline samples.
+        candidate: candidate samples.
+
+    Returns: p-value of the hypothesis that candidate samples tend to be
+        greater than baseline samples.
+    """
+    from scipy.stats import mannwhitneyu
+
+    return float(
+        mannwhitneyu(candidate, baseline, alternative="greater").pvalue
+    )
@@ -0,0 +1,324 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Pool of long-lived framework processes shared between runs.
+
+Every ``dpbench run`` spawns fresh framework processes, that pay for the
+framework import and JIT compilation again. Processes of the pool survive
+between runs, so imported frameworks and compiled kernels stay warm. Runs
+attach to the pool over a local socket and talk to it with the same protocol
+as to the processes spawned by BenchmarkRunner: the pool relays messages
+between the client connection and an idle worker of the requested framework.
+
+Workers keep implementation modules imported, so the pool must be restarted
+once implementations are changed.
+
+Workers unpickle messages of the clients and clients unpickle messages of the
+workers, so the socket is placed in a private directory of the user and both
+sides authenticate with the key stored next to it.
+"""
+
+import logging
+import multiprocessing as mp
+import multiprocessing.connection as mpc
+import os
+import pickle
+import stat
+import tempfile
+import threading
+from dataclasses import dataclass
+
+
+def _default_directory() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "dpbench")
+
+    return os.path.join(tempfile.gettempdir(), f"dpbench-{os.getuid()}")
+
+
+DEFAULT_ADDRESS = os.path.join(_default_directory(), "workers.sock")
+
+_AUTHKEY_SIZE = 32
+
+# Messages that the process receives once on creation: log level, CPU set,
+# framework configuration and precision data types.
+_HANDSHAKE_SIZE = 4
+
+
+@dataclass
+class _Worker:
+    process: mp.Process
+    conn: mpc.Connection
+
+
+class RemoteProcess:
+    """Handle of the pool worker attached by the client.
+
+    It mimics the part of multiprocessing.Process used by BenchmarkRunner.
+    Killing it closes the connection and the pool kills the worker if it is
+    still executing a benchmark.
+    """
+
+    def __init__(self, conn: mpc.Connection) -> None:
+        """Creates handle for the connection to the pool."""
+        self._conn = conn
+
+    def kill(self) -> None:
+        """Detaches from the worker."""
+        self._conn.close()
+
+    def join(self, timeout: float = None) -> None:
+        """Does nothing, worker keeps running in the pool."""
+
+
+def _authkey_path(address: str) -> str:
+    return address + ".key"
+
+
+def _check_owner(path: str) -> None:
+    if os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} is not owned by the current user")
+
+
+def _read_authkey(address: str) -> bytes:
+    """Reads the key of the pool after checking that the pool belongs to the
+    user, so messages are never exchanged with someone else's process.
+    """
+    path = _authkey_path(address)
+
+    _check_owner(address)
+    _check_owner(path)
+
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _make_private_directory(path: str) -> None:
+    """Creates directory accessible only by the user, if it does not exist.
+
+    Raises:
+        PermissionError: Existing directory is not owned by the user or
+            others may write into it.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+    st = os.lstat(path)
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != os.getuid()
+        or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    ):
+        raise PermissionError(
+            f"{path} must be a directory owned by the current user and"
+            + " writable only by them"
+        )
+
+
+def connect(address: str = None) -> tuple[RemoteProcess, mpc.Connection]:
+    """Attaches to a worker of the pool.
+
+    Worker is picked once the handshake is sent over the returned connection.
+
+    Args:
+        address: path to the pool socket.
+
+    Returns: tuple of the worker handle and connection to it.
+
+    Raises:
+        PermissionError: Socket or key of the pool are not owned by the user.
+    """
+    address = address or DEFAULT_ADDRESS
+
+    conn = mpc.Client(address, family="AF_UNIX", authkey=_read_authkey(address))
+
+    return RemoteProcess(conn), conn
+
+
+class WorkerPool:
+    """Pool of framework processes listening on the local socket."""
+
+    def __init__(self, address: str = None, method: str = "spawn") -> None:
+        """Creates pool. No processes get spawn at this point.
+
+        Args:
+            address: path to the socket to listen on.
+            method: method for sub process creations.
+        """
+        self.address = address or DEFAULT_ADDRESS
+        self._ctx = mp.get_context(method)
+        self._lock = threading.Lock()
+        # pickled handshake -> idle workers
+        self._idle: dict[bytes, list[_Worker]] = {}
+        self._workers: list[_Worker] = []
+
+    def serve(self) -> None:
+        """Accepts clients until interrupted, then stops all the workers.
+
+        Raises:
+            RuntimeError: Another pool is already listening on the address.
+        """
+        _make_private_directory(os.path.dirname(os.path.abspath(self.address)))
+        self._remove_stale_socket()
+
+        authkey = os.urandom(_AUTHKEY_SIZE)
+
+        # Only the owner may connect, messages are unpickled by workers.
+        umask = os.umask(0o077)
+        try:
+            with open(_authkey_path(self.address), "wb") as file:
+                file.write(authkey)
+            listener = mpc.Listener(
+                self.address, family="AF_UNIX", authkey=authkey
+            )
+        finally:
+            os.umask(umask)
+
+        logging.info(f"Listening on {self.address}")
+
+        try:
+            while True:
+                try:
+                    client = listener.accept()
+                except (mpc.AuthenticationError, EOFError, OSError):
+                    logging.warning("Rejected client that failed to log in")
+                    continue
+
+                threading.Thread(
+                    target=self._session, args=(client,), daemon=True
+                ).start()
+        finally:
+            listener.close()
+            os.remove(_authkey_path(self.address))
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Kills all the workers."""
+        with self._lock:
+            workers, self._workers, self._idle = self._workers, [], {}
+
+        for worker in workers:
+            self._kill(worker)
+
+    def _remove_stale_socket(self) -> None:
+        if not os.path.exists(self.address):
+            return
+
+        # Pool that was killed leaves the socket nobody listens on.
+        try:
+            mpc.Client(
+                self.address,
+                family="AF_UNIX",
+                authkey=_read_authkey(self.address),
+            ).close()
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.remove(self.address)
+            return
+
+        raise RuntimeError(f"Worker pool is already running at {self.address}")
+
+    def _acquire(self, key: bytes, handshake: list) -> _Worker:
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                worker = idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                self._workers.remove(worker)
+
+        # Imported here to avoid circular import, pool is imported by runner.
+        from .benchmark_runner import BenchmarkRunner
+
+        _, cpus, framework, _ = handshake
+        logging.info(
+            f"Creating new worker of {framework.simple_name} on {cpus}"
+        )
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=BenchmarkRunner.runner, args=(child_conn,), daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        for message in handshake:
+            parent_conn.send(message)
+
+        worker = _Worker(process, parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+
+        return worker
+
+    def _release(self, key: bytes, worker: _Worker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._idle.setdefault(key, []).append(worker)
+
+    def _kill(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+
+        worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+
+    def _session(self, client: mpc.Connection) -> None:
+        """Serves the client with the worker of the requested framework."""
+        try:
+            handshake = [client.recv() for _ in range(_HANDSHAKE_SIZE)]
+        except (EOFError, OSError):
+            client.close()
+            return
+
+        # Worker is set up by the handshake, so only the workers that received
+        # the same one can serve the client.
+        key = pickle.dumps(handshake)
+        worker = self._acquire(key, handshake)
+        broken = True
+
+        try:
+            broken = self._relay(client, worker)
+        finally:
+            client.close()
+
+            if broken:
+                self._kill(worker)
+            else:
+                self._release(key, worker)
+
+    @staticmethod
+    def _relay(client: mpc.Connection, worker: _Worker) -> bool:
+        """Relays messages between the client and the worker until one of
+        them disconnects.
+
+        Returns: True if the worker can not be reused: it crashed or the client
+            detached from it on execution timeout while it was busy.
+        """
+        busy = False
+
+        try:
+            while True:
+                ready = mpc.wait([client, worker.conn])
+
+                if worker.conn in ready:
+                    try:
+                        message = worker.conn.recv()
+                    except EOFError:
+                        # Worker crashed, client gets EOF as well.
+                        return True
+
+                    busy = False
+                    client.send(message)
+                    continue
+
+                try:
+                    message = client.recv()
+                except EOFError:
+                    return busy
+
+                worker.conn.send(message)
+                busy = True
+        except OSError:
+            return busy
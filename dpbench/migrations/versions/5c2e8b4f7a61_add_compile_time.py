@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add compile time
+
+Revision ID: 5c2e8b4f7a61
+Revises: f1c7a3d95e26
+Create Date: 2023-07-24 11:42:08.519346
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c2e8b4f7a61"
+down_revision = "f1c7a3d95e26"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "results",
+        sa.Column("compile_time", sa.Float(), nullable=True),
+    )
+    op.add_column(
+        "results",
+        sa.Column("specializations", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    # Batch mode would copy the table, including the computed
+    # input_size_human column, which SQLite does not allow to insert into.
+    op.drop_column("results", "specializations")
+    op.drop_column("results", "compile_time")
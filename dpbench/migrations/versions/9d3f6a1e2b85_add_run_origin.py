@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add run origin
+
+Revision ID: 9d3f6a1e2b85
+Revises: 5c2e8b4f7a61
+Create Date: 2023-08-02 15:06:31.204817
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9d3f6a1e2b85"
+down_revision = "5c2e8b4f7a61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "runs",
+        sa.Column("hostname", sa.String(), nullable=True),
+    )
+    op.add_column(
+        "runs",
+        sa.Column("source_id", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.drop_column("source_id")
+        batch_op.drop_column("hostname")
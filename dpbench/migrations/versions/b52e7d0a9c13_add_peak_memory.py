@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add peak memory
+
+Revision ID: b52e7d0a9c13
+Revises: 8a4e2c9d1f07
+Create Date: 2023-07-14 16:05:52.130877
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b52e7d0a9c13"
+down_revision = "8a4e2c9d1f07"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    f"{phase}_peak_{kind}"
+    for phase in ["setup", "warmup", "exec", "teardown"]
+    for kind in ["rss", "heap"]
+]
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.add_column(
+            "results",
+            sa.Column(column, sa.Integer(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    # Batch mode would copy the table, including the computed
+    # input_size_human column, which SQLite does not allow to insert into.
+    for column in reversed(_COLUMNS):
+        op.drop_column("results", column)
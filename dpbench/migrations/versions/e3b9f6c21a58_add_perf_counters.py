@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add hardware performance counters
+
+Revision ID: e3b9f6c21a58
+Revises: b52e7d0a9c13
+Create Date: 2023-07-18 11:42:07.518204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3b9f6c21a58"
+down_revision = "b52e7d0a9c13"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ["cycles", "instructions", "cache_misses", "branch_misses"]
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.add_column(
+            "results",
+            sa.Column(column, sa.Float(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    # Batch mode would copy the table, including the computed
+    # input_size_human column, which SQLite does not allow to insert into.
+    for column in reversed(_COLUMNS):
+        op.drop_column("results", column)
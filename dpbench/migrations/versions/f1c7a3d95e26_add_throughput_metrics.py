@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add throughput metrics
+
+Revision ID: f1c7a3d95e26
+Revises: e3b9f6c21a58
+Create Date: 2023-07-20 09:17:44.362581
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f1c7a3d95e26"
+down_revision = "e3b9f6c21a58"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ["flops", "bytes_moved", "items"]
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.add_column(
+            "results",
+            sa.Column(column, sa.Float(), nullable=True),
+        )
+
+    op.create_table(
+        "calibrations",
+        sa.Column("hostname", sa.String(), nullable=False),
+        sa.Column("stream_bandwidth", sa.Float(), nullable=False),
+        sa.Column("peak_flops", sa.Float(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.Integer(),
+            server_default=sa.text("(strftime('%s','now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("calibrations")
+
+    # Batch mode would copy the table, including the computed
+    # input_size_human column, which SQLite does not allow to insert into.
+    for column in reversed(_COLUMNS):
+        op.drop_column("results", column)
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import dpbench.config as cfg
+from dpbench.infrastructure.benchmark_runner import (
+    BaseRunConfig,
+    BenchmarkRunner,
+)
+from dpbench.infrastructure.frameworks.fabric import build_framework
+
+
+def _framework_config(implementation: str) -> cfg.Framework:
+    for framework in cfg.GLOBAL.frameworks:
+        if implementation in {p.postfix for p in framework.postfixes}:
+            return framework
+
+    pytest.skip(f"No framework for {implementation}")
+
+
+@pytest.fixture
+def run_preset(monkeypatch):
+    """Runs implementation of the benchmark in the current process.
+
+    Returns function that runs the benchmark with validation against the
+    reference implementation of the preset and returns its results.
+    """
+
+    def run(benchmark: str, implementation: str, preset: str = "S"):
+        config = cfg.read_configs(
+            benchmarks={benchmark},
+            implementations={implementation},
+            with_npbench=True,
+            with_polybench=True,
+        )
+        monkeypatch.setattr(cfg, "GLOBAL", config)
+
+        bench_config = config.benchmarks[0]
+        reference = bench_config.get_reference_implementation_postfix(preset)
+
+        rc = BaseRunConfig(
+            benchmark=bench_config,
+            implementation=implementation,
+            ref_framework=_framework_config(reference),
+            preset=preset,
+            repeat=1,
+            print_results=False,
+        )
+        framework = build_framework(_framework_config(implementation))
+
+        results, _ = BenchmarkRunner.run_benchmark(rc, framework)
+
+        return results
+
+    return run
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from dpbench.infrastructure.enums import ErrorCodes, ValidationStatusCodes
+
+
+@pytest.mark.parametrize(
+    "benchmark, implementation",
+    [
+        ("dbscan", "numba_npr_grid"),
+        ("knn", "numpy"),
+        ("knn", "numba_npr_kdtree"),
+        ("gpairs", "numpy_blocked"),
+        ("gpairs", "numba_npr_kdtree"),
+        ("spmv", "numpy_vec"),
+        ("spmv", "numba_npr_ell"),
+        ("spmv", "numba_npr_sell"),
+        ("crc16", "numba_n_table"),
+        ("crc16", "numba_n_slice8"),
+        ("crc16", "numba_npr_chunked"),
+        ("floyd_warshall", "numba_npr_blocked"),
+        ("nussinov", "numpy_wavefront"),
+        ("nussinov", "numba_npr_wavefront"),
+        ("nbody", "numpy_tiled"),
+        ("nbody", "numba_npr_tiled"),
+        ("pairwise_distance", "numpy_tiled"),
+        ("azimint_hist", "numpy_stream"),
+        ("azimint_hist", "numba_npr_stream"),
+    ],
+)
+def test_preset_s(run_preset, benchmark, implementation):
+    results = run_preset(benchmark, implementation)
+
+    assert results.error_state == ErrorCodes.SUCCESS, results.error_msg
+    assert results.validation_state == ValidationStatusCodes.SUCCESS
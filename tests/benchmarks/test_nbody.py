@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from dpbench.benchmarks.npbench.nbody import (
+    nbody_numba_npr_barnes_hut,
+    nbody_numba_npr_tiled,
+    nbody_numpy_tiled,
+    nbody_validate,
+)
+from dpbench.benchmarks.npbench.nbody.nbody import initialize
+
+# Large enough to be validated by energy
+N = 2 * nbody_validate.MAX_EXACT_N
+DT = 0.01
+G = 1.0
+SOFTENING = 0.1
+
+
+def _simulate(nbody, G=G):
+    mass, pos, vel, Nt = initialize(N, 3 * DT, DT)
+    ke, pe = nbody(mass, pos, vel, N, Nt, DT, G, SOFTENING)
+
+    return {"pos": pos, "vel": vel, "return-value": (ke, pe)}
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return _simulate(nbody_numpy_tiled.nbody)
+
+
+def test_exact_kernel(reference):
+    assert nbody_validate.validate(
+        reference, _simulate(nbody_numba_npr_tiled.nbody)
+    )
+
+
+def test_barnes_hut(reference):
+    assert nbody_validate.validate(
+        reference, _simulate(nbody_numba_npr_barnes_hut.nbody)
+    )
+
+
+def test_wrong_gravitational_constant(reference):
+    assert not nbody_validate.validate(
+        reference, _simulate(nbody_numpy_tiled.nbody, G=2 * G)
+    )
+
+
+def test_repulsive_forces(reference, monkeypatch):
+    get_acc = nbody_numpy_tiled.getAcc
+    monkeypatch.setattr(
+        nbody_numpy_tiled, "getAcc", lambda *args: -get_acc(*args)
+    )
+
+    assert not nbody_validate.validate(
+        reference, _simulate(nbody_numpy_tiled.nbody)
+    )
+
+
+def test_frozen_system(reference):
+    def frozen(mass, pos, vel, N, Nt, dt, G, softening):
+        vel -= np.mean(mass * vel, axis=0) / np.mean(mass)
+        ke, pe = nbody_numpy_tiled.getEnergy(pos, vel, mass, G)
+        return np.full(Nt + 1, ke), np.full(Nt + 1, pe)
+
+    assert not nbody_validate.validate(reference, _simulate(frozen))
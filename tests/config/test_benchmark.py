@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpbench.config as cfg
+
+
+def _benchmark(**kwargs) -> cfg.Benchmark:
+    return cfg.Benchmark.from_dict(
+        {
+            "parameters": {"S": {}, "XL": {}},
+            "reference_implementation_postfix": "python",
+            **kwargs,
+        }
+    )
+
+
+def test_supports_preset():
+    benchmark = _benchmark(
+        preset_implementations={"XL": {"implementations": ["numpy"]}}
+    )
+
+    assert benchmark.supports_preset("python", "S")
+    assert benchmark.supports_preset("numpy", "XL")
+    assert not benchmark.supports_preset("python", "XL")
+    assert not benchmark.supports_preset("python", "M")
+
+
+def test_preset_reference_implementation():
+    benchmark = _benchmark(
+        preset_implementations={
+            "XL": {
+                "implementations": ["numpy", "numba_npr"],
+                "reference_implementation_postfix": "numpy",
+            }
+        }
+    )
+
+    assert benchmark.get_reference_implementation_postfix("S") == "python"
+    assert benchmark.get_reference_implementation_postfix("XL") == "numpy"
+    assert benchmark.get_reference_implementation_postfixes() == {
+        "python",
+        "numpy",
+    }
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import textwrap
+
+import pytest
+
+from dpbench.config.index import ModuleIndex, parse_module_names
+
+
+@pytest.fixture
+def module(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("def foo():\n    pass\n")
+    return path
+
+
+def _write(path, source: str, mtime_ns: int):
+    path.write_text(source)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_parse_module_names(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(
+        textwrap.dedent(
+            """
+            import numpy as np
+            from numba import njit as jit
+            A, (B, C) = 1, (2, 3)
+
+            try:
+                import dpnp
+            except ImportError:
+                dpnp = None
+
+            @jit
+            def foo():
+                local = 1
+
+            class Bar:
+                pass
+            """
+        )
+    )
+
+    assert parse_module_names(str(path)) == {
+        "np",
+        "jit",
+        "A",
+        "B",
+        "C",
+        "dpnp",
+        "foo",
+        "Bar",
+    }
+
+
+def test_parse_star_import(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("from numpy import *\n")
+
+    assert parse_module_names(str(path)) is None
+
+
+def test_index_persists(tmp_path, module):
+    index_path = str(tmp_path / "index.json")
+
+    index = ModuleIndex(index_path)
+    assert index.names(str(module)) == {"foo"}
+    index.save()
+
+    index = ModuleIndex(index_path)
+    assert index.names(str(module)) == {"foo"}
+    assert not index.modified
+
+
+def test_index_invalidated_by_mtime(tmp_path, module):
+    index_path = str(tmp_path / "index.json")
+    _write(module, "def foo():\n    pass\n", 1_000_000_000)
+
+    index = ModuleIndex(index_path)
+    index.names(str(module))
+    index.save()
+
+    # Same size, so only modification time tells the change
+    _write(module, "def bar():\n    pass\n", 2_000_000_000)
+
+    index = ModuleIndex(index_path)
+    assert index.names(str(module)) == {"bar"}
+    assert index.modified
+
+
+def test_index_invalidated_by_size(tmp_path, module):
+    index_path = str(tmp_path / "index.json")
+    _write(module, "def foo():\n    pass\n", 1_000_000_000)
+
+    index = ModuleIndex(index_path)
+    index.names(str(module))
+    index.save()
+
+    _write(module, "def foobar():\n    pass\n", 1_000_000_000)
+
+    assert ModuleIndex(index_path).names(str(module)) == {"foobar"}
+
+
+def test_index_drops_removed_files(tmp_path, module):
+    index_path = tmp_path / "index.json"
+    other = tmp_path / "other.py"
+    other.write_text("X = 1\n")
+
+    index = ModuleIndex(str(index_path))
+    index.names(str(module))
+    index.names(str(other))
+    other.unlink()
+    index.save()
+
+    modules = json.loads(index_path.read_text())["modules"]
+    assert list(modules) == [str(module)]
+
+
+def test_broken_index_is_ignored(tmp_path, module):
+    index_path = tmp_path / "index.json"
+    index_path.write_text("{")
+
+    assert ModuleIndex(str(index_path)).names(str(module)) == {"foo"}
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from dpbench.infrastructure import datamodel as dm
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Connection to the new results database."""
+    db_file = str(tmp_path / "results.db")
+    dm.create_results_table(db_file)
+    conn = dm.create_connection(db_file)
+
+    yield conn
+
+    conn.dispose()
+
+
+@pytest.fixture
+def make_result():
+    """Returns function that creates result record with given timings."""
+
+    def make(
+        run_id: int,
+        implementation: str,
+        median: float = 0.0,
+        error_state: str = "Success",
+        benchmark: str = "bench",
+    ) -> dm.Result:
+        return dm.Result(
+            run_id=run_id,
+            benchmark=benchmark,
+            implementation=implementation,
+            platform="",
+            framework_version="",
+            error_state=error_state,
+            problem_preset="S",
+            input_size=0,
+            setup_time=0.0,
+            warmup_time=0.0,
+            repeats="1",
+            min_exec_time=median,
+            max_exec_time=median,
+            median_exec_time=median,
+            quartile25_exec_time=median,
+            quartile75_exec_time=median,
+            teardown_time=0.0,
+            validated="Success",
+        )
+
+    return make
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+
+from dpbench.infrastructure.benchmark_runner import split_cpus
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "sched_getaffinity"),
+    reason="CPU pinning is not supported on this platform",
+)
+
+
+@pytest.fixture
+def eight_cpus(monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)))
+
+
+def test_split_cpus_evenly(eight_cpus):
+    assert split_cpus(3) == [[0, 1], [2, 3], [4, 5]]
+
+
+def test_split_cpus_per_job(eight_cpus):
+    assert split_cpus(2, 3) == [[0, 1, 2], [3, 4, 5]]
+
+
+@pytest.mark.parametrize("jobs, cpus_per_job", [(9, None), (3, 3)])
+def test_split_cpus_not_enough_cpus(eight_cpus, jobs, cpus_per_job):
+    with pytest.raises(ValueError):
+        split_cpus(jobs, cpus_per_job)
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import platform
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from dpbench.infrastructure import datamodel as dm
+
+pytest.importorskip("pyarrow")
+
+from dpbench.infrastructure.columnar import (  # noqa: E402
+    export_results,
+    import_results,
+)
+
+SAMPLES = np.array([1.0, 2.0, 3.0])
+
+
+def _database(tmp_path, name: str):
+    db_file = str(tmp_path / f"{name}.db")
+    dm.create_results_table(db_file)
+
+    return dm.create_connection(db_file)
+
+
+def _store_run(conn, make_result) -> int:
+    run_id = dm.create_run(conn)
+
+    dm.store_results(
+        conn, make_result(run_id, "numpy", median=2.0), SAMPLES.tobytes()
+    )
+    dm.store_results(conn, make_result(run_id, "numba_n", median=1.0))
+    dm.store_postfix(
+        conn,
+        dm.Postfix(run_id=run_id, postfix="numpy", description="", device=""),
+    )
+
+    return run_id
+
+
+def _runs(conn) -> list[tuple]:
+    with Session(conn) as session:
+        return [
+            (run.hostname, run.source_id)
+            for run in session.query(dm.Run).order_by(dm.Run.id)
+        ]
+
+
+def _results(conn) -> set[tuple]:
+    with Session(conn) as session:
+        rows = (
+            session.query(dm.Run, dm.Result, dm.ResultSamples)
+            .join(dm.Result, dm.Result.run_id == dm.Run.id)
+            .outerjoin(
+                dm.ResultSamples, dm.ResultSamples.result_id == dm.Result.id
+            )
+            .all()
+        )
+
+        return {
+            (
+                run.source_id or run.id,
+                result.implementation,
+                result.median_exec_time,
+                samples.samples if samples else None,
+            )
+            for run, result, samples in rows
+        }
+
+
+def _add_run(conn, hostname: str) -> int:
+    """Adds run without results, e.g. run of the older version without
+    recorded host.
+    """
+    with Session(conn) as session:
+        run = dm.Run(hostname=hostname)
+        session.add(run)
+        session.commit()
+
+        return run.id
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_round_trip(tmp_path, make_result, format):
+    source = _database(tmp_path, "source")
+    first = _store_run(source, make_result)
+    second = _store_run(source, make_result)
+    legacy = _add_run(source, None)
+    dataset = str(tmp_path / "dataset")
+
+    assert export_results(source, dataset, format, hostname="legacy") == 3
+    # Exported runs are skipped
+    assert export_results(source, dataset, format, hostname="legacy") == 0
+
+    target = _database(tmp_path, "target")
+    # Shifts ids of the imported runs
+    _add_run(target, "target")
+
+    assert import_results(target, dataset) == 3
+    # Imported runs are skipped
+    assert import_results(target, dataset) == 0
+
+    assert _runs(target) == [
+        ("target", None),
+        (platform.node(), first),
+        (platform.node(), second),
+        ("legacy", legacy),
+    ]
+    assert _results(target) == _results(source)
+
+    with Session(target) as session:
+        assert session.query(dm.Postfix).count() == 2
+
+
+def test_reexport_keeps_origin(tmp_path, make_result):
+    source = _database(tmp_path, "source")
+    run_id = _store_run(source, make_result)
+    export_results(source, str(tmp_path / "a"))
+
+    middle = _database(tmp_path, "middle")
+    _add_run(middle, "middle")
+    import_results(middle, str(tmp_path / "a"))
+
+    # Imported runs are exported with their origin host and id
+    assert export_results(middle, str(tmp_path / "b")) == 2
+
+    target = _database(tmp_path, "target")
+    assert import_results(target, str(tmp_path / "b")) == 2
+
+    assert sorted(_runs(target)) == sorted(
+        [("middle", 1), (platform.node(), run_id)]
+    )
+    assert _results(target) == _results(source)
+
+
+def test_runs_without_samples(tmp_path, make_result):
+    source = _database(tmp_path, "source")
+    run_id = dm.create_run(source)
+    dm.store_results(source, make_result(run_id, "numpy"))
+    _add_run(source, None)
+
+    assert export_results(source, str(tmp_path / "dataset")) == 2
+
+    target = _database(tmp_path, "target")
+    assert import_results(target, str(tmp_path / "dataset")) == 2
+    assert _results(target) == _results(source)
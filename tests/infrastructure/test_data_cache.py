@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+from dpbench.infrastructure import data_cache
+from dpbench.infrastructure.data_cache import DataCache, source_fingerprint
+
+
+def _store(cache: DataCache, key: str, last_used: float):
+    assert cache.store("inputs", key, {"x": np.zeros(128)}, benchmark=key)
+    entry_path = os.path.join(cache.path, "inputs", key)
+    os.utime(entry_path, (last_used, last_used))
+
+
+def test_store_and_load(tmp_path):
+    cache = DataCache(str(tmp_path))
+    x = np.arange(10.0)
+
+    assert cache.store("inputs", "key", {"x": x, "n": np.int64(10), "k": 3})
+
+    data = cache.load("inputs", "key")
+    np.testing.assert_array_equal(data["x"], x)
+    assert not data["x"].flags.writeable
+    assert data["n"] == 10 and isinstance(data["n"], np.int64)
+    assert data["k"] == 3 and isinstance(data["k"], int)
+
+
+def test_store_and_load_compressed(tmp_path):
+    cache = DataCache(str(tmp_path))
+    pair = (np.arange(3), np.arange(4))
+
+    assert cache.store("references", "key", {"pair": pair}, compressed=True)
+
+    data = cache.load("references", "key")
+    np.testing.assert_array_equal(data["pair"][0], pair[0])
+    np.testing.assert_array_equal(data["pair"][1], pair[1])
+
+
+def test_load_missing(tmp_path):
+    assert DataCache(str(tmp_path)).load("inputs", "key") is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = DataCache(str(tmp_path))
+
+    _store(cache, "a", 1000)
+    _store(cache, "b", 2000)
+    entry_size = max(entry.size for entry in cache.entries())
+
+    # Loading updates access time, so b becomes the least recently used.
+    cache.load("inputs", "a")
+    cache.max_size = 2 * entry_size
+    _store(cache, "c", 3000)
+
+    assert {entry.key for entry in cache.entries()} == {"a", "c"}
+
+
+def test_clear_benchmarks(tmp_path):
+    cache = DataCache(str(tmp_path))
+    _store(cache, "a", 1000)
+    _store(cache, "b", 2000)
+
+    assert cache.clear({"a"}) == 1
+    assert [entry.key for entry in cache.entries()] == ["b"]
+
+
+def test_key_depends_on_parameters():
+    assert DataCache.key(n=1, seed=0) == DataCache.key(seed=0, n=1)
+    assert DataCache.key(n=1, seed=0) != DataCache.key(n=1, seed=1)
+
+
+@pytest.fixture
+def helper_package(tmp_path, monkeypatch):
+    package = tmp_path / "fingerprinted"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helper.py").write_text("SCALE = 2\n")
+    (package / "init.py").write_text(
+        textwrap.dedent(
+            """
+            def initialize(n):
+                import numpy as np
+
+                from .helper import SCALE
+
+                return np.arange(n) * SCALE
+            """
+        )
+    )
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(data_cache, "_SOURCE_PACKAGE", "fingerprinted")
+
+    yield package
+
+    # Modules get imported while looking up their submodules.
+    for name in list(sys.modules):
+        if name.split(".")[0] == "fingerprinted":
+            del sys.modules[name]
+
+
+def test_fingerprint_covers_helpers_and_versions(helper_package):
+    fingerprint = source_fingerprint("fingerprinted.init")
+
+    assert set(fingerprint["sources"]) == {
+        "fingerprinted.init",
+        "fingerprinted.helper",
+    }
+    assert fingerprint["versions"]["numpy"] == np.__version__
+
+
+def test_fingerprint_changes_with_helper(helper_package):
+    before = source_fingerprint("fingerprinted.init")
+    (helper_package / "helper.py").write_text("SCALE = 3\n")
+
+    assert source_fingerprint("fingerprinted.init") != before
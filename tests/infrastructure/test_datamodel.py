@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+from dpbench.infrastructure import datamodel as dm
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Sizes of the batches committed by the writer."""
+    batches = []
+    store_batch = dm._store_batch
+
+    def record_batch(conn, batch):
+        batches.append(len(batch))
+        store_batch(conn, batch)
+
+    monkeypatch.setattr(dm, "_store_batch", record_batch)
+
+    return batches
+
+
+def _stored(conn) -> list[tuple[str, str]]:
+    with Session(conn) as session:
+        return [
+            (result.benchmark, result.implementation)
+            for result in session.query(dm.Result).order_by(dm.Result.id)
+        ]
+
+
+def test_batches_results_by_benchmark(conn, make_result, batches):
+    run_id = dm.create_run(conn)
+    writer = dm.ResultsWriter(conn)
+
+    writer.store_results(make_result(run_id, "numpy", benchmark="a"))
+    writer.store_results(make_result(run_id, "numba_n", benchmark="a"))
+    writer.store_results(make_result(run_id, "numpy", benchmark="b"))
+    writer.flush()
+
+    assert batches == [2, 1]
+    assert _stored(conn) == [("a", "numpy"), ("a", "numba_n"), ("b", "numpy")]
+
+    writer.close()
+
+
+def test_commits_after_max_delay(conn, make_result, batches):
+    run_id = dm.create_run(conn)
+    writer = dm.ResultsWriter(conn, max_delay=0.01)
+
+    writer.store_results(make_result(run_id, "numpy"))
+
+    deadline = time.monotonic() + 10
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert batches == [1]
+
+    writer.close()
+
+
+def test_close_commits_pending(conn, make_result):
+    run_id = dm.create_run(conn)
+    writer = dm.ResultsWriter(conn)
+
+    writer.store_results(make_result(run_id, "numpy"), samples=b"\0" * 8)
+    writer.close()
+
+    assert _stored(conn) == [("bench", "numpy")]
+    with Session(conn) as session:
+        assert session.query(dm.ResultSamples).one().samples == b"\0" * 8
+
+
+def test_falls_back_to_single_records(conn, make_result, batches):
+    run_id = dm.create_run(conn)
+    writer = dm.ResultsWriter(conn)
+
+    writer.store_results(make_result(run_id, "numpy"))
+    # Violates unique constraint of the run results
+    writer.store_results(make_result(run_id, "numpy"))
+    writer.store_results(make_result(run_id, "numba_n"))
+    writer.close()
+
+    assert batches == [3, 1, 1, 1]
+    assert _stored(conn) == [("bench", "numpy"), ("bench", "numba_n")]
+
+
+def test_skips_existing_postfixes(conn):
+    run_id = dm.create_run(conn)
+    writer = dm.ResultsWriter(conn)
+
+    for _ in range(2):
+        writer.store_postfix(
+            dm.Postfix(
+                run_id=run_id, postfix="numpy", description="", device="cpu"
+            )
+        )
+        writer.flush()
+
+    writer.close()
+
+    with Session(conn) as session:
+        assert session.query(dm.Postfix).count() == 1
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+
+import dpbench.infrastructure as dpbi
+from dpbench.infrastructure import datamodel
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    return str(tmp_path / "results.db")
+
+
+@pytest.fixture
+def alembic_cfg(db_file):
+    path = os.path.join(
+        os.path.dirname(datamodel.__file__), "../migrations/alembic.ini"
+    )
+    cfg = Config(path)
+    cfg.set_main_option("sqlalchemy.url", "sqlite:///" + db_file)
+
+    return cfg
+
+
+def _revisions(alembic_cfg) -> list[str]:
+    """Returns revisions from the first one to the head."""
+    script = ScriptDirectory.from_config(alembic_cfg)
+
+    return [rev.revision for rev in script.walk_revisions()][::-1]
+
+
+def test_head_matches_models(db_file):
+    dpbi.create_results_table(db_file)
+
+    engine = create_engine("sqlite:///" + db_file)
+    with engine.connect() as conn:
+        # SQLite reflects floating point columns as FLOAT regardless of
+        # precision, so only tables, columns and constraints are compared.
+        context = MigrationContext.configure(conn, opts={"compare_type": False})
+        diff = compare_metadata(context, dpbi.Base.metadata)
+    engine.dispose()
+
+    assert diff == []
+
+
+def test_upgrade_downgrade_chain(db_file, alembic_cfg):
+    revisions = _revisions(alembic_cfg)
+    schemas = []
+
+    for revision in revisions:
+        command.upgrade(alembic_cfg, revision)
+        schemas.append(_schema(db_file))
+
+    # Every downgrade restores the schema of the previous revision.
+    for revision, schema in zip(revisions[-2::-1], schemas[-2::-1]):
+        command.downgrade(alembic_cfg, revision)
+        assert _schema(db_file) == schema
+
+    command.downgrade(alembic_cfg, "base")
+    assert set(_schema(db_file)) <= {"alembic_version"}
+
+
+def _schema(db_file: str) -> dict[str, set[str]]:
+    engine = create_engine("sqlite:///" + db_file)
+    inspector = inspect(engine)
+    schema = {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in inspector.get_table_names()
+    }
+    engine.dispose()
+
+    return schema
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import platform
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from dpbench.infrastructure import datamodel as dm
+from dpbench.infrastructure.reporter import (
+    _read_calibration,
+    generate_regression_report,
+)
+
+
+@pytest.fixture
+def store(conn, make_result):
+    def store(run_id, implementation, samples, error_state="Success"):
+        samples = np.asarray(samples, dtype="<f8")
+        median = float(np.median(samples)) if samples.size else 0.0
+
+        result = make_result(run_id, implementation, median, error_state)
+        dm.store_results(conn, result, samples.tobytes())
+
+    return store
+
+
+def test_regression_report(conn, store):
+    rng = np.random.default_rng(0)
+    baseline = dm.create_run(conn)
+    candidate = dm.create_run(conn)
+
+    for run_id, scale in [(baseline, 1.0), (candidate, 1.0)]:
+        store(run_id, "same", rng.normal(1.0, 0.01, 20) * scale)
+    for run_id, scale in [(baseline, 1.0), (candidate, 1.5)]:
+        store(run_id, "slower", rng.normal(1.0, 0.01, 20) * scale)
+    for run_id, scale in [(baseline, 1.0), (candidate, 0.5)]:
+        store(run_id, "faster", rng.normal(1.0, 0.01, 20) * scale)
+
+    store(baseline, "failed", rng.normal(1.0, 0.01, 20))
+    store(candidate, "failed", [], error_state="Failed Execution")
+
+    store(baseline, "fixed", [], error_state="Failed Execution")
+    store(candidate, "fixed", rng.normal(1.0, 0.01, 20))
+
+    regressions = generate_regression_report(conn, baseline, candidate)
+
+    assert sorted(regressions) == [
+        ("bench", "failed", "S"),
+        ("bench", "slower", "S"),
+    ]
+
+
+def test_regression_report_threshold(conn, store):
+    rng = np.random.default_rng(0)
+    baseline = dm.create_run(conn)
+    candidate = dm.create_run(conn)
+
+    store(baseline, "slower", rng.normal(1.0, 0.01, 20))
+    store(candidate, "slower", rng.normal(1.0, 0.01, 20) * 1.1)
+
+    assert (
+        generate_regression_report(conn, baseline, candidate, threshold=0.2)
+        == []
+    )
+    assert len(generate_regression_report(conn, baseline, candidate)) == 1
+
+
+def test_read_calibration_of_run_host(conn):
+    with Session(conn) as session:
+        session.add_all(
+            [
+                dm.Calibration(
+                    hostname=platform.node(),
+                    stream_bandwidth=1.0,
+                    peak_flops=1.0,
+                ),
+                dm.Calibration(
+                    hostname="remote", stream_bandwidth=2.0, peak_flops=2.0
+                ),
+            ]
+        )
+        legacy = dm.Run()
+        imported = dm.Run(hostname="remote")
+        session.add_all([legacy, imported])
+        session.commit()
+
+        legacy_id, imported_id = legacy.id, imported.id
+
+    assert _read_calibration(conn, imported_id).hostname == "remote"
+    assert _read_calibration(conn, legacy_id).hostname == platform.node()
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from dpbench.infrastructure.statistics import (
+    bootstrap_median_ci,
+    describe,
+    mann_whitney_greater,
+    relative_ci_halfwidth,
+    unpack_samples,
+)
+
+
+def test_median_ci_contains_median():
+    samples = np.random.default_rng(0).normal(10.0, 1.0, size=100)
+
+    low, high = bootstrap_median_ci(samples)
+
+    assert low < np.median(samples) < high
+    assert high - low < 1.0
+
+
+def test_median_ci_is_reproducible():
+    samples = np.random.default_rng(0).normal(10.0, 1.0, size=20)
+
+    assert bootstrap_median_ci(samples) == bootstrap_median_ci(samples)
+
+
+def test_median_ci_narrows_with_confidence():
+    samples = np.random.default_rng(0).normal(10.0, 1.0, size=50)
+
+    low95, high95 = bootstrap_median_ci(samples, confidence=0.95)
+    low50, high50 = bootstrap_median_ci(samples, confidence=0.5)
+
+    assert low95 <= low50 <= high50 <= high95
+
+
+@pytest.mark.parametrize(
+    "samples, expected",
+    [
+        ([], (0.0, 0.0)),
+        ([3.0], (3.0, 3.0)),
+        ([2.0, 2.0, 2.0], (2.0, 2.0)),
+    ],
+)
+def test_median_ci_degenerate(samples, expected):
+    assert bootstrap_median_ci(samples) == expected
+
+
+def test_relative_ci_halfwidth():
+    assert relative_ci_halfwidth([9.0, 10.0, 11.0], 9.5, 10.5) == 0.05
+    assert relative_ci_halfwidth([0.0, 0.0], 0.0, 0.0) == 0.0
+
+
+def test_unpack_samples():
+    samples = np.array([1.0, 2.5, 4.0])
+
+    np.testing.assert_array_equal(
+        unpack_samples(samples.astype("<f8").tobytes()), samples
+    )
+
+
+def test_describe():
+    stats = describe([1.0, 2.0, 3.0, 4.0, 100.0])
+
+    assert stats["mean"] == 22.0
+    assert stats["mad"] == 1.0
+    assert 4.0 < stats["p95"] <= stats["p99"] <= 100.0
+    assert describe([]) == dict.fromkeys(stats, 0.0)
+
+
+def test_mann_whitney_greater():
+    rng = np.random.default_rng(0)
+    baseline = rng.normal(1.0, 0.01, size=20)
+
+    assert mann_whitney_greater(baseline, baseline * 1.1) < 0.01
+    assert mann_whitney_greater(baseline, baseline * 0.9) > 0.99